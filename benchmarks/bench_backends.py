@@ -0,0 +1,75 @@
+"""
+띄어쓰기 백엔드 비교: 제공 예제 정확도/F1 과 합성 말뭉치 처리량 (chars/s)
+
+설치된 백엔드(pykospacing, kospacing, kiwi)만 측정하며, 'none' 은 모델 없이 규칙만 적용한 기준선이다.
+실행: python benchmarks/bench_backends.py [--size N]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.spacing_corrector import SpacingCorrector
+from utils.metrics import calculate_metrics
+from synthetic_corpus import generate_corpus
+
+
+BACKENDS = {
+    'none': {'use_pykospacing': False},
+    'pykospacing': {'use_pykospacing': True},
+    'kospacing': {'use_pykospacing': False, 'use_kospacing': True},
+    'kiwi': {'use_pykospacing': False, 'use_kiwi': True},
+}
+
+
+def load_examples():
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        examples = json.load(f)
+    return [ex['input'] for ex in examples], [ex['expected_output'] for ex in examples]
+
+
+def as_text(value) -> str:
+    return ' '.join(value) if isinstance(value, list) else value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=200, help="처리량 측정용 합성 문장 수")
+    args = parser.parse_args()
+    
+    inputs, expected = load_examples()
+    references = [as_text(ex) for ex in expected]
+    corpus = [record['input'] for record in generate_corpus(args.size, seed=0)]
+    chars = sum(len(text) for text in corpus)
+    
+    print(f"{'백엔드':<12} {'로드 s':>7} {'모델 F1':>8} {'전체 정확도':>10} {'전체 F1':>8} {'chars/s':>12}")
+    for name, options in BACKENDS.items():
+        corrector = SpacingCorrector(**options)
+        start = time.perf_counter()
+        models = corrector.warmup()
+        load_time = time.perf_counter() - start
+        if name != 'none' and name not in models:
+            print(f"{name:<12} (설치되지 않음)")
+            continue
+        
+        model_outputs = corrector.model.correct_batch([as_text(x) for x in inputs])
+        model_metrics = calculate_metrics(model_outputs, references)
+        pipeline_metrics = calculate_metrics([as_text(x) for x in corrector.batch_correct(inputs)], references)
+        
+        start = time.perf_counter()
+        corrector.batch_correct(corpus)
+        throughput = chars / (time.perf_counter() - start)
+        
+        print(
+            f"{name:<12} {load_time:>7.2f} {model_metrics.char_f1:>8.1%} "
+            f"{pipeline_metrics.accuracy:>10.1%} {pipeline_metrics.char_f1:>8.1%} {throughput:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
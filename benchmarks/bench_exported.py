@@ -0,0 +1,79 @@
+"""
+내보낸 PyKoSpacing 백엔드 비교: 원본(TensorFlow) 래퍼 대비 출력 일치율과 지연 시간
+
+모델 파일은 src/models/export.py 로 먼저 만든다.
+실행: python benchmarks/bench_exported.py data/models/pykospacing.tflite [data/models/pykospacing.onnx ...]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from models.export import check_parity
+from models.exported_model import ExportedSpacingModel
+from models.pykospacing_model import PyKoSpacingModel
+from synthetic_corpus import generate_corpus
+from bench_backends import as_text, load_examples
+
+
+def measure(model, corpus, single: int):
+    """(로드 s, 문장당 지연 p50 ms, p95 ms, 배치 chars/s)"""
+    start = time.perf_counter()
+    model.warmup()
+    load_time = time.perf_counter() - start
+    
+    latencies = []
+    for text in corpus[:single]:
+        start = time.perf_counter()
+        model.correct_batch([text])
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    
+    chars = sum(len(text) for text in corpus)
+    start = time.perf_counter()
+    model.correct_batch(corpus)
+    throughput = chars / (time.perf_counter() - start)
+    
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    return load_time, statistics.median(latencies), p95, throughput
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('models', nargs='+', help="내보낸 모델 경로 (.tflite / .onnx)")
+    parser.add_argument('--size', type=int, default=200, help="처리량 측정용 합성 문장 수")
+    parser.add_argument('--single', type=int, default=50, help="단건 지연 측정 문장 수")
+    args = parser.parse_args()
+    
+    inputs, _ = load_examples()
+    examples = [as_text(x) for x in inputs]
+    corpus = [record['input'] for record in generate_corpus(args.size, seed=0)]
+    
+    reference = PyKoSpacingModel()
+    if not reference.is_installed():
+        print("pykospacing 이 설치되지 않아 비교할 수 없습니다")
+        sys.exit(1)
+    
+    print(f"{'백엔드':<32} {'로드 s':>7} {'p50 ms':>8} {'p95 ms':>8} {'chars/s':>12} {'일치율':>7} {'경계 F1':>8}")
+    load_time, p50, p95, throughput = measure(reference, corpus, args.single)
+    print(f"{'pykospacing (tensorflow)':<32} {load_time:>7.2f} {p50:>8.1f} {p95:>8.1f} {throughput:>12,.0f} {'-':>7} {'-':>8}")
+    
+    for path in args.models:
+        model = ExportedSpacingModel(path)
+        if not model.is_installed():
+            print(f"{Path(path).name:<32} (모델 파일 또는 런타임 없음)")
+            continue
+        load_time, p50, p95, throughput = measure(model, corpus, args.single)
+        parity = check_parity(examples + corpus, reference, model)
+        print(
+            f"{Path(path).name:<32} {load_time:>7.2f} {p50:>8.1f} {p95:>8.1f} {throughput:>12,.0f} "
+            f"{parity['agreement']:>7.1%} {parity['boundary_f1']:>8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+규칙 단계 벤치마크: 순차 re.sub 적용 vs 사전 컴파일 규칙 엔진
+
+실행: python benchmarks/bench_rule_engine.py [--repeat N]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.postprocessor import Postprocessor
+from rules.number_rules import NumberRules
+from rules.legal_rules import LegalRules
+from rules.pattern_rules import PatternRules
+
+
+def load_sentences():
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        examples = json.load(f)
+    return [' '.join(ex['input']) if isinstance(ex['input'], list) else ex['input'] for ex in examples]
+
+
+def sequential_rules(postprocessor: Postprocessor, text: str) -> str:
+    """엔진 도입 전 규칙 적용 순서"""
+    compound_rules = postprocessor.compound_rules
+    text = NumberRules.apply_all(text)
+    text = LegalRules.apply_all(text)
+    text = compound_rules.fix_compound_nouns(text)
+    text = compound_rules.fix_split_words(text)
+    text = compound_rules.fix_financial_terms(text)
+    text = PatternRules.apply_all(text)
+    return PatternRules.fine_tune(text)
+
+
+def engine_rules(postprocessor: Postprocessor, text: str) -> str:
+    return postprocessor.finish_string(text)
+
+
+def measure(func, postprocessor, sentences, repeat: int) -> float:
+    """문장당 평균 소요 시간 (마이크로초)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for sentence in sentences:
+            func(postprocessor, sentence)
+    return (time.perf_counter() - start) / (repeat * len(sentences)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=2000)
+    args = parser.parse_args()
+    
+    postprocessor = Postprocessor()
+    sentences = load_sentences()
+    
+    for sentence in sentences:
+        assert sequential_rules(postprocessor, sentence) == engine_rules(postprocessor, sentence)
+    
+    sequential = measure(sequential_rules, postprocessor, sentences, args.repeat)
+    engine = measure(engine_rules, postprocessor, sentences, args.repeat)
+    
+    print(f"문장 수: {len(sentences)}, 반복: {args.repeat}")
+    print(f"규칙 스캔 수: {postprocessor.rule_engine.rule_count()}")
+    print(f"순차 re.sub:  {sequential:8.1f} µs/문장")
+    print(f"규칙 엔진:    {engine:8.1f} µs/문장 ({sequential / engine:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
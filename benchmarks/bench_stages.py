@@ -0,0 +1,187 @@
+"""
+단계별 벤치마크: 전처리, 모델, 규칙 단계별, 출력 변환의 처리량 (chars/s) 및 p50/p95/p99 지연
+
+실행:
+    python benchmarks/bench_stages.py                     # 측정 결과 출력
+    python benchmarks/bench_stages.py --save-baseline     # 기준값 저장
+    python benchmarks/bench_stages.py --check             # 기준값 대비 느려진 단계가 있으면 실패 (종료 코드 1)
+
+기준값에는 측정 환경 (Python / numpy 버전, 사용 가능한 모델) 을 함께 기록한다.
+모델이 하나도 없으면 'model' 단계는 측정하지 않으며, --check 는 환경이 다르면 비교를 건너뛴다
+(모델 구성만 다르면 모델 단계만 제외하고 비교).
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+from core.preprocessor import Preprocessor
+from core.postprocessor import Postprocessor
+from models.ensemble import EnsembleModel
+from synthetic_corpus import DEFAULT_LENGTHS, generate_corpus
+
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "stages.json"
+
+# 설치된 모델에 따라 측정 대상 자체가 달라지는 단계
+MODEL_STAGES = ('model',)
+
+
+def environment(models: Sequence[str]) -> Dict[str, object]:
+    """측정 환경 (Python major.minor, numpy 버전, 사용 가능한 모델)"""
+    return {
+        'python': '.'.join(platform.python_version_tuple()[:2]),
+        'numpy': np.__version__,
+        'models': sorted(models),
+    }
+
+
+def build_stages(postprocessor: Postprocessor, model: EnsembleModel) -> Dict[str, Callable[[str], object]]:
+    """파이프라인 순서대로 단계 이름 -> 단일 입력 함수 (사용 가능한 모델이 없으면 모델 단계 제외)"""
+    engine = postprocessor.rule_engine
+    preprocessor = Preprocessor()
+    stages = {
+        'preprocess': preprocessor.preprocess,
+        'model': model.correct,
+        'rules.number': lambda text: engine.apply('number', text),
+        'rules.legal': lambda text: engine.apply('legal', text),
+        'rules.compound': postprocessor.compound_rules.fix_compound_nouns,
+        'rules.split': lambda text: engine.apply('split', text),
+        'rules.financial': lambda text: engine.apply('financial', text),
+        'rules.pattern': lambda text: engine.apply('pattern', text),
+        'rules.fine_tune': postprocessor.fine_tune_spacing,
+        'output': lambda text: postprocessor.convert_to_output_format(text, 'list', {}),
+    }
+    if not model.get_available_models():
+        for name in MODEL_STAGES:
+            del stages[name]
+    return stages
+
+
+def time_stage(func: Callable[[str], object], texts: Sequence[str], repeat: int) -> Dict[str, float]:
+    """입력별 최소 소요 시간으로 지연 분포와 처리량 계산 (첫 회는 워밍업)"""
+    for text in texts:
+        func(text)
+    
+    latencies = np.full(len(texts), np.inf)
+    for _ in range(repeat):
+        for i, text in enumerate(texts):
+            start = time.perf_counter()
+            func(text)
+            latencies[i] = min(latencies[i], time.perf_counter() - start)
+    
+    chars = sum(len(text) for text in texts)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1e6
+    return {
+        'chars_per_sec': chars / latencies.sum(),
+        'p50_us': float(p50),
+        'p95_us': float(p95),
+        'p99_us': float(p99),
+    }
+
+
+def run(size: int, lengths: Sequence[int], repeat: int, seed: int) -> Tuple[Dict[str, Dict[str, Dict[str, float]]], List[str]]:
+    """({길이: {단계: 측정값}}, 사용 가능한 모델 목록)"""
+    postprocessor = Postprocessor()
+    model = EnsembleModel()
+    models = model.warmup()
+    stages = build_stages(postprocessor, model)
+    
+    records = list(generate_corpus(size * len(lengths), lengths, seed=seed))
+    results = {}
+    for length in lengths:
+        texts = [record['input'] for record in records if record['length'] == length]
+        results[str(length)] = {name: time_stage(func, texts, repeat) for name, func in stages.items()}
+    return results, models
+
+
+def comparable_stages(current: dict, baseline: dict) -> Optional[Callable[[str], bool]]:
+    """환경이 같으면 비교할 단계 판별 함수, Python / numpy 버전이 다르면 None
+    
+    모델 구성만 다르면 모델 단계를 제외하고 비교한다. 환경이 기록되지 않은 기준값은 비교하지 않는다.
+    """
+    recorded = baseline.get('environment')
+    if recorded is None or any(recorded.get(key) != current[key] for key in ('python', 'numpy')):
+        return None
+    if recorded.get('models') != current['models']:
+        return lambda name: name not in MODEL_STAGES
+    return lambda name: True
+
+
+def compare(results: dict, baseline: dict, tolerance: float, include: Callable[[str], bool] = lambda name: True) -> List[str]:
+    """기준값보다 처리량이 tolerance 이상 떨어진 (길이, 단계) 목록"""
+    regressions = []
+    for length, stages in baseline.get('results', {}).items():
+        for name, expected in stages.items():
+            measured = results.get(length, {}).get(name)
+            if measured is None or not include(name):
+                continue
+            ratio = measured['chars_per_sec'] / expected['chars_per_sec']
+            if ratio < 1 - tolerance:
+                regressions.append(
+                    f"{name} @ {length}자: {measured['chars_per_sec']:,.0f} chars/s "
+                    f"(기준 {expected['chars_per_sec']:,.0f}, {ratio:.0%})"
+                )
+    return regressions
+
+
+def print_results(results: dict) -> None:
+    print(f"{'길이':>6} {'단계':<18} {'chars/s':>14} {'p50 µs':>10} {'p95 µs':>10} {'p99 µs':>10}")
+    for length, stages in results.items():
+        for name, m in stages.items():
+            print(
+                f"{length:>6} {name:<18} {m['chars_per_sec']:>14,.0f} "
+                f"{m['p50_us']:>10.1f} {m['p95_us']:>10.1f} {m['p99_us']:>10.1f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=50, help="길이 구간별 문장 수")
+    parser.add_argument('--lengths', type=int, nargs='+', default=list(DEFAULT_LENGTHS))
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--check', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.3, help="허용 처리량 감소 비율")
+    args = parser.parse_args()
+    
+    results, models = run(args.size, args.lengths, args.repeat, args.seed)
+    current = environment(models)
+    print_results(results)
+    
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'size': args.size, 'repeat': args.repeat, 'seed': args.seed, 'environment': current,
+                       'results': results}, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+    
+    if args.check:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        include = comparable_stages(current, baseline)
+        if include is None:
+            print(f"\n측정 환경이 기준값과 달라 비교를 건너뜀 (현재 {current}, 기준 {baseline.get('environment')})")
+            return
+        if baseline['environment']['models'] != current['models']:
+            print(f"\n모델 구성이 기준값과 달라 모델 단계는 비교하지 않음 (현재 {current['models']}, 기준 {baseline['environment']['models']})")
+        regressions = compare(results, baseline, args.tolerance, include)
+        if regressions:
+            print("\n성능 저하:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\n기준값 대비 성능 저하 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+콜드 스타트 벤치마크: 모듈 import, SpacingCorrector 생성, 첫 교정, warmup 소요 시간
+
+각 측정은 새 파이썬 프로세스에서 실행한다.
+실행: python benchmarks/bench_startup.py
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+PROBE = '''
+import json, sys, time
+sys.path.insert(0, {src!r})
+t0 = time.perf_counter()
+from core.spacing_corrector import SpacingCorrector, correct_spacing
+t1 = time.perf_counter()
+corrector = SpacingCorrector()
+t2 = time.perf_counter()
+corrector.correct("법 령 및 규정이 변경되는 경우")
+t3 = time.perf_counter()
+models = corrector.warmup()
+t4 = time.perf_counter()
+correct_spacing("투 자신탁으로")
+correct_spacing("투 자신탁으로")
+t5 = time.perf_counter()
+print(json.dumps({{
+    "import": t1 - t0, "construct": t2 - t1, "first_correct": t3 - t2,
+    "warmup": t4 - t3, "correct_spacing_x2": t5 - t4,
+    "tensorflow_loaded": "tensorflow" in sys.modules, "models": models,
+}}))
+'''
+
+
+def main():
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(src=str(SRC_DIR))],
+        capture_output=True, text=True, check=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    
+    print(f"사용 가능한 모델: {result['models']}")
+    print(f"TensorFlow 로드 여부: {result['tensorflow_loaded']}")
+    for stage in ('import', 'construct', 'first_correct', 'warmup', 'correct_spacing_x2'):
+        print(f"{stage:20s} {result[stage] * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+합성 말뭉치 생성기: 예제 정답 문장과 사전 용어를 이어 붙이고 띄어쓰기를 무작위로 훼손
+
+실행: python benchmarks/synthetic_corpus.py --size 10000 --out corpus.jsonl
+"""
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Iterator, List, Sequence
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.dictionary_loader import DictionaryLoader
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+DEFAULT_LENGTHS = (32, 128, 512, 2048)
+
+TERM_TEMPLATES = [
+    '{}에 관한 사항',
+    '{}의 변경',
+    '{}을 고려하여 결정합니다.',
+    '{} 및 관련 규정',
+]
+
+
+def load_seed_sentences(dict_dir: str = None) -> List[str]:
+    """예제 정답 문장과 사전 용어 문장"""
+    with open(DATA_DIR / "examples" / "provided_examples.json", 'r', encoding='utf-8') as f:
+        examples = json.load(f)
+    
+    sentences = [
+        ' '.join(ex['expected_output']) if isinstance(ex['expected_output'], list) else ex['expected_output']
+        for ex in examples
+    ]
+    
+    loader = DictionaryLoader(dict_dir)
+    loader.load_all()
+    terms = sorted(loader.compound_nouns | loader.financial_terms | loader.legal_terms)
+    for i, term in enumerate(terms):
+        sentences.append(TERM_TEMPLATES[i % len(TERM_TEMPLATES)].format(term))
+    
+    return sentences
+
+
+def add_noise(text: str, rng: random.Random, delete_rate: float = 0.3, insert_rate: float = 0.1) -> str:
+    """공백 삭제 (delete_rate) 및 문자 사이 공백 삽입 (insert_rate)"""
+    result = []
+    for i, ch in enumerate(text):
+        if ch == ' ':
+            if rng.random() >= delete_rate:
+                result.append(ch)
+            continue
+        result.append(ch)
+        if i + 1 < len(text) and text[i + 1] != ' ' and rng.random() < insert_rate:
+            result.append(' ')
+    return ''.join(result)
+
+
+def make_reference(seeds: Sequence[str], length: int, rng: random.Random) -> str:
+    """seed 문장을 이어 붙여 대략 length 글자의 정답 문장 생성"""
+    parts = []
+    total = 0
+    while total < length:
+        sentence = rng.choice(seeds)
+        parts.append(sentence)
+        total += len(sentence) + 1
+    return ' '.join(parts)[:length].rstrip()
+
+
+def generate_corpus(
+    size: int,
+    lengths: Sequence[int] = DEFAULT_LENGTHS,
+    seed: int = 0,
+    delete_rate: float = 0.3,
+    insert_rate: float = 0.1
+) -> Iterator[dict]:
+    """{'length', 'input', 'reference'} 레코드를 size 개 생성 (길이 구간을 번갈아 사용)"""
+    rng = random.Random(seed)
+    seeds = load_seed_sentences()
+    
+    for i in range(size):
+        length = lengths[i % len(lengths)]
+        reference = make_reference(seeds, length, rng)
+        yield {
+            'length': length,
+            'input': add_noise(reference, rng, delete_rate, insert_rate),
+            'reference': reference,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--lengths', type=int, nargs='+', default=list(DEFAULT_LENGTHS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--delete-rate', type=float, default=0.3)
+    parser.add_argument('--insert-rate', type=float, default=0.1)
+    parser.add_argument('--out', type=str, default=None, help="출력 JSONL 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+    
+    out = open(args.out, 'w', encoding='utf-8') if args.out else sys.stdout
+    try:
+        for record in generate_corpus(args.size, args.lengths, args.seed, args.delete_rate, args.insert_rate):
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+    finally:
+        if args.out:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
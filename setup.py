@@ -13,6 +13,8 @@ setup(
         "numpy>=1.24.0",
         "pandas>=2.0.0",
         "tqdm>=4.65.0",
+        "click>=8.1.0",
+        "beautifulsoup4>=4.12.0",
         "loguru>=0.7.0",
         "pydantic>=2.0.0",
         "regex",
@@ -25,6 +27,14 @@ setup(
             "flake8>=6.0.0",
             "mypy>=1.5.0",
         ],
+        "export": [
+            "tensorflow>=2.13.0",
+            "tf2onnx>=1.16.0",
+        ],
+        "lite": [
+            "tflite-runtime>=2.13.0",
+            "onnxruntime>=1.16.0",
+        ],
         "notebook": [
             "jupyter>=1.0.0",
             "matplotlib>=3.7.0",
@@ -33,6 +43,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
+            "korean-spacing=core.cli:main",
             "spacing-correct=core.cli:main",
         ],
     },
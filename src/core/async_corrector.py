@@ -0,0 +1,125 @@
+"""
+asyncio 서빙용 교정기 - 동시 요청을 마이크로 배치로 묶어 처리
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple, Union
+from core.spacing_corrector import CorrectionResult, SpacingCorrector
+
+
+class AsyncSpacingCorrector:
+    """동적 마이크로 배칭 비동기 교정기
+    
+    요청은 큐에 쌓이고, max_batch_size 개가 모이거나 첫 요청 이후 max_wait_ms 가 지나면
+    하나의 batch_correct_detailed 호출로 묶여 이벤트 루프 밖의 스레드에서 실행된다.
+    """
+    
+    def __init__(
+        self,
+        corrector: SpacingCorrector = None,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        **kwargs
+    ):
+        if max_batch_size <= 0 or max_wait_ms < 0:
+            raise ValueError("max_batch_size 는 양수, max_wait_ms 는 0 이상이어야 합니다")
+        self.corrector = corrector or SpacingCorrector(**kwargs)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batch_count = 0
+        self.request_count = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='spacing-batch')
+    
+    @property
+    def queue_depth(self) -> int:
+        """배치 대기 중인 요청 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    async def correct(self, input_data: Union[str, List[str]]) -> Union[str, List[str]]:
+        """띄어쓰기 교정 (마이크로 배치로 처리)"""
+        return (await self.correct_detailed(input_data)).output
+    
+    async def correct_detailed(self, input_data: Union[str, List[str]]) -> CorrectionResult:
+        """띄어쓰기 교정 결과와 사용한 사전 스냅샷 버전 (마이크로 배치로 처리)"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((input_data, future))
+        return await future
+    
+    async def close(self) -> None:
+        """배치 작업 종료 (대기 중인 요청은 취소)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            future.cancel()
+        
+        # 실행 중인 배치가 끝날 때까지 기다리되 이벤트 루프는 막지 않는다
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+    
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._queue = self._queue or asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._batch_loop())
+    
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            
+            try:
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                self._cancel_pending(batch)
+                raise
+            
+            await self._run_batch(loop, batch)
+    
+    async def _run_batch(self, loop: asyncio.AbstractEventLoop, batch: List[Tuple]) -> None:
+        batch = [(input_data, future) for input_data, future in batch if not future.cancelled()]
+        if not batch:
+            return
+        
+        self.batch_count += 1
+        self.request_count += len(batch)
+        
+        try:
+            results = await loop.run_in_executor(
+                self._executor, self.corrector.batch_correct_detailed, [input_data for input_data, _ in batch]
+            )
+        except asyncio.CancelledError:
+            # close() 로 작업이 취소되면 큐에서 꺼낸 요청도 취소해 기다리는 호출자를 깨운다
+            self._cancel_pending(batch)
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+    
+    @staticmethod
+    def _cancel_pending(batch: List[Tuple]) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.cancel()
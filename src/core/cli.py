@@ -0,0 +1,379 @@
+"""
+파일 교정 CLI - txt / jsonl / csv 입력을 스트리밍으로 교정하고 체크포인트로 이어서 처리
+
+    korean-spacing input.jsonl output.jsonl --field text --workers 8
+    korean-spacing filing.xml corrected.xml      # 공시 문서 (DART XML / HTML), 마크업 유지
+
+입력은 바이트 오프셋을 따라가며 한 레코드씩 읽고, 결과는 입력 순서대로 바로 기록한다.
+체크포인트 파일에는 마지막으로 기록한 레코드의 입력/출력 바이트 오프셋을 남기므로
+중단된 작업을 같은 명령으로 다시 실행하면 그 위치부터 이어서 처리한다.
+"""
+import csv
+import io
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+import click
+from tqdm import tqdm
+from core.parallel import DEFAULT_CHUNK_SIZE
+
+
+FORMATS = ('txt', 'jsonl', 'csv', 'html')
+MARKUP_SUFFIXES = ('html', 'htm', 'xml', 'xhtml')
+DEFAULT_CHECKPOINT_EVERY = 10000
+
+# (레코드 끝 입력 오프셋, 원본 레코드, 교정할 텍스트 - None 이면 교정하지 않고 그대로 기록)
+Record = Tuple[int, Any, Optional[str]]
+
+
+def _lines(f, offset: int) -> Iterator[Tuple[int, str]]:
+    """바이너리 파일을 offset 부터 한 줄씩 읽어 (줄 끝 오프셋, 디코딩한 줄) 반환"""
+    f.seek(offset)
+    for line in iter(f.readline, b''):
+        offset += len(line)
+        yield offset, line.decode('utf-8')
+
+
+def _strip_newline(line: str) -> str:
+    return line.rstrip('\r\n')
+
+
+def read_txt(f, offset: int, field: str) -> Iterator[Record]:
+    for end, line in _lines(f, offset):
+        text = _strip_newline(line)
+        yield end, None, text
+
+
+def read_jsonl(f, offset: int, field: str) -> Iterator[Record]:
+    """JSONL 레코드 읽기 (값이 null 이거나 키가 없으면 교정하지 않음)"""
+    start = offset
+    for end, line in _lines(f, offset):
+        if not line.strip():
+            start = end
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise click.ClickException(f"JSONL {_line_number(f, start)}번째 줄을 읽을 수 없습니다: {e}")
+        if not isinstance(record, dict):
+            raise click.ClickException(
+                f"JSONL {_line_number(f, start)}번째 줄이 객체가 아닙니다 ({type(record).__name__})"
+            )
+        value = record.get(field)
+        if value is not None and not isinstance(value, (str, list)):
+            value = str(value)
+        yield end, record, value
+        start = end
+
+
+def _line_number(f, offset: int) -> int:
+    """입력 offset 위치의 줄 번호 (오류 메시지용, 앞부분을 블록 단위로 읽어 센다)"""
+    f.seek(0)
+    count = 1
+    remaining = offset
+    while remaining > 0:
+        block = f.read(min(remaining, 1 << 20))
+        if not block:
+            break
+        count += block.count(b'\n')
+        remaining -= len(block)
+    return count
+
+
+def read_csv_header(f) -> Tuple[int, List[str]]:
+    """(헤더 끝 오프셋, 열 이름 목록)"""
+    header_end, line = next(_lines(f, 0), (0, ''))
+    return header_end, next(csv.reader([line]), [])
+
+
+def read_csv(f, offset: int, field: str) -> Iterator[Record]:
+    """CSV 레코드 읽기 (csv.reader 는 필요한 줄만 당겨 가므로 레코드 끝 오프셋이 정확하다)"""
+    header_end, columns = read_csv_header(f)
+    if field not in columns:
+        raise click.ClickException(f"CSV 에 '{field}' 열이 없습니다 (열: {', '.join(columns)})")
+    index = columns.index(field)
+    position = [max(offset, header_end)]
+    
+    def tracked():
+        for end, line in _lines(f, position[0]):
+            position[0] = end
+            yield line
+    
+    for row in csv.reader(tracked()):
+        if row:
+            yield position[0], row, row[index] if index < len(row) else ''
+
+
+READERS = {'txt': read_txt, 'jsonl': read_jsonl, 'csv': read_csv}
+
+
+def csv_line(row: List[str]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator='\n').writerow(row)
+    return buffer.getvalue()
+
+
+def format_output(fmt: str, record: Any, corrected, output_field: str, column: Optional[int]) -> str:
+    """교정 결과를 출력 형식의 한 레코드로 변환 (CSV 는 column 이 None 이면 새 열로 추가)"""
+    if fmt == 'txt':
+        return corrected + '\n'
+    if fmt == 'jsonl':
+        return json.dumps({**record, output_field: corrected}, ensure_ascii=False) + '\n'
+    
+    row = list(record)
+    if column is None:
+        row.append(corrected)
+    else:
+        row[column] = corrected
+    return csv_line(row)
+
+
+class Checkpoint:
+    """진행 위치 기록 (임시 파일에 쓴 뒤 교체하므로 중단되어도 항상 완전한 JSON)"""
+    
+    def __init__(self, path: Path, source: Path):
+        self.path = path
+        self.source = {'input': str(source.resolve()), 'input_size': source.stat().st_size}
+        self.input_offset = 0
+        self.output_offset = 0
+        self.records = 0
+    
+    def load(self) -> bool:
+        """같은 입력의 체크포인트가 있으면 위치를 불러옴"""
+        if not self.path.exists():
+            return False
+        with open(self.path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if any(state.get(key) != value for key, value in self.source.items()):
+            raise click.ClickException(f"체크포인트가 다른 입력 파일의 것입니다: {self.path}")
+        self.input_offset = state['input_offset']
+        self.output_offset = state['output_offset']
+        self.records = state['records']
+        return True
+    
+    def save(self) -> None:
+        state = {
+            **self.source,
+            'input_offset': self.input_offset,
+            'output_offset': self.output_offset,
+            'records': self.records,
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        tmp_path.replace(self.path)
+    
+    def remove(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def correct_records(
+    records: Iterator[Record],
+    correct_batch: Callable[[List], List],
+    iter_correct: Callable[[Iterator], Iterator],
+    workers: int,
+    chunk_size: int
+) -> Iterator[Tuple[int, Any, Any]]:
+    """레코드 스트림을 교정하여 (입력 오프셋, 원본 레코드, 교정 결과) 를 입력 순서대로 반환
+    
+    workers > 1 이면 워커 풀이 동시에 처리하는 청크 수만큼만 레코드를 메모리에 둔다.
+    텍스트가 None 인 레코드는 교정기에 보내지 않고 결과 None 으로 순서에 맞춰 반환한다.
+    """
+    pending = deque()
+    
+    def texts():
+        for end, record, text in records:
+            pending.append((end, record, text is not None))
+            if text is not None:
+                yield text
+    
+    def skipped():
+        while pending and not pending[0][2]:
+            end, record, _ = pending.popleft()
+            yield end, record, None
+    
+    if workers > 1:
+        results = iter_correct(texts())
+    else:
+        results = (result for chunk in _chunks(texts(), chunk_size) for result in correct_batch(chunk))
+    
+    for result in results:
+        yield from skipped()
+        end, record, _ = pending.popleft()
+        yield end, record, result
+    yield from skipped()
+
+
+def _chunks(items: Iterator, size: int) -> Iterator[list]:
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _detect_format(path: Path) -> str:
+    suffix = path.suffix.lstrip('.').lower()
+    if suffix in MARKUP_SUFFIXES:
+        return 'html'
+    if suffix in FORMATS:
+        return suffix
+    return 'txt'
+
+
+@click.command(context_settings={'help_option_names': ['-h', '--help']})
+@click.argument('input_path', type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument('output_path', type=click.Path(dir_okay=False, path_type=Path))
+@click.option('--format', 'fmt', type=click.Choice(FORMATS), default=None, help="입력 형식 (기본: 확장자로 판단, html 은 DART XML 포함)")
+@click.option('--field', default='text', show_default=True, help="교정할 JSONL 키 / CSV 열")
+@click.option('--output-field', default=None, help="결과를 기록할 키 / 열 (기본: --field 를 덮어씀)")
+@click.option('--workers', '-w', type=int, default=1, show_default=True, help="워커 프로세스 수")
+@click.option('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, show_default=True, help="워커에 보내는 레코드 묶음 크기")
+@click.option('--checkpoint', type=click.Path(dir_okay=False, path_type=Path), default=None,
+              help="체크포인트 파일 (기본: <출력>.checkpoint)")
+@click.option('--checkpoint-every', type=int, default=DEFAULT_CHECKPOINT_EVERY, show_default=True,
+              help="체크포인트 저장 간격 (레코드 수)")
+@click.option('--restart', is_flag=True, help="체크포인트를 무시하고 처음부터 처리")
+@click.option('--pykospacing/--no-pykospacing', default=True, show_default=True)
+@click.option('--kospacing', is_flag=True)
+@click.option('--kiwi', is_flag=True)
+@click.option('--exported-model', type=click.Path(dir_okay=False), default=None, help="내보낸 PyKoSpacing 모델 (.tflite / .onnx)")
+@click.option('--dict-dir', type=click.Path(file_okay=False), default=None)
+@click.option('--quiet', '-q', is_flag=True, help="진행률 표시 안 함")
+def main(
+    input_path: Path,
+    output_path: Path,
+    fmt: str,
+    field: str,
+    output_field: str,
+    workers: int,
+    chunk_size: int,
+    checkpoint: Path,
+    checkpoint_every: int,
+    restart: bool,
+    pykospacing: bool,
+    kospacing: bool,
+    kiwi: bool,
+    exported_model: str,
+    dict_dir: str,
+    quiet: bool
+):
+    """INPUT_PATH 의 txt / jsonl / csv 레코드를 띄어쓰기 교정하여 OUTPUT_PATH 에 기록"""
+    from core.spacing_corrector import SpacingCorrector
+    
+    if chunk_size <= 0 or checkpoint_every <= 0:
+        raise click.BadParameter("--chunk-size 와 --checkpoint-every 는 양수여야 합니다")
+    
+    fmt = fmt or _detect_format(input_path)
+    if fmt == 'html':
+        _correct_markup_file(input_path, output_path, workers, chunk_size, pykospacing, kospacing, kiwi,
+                             exported_model, dict_dir, quiet)
+        return
+    
+    output_field = output_field or field
+    state = Checkpoint(checkpoint or output_path.with_name(output_path.name + '.checkpoint'), input_path)
+    resumed = not restart and output_path.exists() and state.load()
+    
+    corrector = SpacingCorrector(
+        use_pykospacing=pykospacing,
+        use_kospacing=kospacing,
+        dict_dir=dict_dir,
+        use_kiwi=kiwi,
+        exported_model=exported_model
+    )
+    
+    with open(input_path, 'rb') as source, open(output_path, 'r+b' if resumed else 'wb') as out:
+        column = None
+        if fmt == 'csv':
+            _, header = read_csv_header(source)
+            if output_field in header:
+                column = header.index(output_field)
+            if not resumed:
+                out.write(csv_line(header if column is not None else header + [output_field]).encode('utf-8'))
+        
+        if resumed:
+            out.truncate(state.output_offset)
+            out.seek(state.output_offset)
+            click.echo(f"체크포인트에서 이어서 처리: {state.records:,}건, {state.input_offset:,} bytes", err=True)
+        
+        records = READERS[fmt](source, state.input_offset, field)
+        results = correct_records(
+            records,
+            corrector.batch_correct,
+            lambda texts: corrector.iter_batch_correct(texts, workers, chunk_size=chunk_size),
+            workers,
+            chunk_size
+        )
+        
+        progress = tqdm(
+            total=state.source['input_size'], initial=state.input_offset, unit='B', unit_scale=True,
+            desc=input_path.name, disable=quiet, dynamic_ncols=True
+        )
+        with progress:
+            since_checkpoint = 0
+            for end, record, result in results:
+                out.write(format_output(fmt, record, result, output_field, column).encode('utf-8'))
+                progress.update(end - state.input_offset)
+                state.input_offset = end
+                state.records += 1
+                since_checkpoint += 1
+                
+                if since_checkpoint >= checkpoint_every:
+                    out.flush()
+                    os.fsync(out.fileno())
+                    state.output_offset = out.tell()
+                    state.save()
+                    since_checkpoint = 0
+                    progress.set_postfix(records=f'{state.records:,}')
+    
+    state.remove()
+    if not quiet:
+        click.echo(f"완료: {state.records:,}건 -> {output_path}", err=True)
+
+
+def _correct_markup_file(
+    input_path: Path,
+    output_path: Path,
+    workers: int,
+    chunk_size: int,
+    pykospacing: bool,
+    kospacing: bool,
+    kiwi: bool,
+    exported_model: str,
+    dict_dir: str,
+    quiet: bool
+) -> None:
+    """공시 문서 교정 (문서 단위로 스트리밍하므로 체크포인트는 쓰지 않음)"""
+    from core.spacing_corrector import SpacingCorrector
+    
+    corrector = SpacingCorrector(
+        use_pykospacing=pykospacing,
+        use_kospacing=kospacing,
+        dict_dir=dict_dir,
+        use_kiwi=kiwi,
+        exported_model=exported_model
+    )
+    
+    progress = tqdm(
+        total=input_path.stat().st_size, unit='B', unit_scale=True,
+        desc=input_path.name, disable=quiet, dynamic_ncols=True
+    )
+    with progress:
+        result = corrector.correct_filing(
+            input_path, output_path, workers=workers, chunk_size=chunk_size, progress=progress.update
+        )
+    
+    if not quiet:
+        click.echo(
+            f"완료: 텍스트 {result.units:,}개 (표 셀 {result.cells:,}개), 변경 {result.changed:,}개 -> {output_path}",
+            err=True
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""
+공시 문서 교정 모듈 - DART XML / HTML 파일의 마크업은 그대로 두고 텍스트 노드와 표 셀만 교정
+
+파일을 조각 단위로 읽으며 태그, 주석, 텍스트를 순서대로 나누고, 텍스트 노드마다 교정 단위를 만든다.
+표 셀 (TD/TH 와 DART 의 TE/TU) 안의 텍스트는 토큰 리스트로, 나머지는 문자열로 batch_size 개씩 묶어
+교정한 뒤 원래 위치에 다시 써 넣는다. 교정기가 바꾸지 않은 단어 사이 구분자 (줄바꿈, &nbsp; 등) 와
+마크업은 원본 그대로 기록하므로 구조와 속성이 바뀌지 않는다. 교정 대기 중인 단위가 없으면 마크업은
+바로 내보내고, 대기 분량은 단위 수 (batch_size) 와 글자 수 (max_pending) 로 제한한다.
+"""
+import codecs
+import html
+import re
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+from bs4.dammit import EncodingDetector
+
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_READ_SIZE = 1 << 16
+DEFAULT_MAX_PENDING = 1 << 20
+
+CELL_TAGS = frozenset({'td', 'th', 'te', 'tu'})
+SKIP_TAGS = frozenset({'script', 'style'})
+VOID_TAGS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'param', 'pgbrk', 'wbr'})
+
+# 완결된 주석/선언/태그, 조각 끝에서 아직 닫히지 않은 마크업, 텍스트 순으로 시도
+TOKEN_PATTERN = re.compile(
+    r'(?P<markup><!--.*?-->|<!\[CDATA\[.*?\]\]>|<![^>]*>|<\?.*?\?>|</?[A-Za-z][^>]*>)'
+    r'|(?P<partial>(?:<!--.*|<!\[CDATA\[.*|<[!?/A-Za-z][^>]*)\Z)'
+    r'|(?P<text>[^<]+|<)',
+    re.S
+)
+TAG_NAME = re.compile(r'</?([A-Za-z][\w:.-]*)')
+HANGUL = re.compile(r'[가-힣]')
+# 텍스트 앞뒤의 공백과 &nbsp; 는 들여쓰기로 보고 그대로 둔다
+EDGE_BLANK = r'(?:\s|&nbsp;|&#160;|&#xa0;)*'
+TEXT_PARTS = re.compile(rf'^({EDGE_BLANK})(.*?)({EDGE_BLANK})$', re.S | re.I)
+WORD_GAP = re.compile(r'(?:\s|&nbsp;|&#160;|&#xa0;)+', re.I)
+
+
+@dataclass
+class FilingResult:
+    """공시 문서 교정 통계 (교정 단위 수, 그중 표 셀 단위 수, 바뀐 단위 수)"""
+    units: int = 0
+    cells: int = 0
+    changed: int = 0
+
+
+def iter_markup_tokens(chunks: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """마크업 조각 스트림을 ('markup' | 'text', 원문) 토큰으로 분할
+    
+    조각 끝에 걸친 토큰은 다음 조각과 이어 붙인 뒤 내보내므로 토큰을 이으면 원문과 같다.
+    """
+    buffer = ''
+    for chunk in chunks:
+        buffer += chunk
+        pos = 0
+        for match in TOKEN_PATTERN.finditer(buffer):
+            if match.end() == len(buffer):
+                break
+            yield ('text' if match.lastgroup == 'text' else 'markup'), match.group()
+            pos = match.end()
+        buffer = buffer[pos:]
+    
+    for match in TOKEN_PATTERN.finditer(buffer):
+        yield ('text' if match.lastgroup == 'text' else 'markup'), match.group()
+
+
+class _TagStack:
+    """열린 태그 이름 스택 (짝이 맞지 않는 닫는 태그는 무시)"""
+    
+    def __init__(self):
+        self._stack: List[str] = []
+    
+    def update(self, markup: str) -> None:
+        match = TAG_NAME.match(markup)
+        if match is None:
+            return
+        name = match.group(1).lower()
+        if markup.startswith('</'):
+            if name in self._stack:
+                index = len(self._stack) - 1 - self._stack[::-1].index(name)
+                del self._stack[index:]
+        elif not markup.endswith('/>') and name not in VOID_TAGS:
+            self._stack.append(name)
+    
+    def inside(self, names: frozenset) -> bool:
+        return any(name in names for name in self._stack)
+
+
+def correct_markup(
+    chunks: Iterable[str],
+    correct_batch: Callable[[List[Union[str, List[str]]]], List[Union[str, List[str]]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    result: FilingResult = None,
+    max_pending: int = DEFAULT_MAX_PENDING
+) -> Iterator[str]:
+    """마크업 조각 스트림의 텍스트 노드를 교정하여 원래 마크업과 함께 순서대로 반환
+    
+    한글이 없는 텍스트와 script/style 안의 텍스트는 교정하지 않는다. result 를 주면 통계를 채운다.
+    """
+    if batch_size <= 0 or max_pending <= 0:
+        raise ValueError("batch_size 와 max_pending 은 양수여야 합니다")
+    result = result if result is not None else FilingResult()
+    tags = _TagStack()
+    # 마크업/교정하지 않는 텍스트는 원문 문자열, 교정 단위는 _TextUnit
+    pending: List[Union[str, _TextUnit]] = []
+    units = 0
+    size = 0
+    
+    def flush() -> Iterator[str]:
+        queued = [piece for piece in pending if isinstance(piece, _TextUnit)]
+        corrected = iter(correct_batch([
+            unit.plain_words if unit.cell else unit.text for unit in queued
+        ])) if queued else iter(())
+        for piece in pending:
+            if not isinstance(piece, _TextUnit):
+                yield piece
+                continue
+            output = next(corrected)
+            tokens = output if piece.cell else output.split()
+            if tokens == piece.plain_words:
+                yield piece.raw
+                continue
+            result.changed += 1
+            yield piece.rebuild(tokens)
+        pending.clear()
+    
+    for kind, raw in iter_markup_tokens(chunks):
+        if kind == 'markup':
+            tags.update(raw)
+        else:
+            lead, core, trail = TEXT_PARTS.match(raw).groups()
+            if HANGUL.search(core) and not tags.inside(SKIP_TAGS):
+                unit = _TextUnit(lead, core, trail, tags.inside(CELL_TAGS))
+                pending.append(unit)
+                result.units += 1
+                result.cells += unit.cell
+                units += 1
+                size += len(raw)
+                if units >= batch_size or size >= max_pending:
+                    yield from flush()
+                    units = size = 0
+                continue
+        
+        # 교정 대기 중인 단위가 없으면 기다릴 필요 없이 바로 내보냄
+        if not units:
+            yield raw
+            continue
+        pending.append(raw)
+        size += len(raw)
+        if size >= max_pending:
+            yield from flush()
+            units = size = 0
+    
+    yield from flush()
+
+
+class _TextUnit:
+    """교정 단위 텍스트 노드 - 앞뒤 공백, 원문 단어와 단어 사이 구분자
+    
+    엔티티가 있는 원문은 풀어서 교정하고, 바뀐 부분만 다시 이스케이프하여 써 넣는다.
+    """
+    
+    __slots__ = ('lead', 'core', 'trail', 'cell', 'words', 'gaps', 'plain_words', 'escaped')
+    
+    def __init__(self, lead: str, core: str, trail: str, cell: bool):
+        self.lead, self.core, self.trail, self.cell = lead, core, trail, cell
+        self.words = WORD_GAP.split(core)
+        self.gaps = WORD_GAP.findall(core)
+        self.escaped = '&' in core
+        self.plain_words = [html.unescape(word) for word in self.words] if self.escaped else self.words
+    
+    @property
+    def raw(self) -> str:
+        return self.lead + self.core + self.trail
+    
+    @property
+    def text(self) -> str:
+        """교정기에 보내는 문자열 (엔티티를 푼 원문)"""
+        return html.unescape(self.core) if self.escaped else self.core
+    
+    def rebuild(self, tokens: List[str]) -> str:
+        """교정 토큰을 원문에 반영 - 교정기가 유지한 단어 경계는 원래 구분자, 새 경계는 공백 한 칸
+        
+        공백 아닌 문자가 바뀌었으면 교정 결과를 공백으로 이어 쓴다.
+        """
+        chars = ''.join(self.plain_words)
+        if ''.join(tokens) != chars:
+            return self.lead + self._escape(' '.join(tokens)) + self.trail
+        
+        # 문자 위치 -> 원문 단어 경계의 구분자, 원문 단어 구간
+        original_gaps = dict(zip(accumulate(len(word) for word in self.plain_words), self.gaps))
+        word_spans = {}
+        start = 0
+        for word, plain in zip(self.words, self.plain_words):
+            word_spans[(start, start + len(plain))] = word
+            start += len(plain)
+        cuts = set(accumulate(len(token) for token in tokens[:-1]))
+        
+        pieces = []
+        bounds = sorted(cuts | set(original_gaps) | {0, len(chars)})
+        for a, b in zip(bounds, bounds[1:]):
+            if a in cuts:
+                pieces.append(original_gaps.get(a, ' '))
+            pieces.append(word_spans.get((a, b)) or self._escape(chars[a:b]))
+        return self.lead + ''.join(pieces) + self.trail
+    
+    def _escape(self, text: str) -> str:
+        return html.escape(text, quote=False) if self.escaped else text
+
+
+def detect_encoding(head: bytes) -> str:
+    """파일 앞부분의 BOM, XML 선언, meta charset 으로 인코딩 판단 (EUC-KR 은 CP949 로 읽음)"""
+    for encoding in EncodingDetector(head, is_html=True).encodings:
+        try:
+            codec = codecs.lookup(encoding).name
+        except LookupError:
+            continue
+        if codec == 'euc_kr':
+            codec = 'cp949'
+        try:
+            codecs.getincrementaldecoder(codec)().decode(head, final=False)
+        except UnicodeDecodeError:
+            continue
+        return codec
+    return 'utf-8'
+
+
+def read_chunks(f: BinaryIO, encoding: str, read_size: int = DEFAULT_READ_SIZE,
+                progress: Callable[[int], None] = None) -> Iterator[str]:
+    """바이너리 파일을 read_size 바이트씩 읽어 디코딩한 조각 반환"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for block in iter(lambda: f.read(read_size), b''):
+        if progress is not None:
+            progress(len(block))
+        text = decoder.decode(block)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def correct_filing(
+    source: Union[str, Path],
+    output: Union[str, Path],
+    correct_batch: Callable[[List[Union[str, List[str]]]], List[Union[str, List[str]]]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    encoding: Optional[str] = None,
+    progress: Callable[[int], None] = None
+) -> FilingResult:
+    """공시 문서 파일을 교정하여 같은 인코딩으로 output 에 기록"""
+    result = FilingResult()
+    with open(source, 'rb') as f, open(output, 'wb') as out:
+        encoding = encoding or detect_encoding(f.read(DEFAULT_READ_SIZE))
+        f.seek(0)
+        encoder = codecs.getincrementalencoder(encoding)(errors='xmlcharrefreplace')
+        for piece in correct_markup(read_chunks(f, encoding, progress=progress), correct_batch, batch_size, result):
+            out.write(encoder.encode(piece))
+        out.write(encoder.encode('', final=True))
+    return result
@@ -0,0 +1,166 @@
+"""
+증분 교정 모듈 - 문서를 문장 세그먼트로 나누어 이전 수정본과 달라진 세그먼트만 다시 교정
+"""
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Tuple
+
+
+DEFAULT_MAX_DOCUMENTS = 1024
+
+# 줄바꿈(앞뒤 공백 포함) 또는 문장 끝 부호 뒤 공백에서 세그먼트를 나눈다
+SEGMENT_BREAK = re.compile(r'[^\S\n]*\n\s*|(?<=[^\d\s][.!?])\s+')
+
+
+@dataclass(frozen=True)
+class Segment:
+    """문장 세그먼트 (원문, 뒤따르는 구분 공백, 내용 해시, 교정 결과)"""
+    source: str
+    separator: str
+    digest: bytes
+    output: str
+
+
+@dataclass
+class IncrementalResult:
+    """증분 교정 결과
+    
+    affected 는 이번에 다시 교정한 세그먼트의 출력 기준 [start, end) 구간 (연속 세그먼트는 병합).
+    dictionary_version 은 SpacingCorrector.correct_incremental 이 채우는 사전 스냅샷 버전.
+    """
+    output: str
+    affected: List[Tuple[int, int]]
+    corrected_segments: int
+    total_segments: int
+    dictionary_version: str = ''
+
+
+def split_segments(text: str) -> List[Tuple[str, str]]:
+    """문서를 (문장, 뒤따르는 구분 공백) 목록으로 분할 (이어 붙이면 원문)"""
+    pieces = []
+    pos = 0
+    for match in SEGMENT_BREAK.finditer(text):
+        pieces.append((text[pos:match.start()], match.group()))
+        pos = match.end()
+    if pos < len(text) or not pieces:
+        pieces.append((text[pos:], ''))
+    return pieces
+
+
+def segment_digest(source: str, separator: str) -> bytes:
+    return hashlib.blake2b(f'{source}\x00{separator}'.encode('utf-8'), digest_size=16).digest()
+
+
+def _render_separator(separator: str, last: bool) -> str:
+    """줄바꿈은 개수만큼 보존, 문장 사이 공백은 한 칸 (문서 끝 공백은 제거)"""
+    newlines = separator.count('\n')
+    if newlines:
+        return '\n' * newlines
+    return '' if last or not separator else ' '
+
+
+class IncrementalCorrector:
+    """문서별 세그먼트 상태를 보관하고 수정본에서 바뀐 세그먼트와 그 이웃만 다시 교정
+    
+    세그먼트는 서로 독립적으로 교정하므로, 결과는 같은 수정본을 처음부터 교정한 것과 같다.
+    version 이 바뀌면 (사전 다시 로드 등) 이전 상태를 버리고 전체를 교정한다.
+    문서 상태는 max_documents 개까지 LRU 로 보관한다.
+    """
+    
+    def __init__(
+        self,
+        correct_batch: Callable[[List[str]], List[str]],
+        max_documents: int = DEFAULT_MAX_DOCUMENTS
+    ):
+        if max_documents <= 0:
+            raise ValueError("max_documents 는 양수여야 합니다")
+        self._correct_batch = correct_batch
+        self.max_documents = max_documents
+        self._documents: 'OrderedDict[str, Tuple[str, List[Segment]]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._documents)
+    
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._documents
+    
+    def update(
+        self,
+        doc_id: str,
+        text: str,
+        version: str = '',
+        correct_batch: Callable[[List[str]], List[str]] = None
+    ) -> IncrementalResult:
+        """문서 수정본 교정 및 상태 갱신 (correct_batch 를 주면 이번 갱신에만 그 함수로 교정)"""
+        pieces = split_segments(text)
+        digests = [segment_digest(source, separator) for source, separator in pieces]
+        
+        with self._lock:
+            previous = self._documents.get(doc_id)
+        old = previous[1] if previous is not None and previous[0] == version else []
+        
+        reused: Dict[int, Segment] = {}
+        affected = set()
+        matcher = SequenceMatcher(None, [segment.digest for segment in old], digests, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal':
+                reused.update(zip(range(j1, j2), old[i1:i2]))
+            else:
+                affected.update(range(max(j1 - 1, 0), min(j2 + 1, len(pieces))))
+        
+        indices = sorted(affected)
+        sources = [pieces[i][0] for i in indices if pieces[i][0].strip()]
+        outputs = iter((correct_batch or self._correct_batch)(sources) if sources else [])
+        
+        segments = []
+        for i, ((source, separator), digest) in enumerate(zip(pieces, digests)):
+            if i in reused and i not in affected:
+                segments.append(reused[i])
+            else:
+                output = next(outputs) if source.strip() else ''
+                segments.append(Segment(source, separator, digest, output))
+        
+        with self._lock:
+            self._documents[doc_id] = (version, segments)
+            self._documents.move_to_end(doc_id)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+        
+        output, ranges = self._render(segments, affected)
+        return IncrementalResult(output, ranges, len(sources), len(segments))
+    
+    def forget(self, doc_id: str) -> None:
+        with self._lock:
+            self._documents.pop(doc_id, None)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+    
+    @staticmethod
+    def _render(segments: List[Segment], affected: set) -> Tuple[str, List[Tuple[int, int]]]:
+        """세그먼트를 이어 붙이고 다시 교정한 세그먼트의 출력 구간 계산"""
+        parts = []
+        ranges = []
+        pos = 0
+        last = None
+        
+        for i, segment in enumerate(segments):
+            end = pos + len(segment.output)
+            if i in affected and segment.output:
+                if ranges and last == i - 1:
+                    ranges[-1] = (ranges[-1][0], end)
+                else:
+                    ranges.append((pos, end))
+                last = i
+            parts.append(segment.output)
+            separator = _render_separator(segment.separator, i == len(segments) - 1)
+            parts.append(separator)
+            pos += len(segment.output) + len(separator)
+        
+        return ''.join(parts), ranges
@@ -0,0 +1,131 @@
+"""
+프로세스/스레드 풀 병렬 배치 교정
+"""
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from utils.profiler import Profiler
+from utils.result_cache import ResultCache
+
+
+DEFAULT_CHUNK_SIZE = 64
+
+_worker_corrector = None
+
+
+def _init_worker(config: Dict[str, Any], cache_options: Optional[Dict[str, Any]]) -> None:
+    """워커 초기화: 사전, 컴파일된 규칙, 모델을 프로세스당 한 번만 준비"""
+    global _worker_corrector
+    from core.spacing_corrector import SpacingCorrector
+    cache = ResultCache(**cache_options) if cache_options is not None else None
+    _worker_corrector = SpacingCorrector(**config, cache=cache)
+    _worker_corrector.warmup()
+
+
+def _correct_chunk(
+    inputs: List[Union[str, List[str]]],
+    verbose: bool
+) -> Tuple[List[Union[str, List[str]]], Optional[dict]]:
+    """청크 교정 - (결과, 이 청크의 프로파일 통계) 반환 (통계는 부모 프로세스에서 합산)"""
+    results = _worker_corrector.batch_correct(inputs, verbose=verbose)
+    if _worker_corrector.cache is not None:
+        _worker_corrector.cache.flush()
+    
+    stats = None
+    if _worker_corrector.profiler is not None:
+        stats = _worker_corrector.get_stats()
+        _worker_corrector.reset_stats()
+    return results, stats
+
+
+def _chunked(inputs: Iterable, chunk_size: int) -> Iterator[list]:
+    iterator = iter(inputs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def parallel_correct(
+    config: Dict[str, Any],
+    inputs: Iterable[Union[str, List[str]]],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    verbose: bool = False,
+    cache: ResultCache = None,
+    profiler: Profiler = None
+) -> Iterator[Union[str, List[str]]]:
+    """입력을 chunk_size 단위로 워커에 분배하고 결과를 입력 순서대로 반환
+    
+    동시에 처리 중인 청크 수를 workers * 2 로 제한해 입력 스트림을 모두 메모리에 올리지 않는다.
+    워커는 spawn 으로 시작한다 - fork 하면 부모의 모델/스레드 풀 스레드가 잡고 있던 잠금을
+    그대로 물려받아 멈출 수 있다.
+    cache 를 주면 워커마다 같은 설정의 ResultCache 를 만들고 (SQLite 계층은 프로세스 간 공유),
+    profiler 를 주면 워커가 청크마다 보내는 통계를 합산한다.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 는 양수여야 합니다")
+    
+    cache_options = None
+    if cache is not None:
+        cache.flush()
+        cache_options = {'max_entries': cache.max_entries, 'db_path': str(cache.db_path) if cache.db_path else None}
+    
+    def collect(future: Future) -> List[Union[str, List[str]]]:
+        results, stats = future.result()
+        if profiler is not None and stats:
+            profiler.merge(stats)
+        return results
+    
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(config, cache_options)
+    ) as pool:
+        yield from _ordered_results(pool, lambda chunk: pool.submit(_correct_chunk, chunk, verbose),
+                                    inputs, workers, chunk_size, collect)
+
+
+def threaded_correct(
+    batch_correct: Callable[[List[Union[str, List[str]]]], List[Union[str, List[str]]]],
+    inputs: Iterable[Union[str, List[str]]],
+    workers: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Union[str, List[str]]]:
+    """하나의 교정기를 여러 스레드가 공유하여 청크 단위로 교정 (결과는 입력 순서)
+    
+    모델 추론(TensorFlow)과 형태소 분석(Kiwi)의 네이티브 코드는 GIL 을 풀기 때문에
+    프로세스를 띄우지 않고도 병렬로 실행된다.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 는 양수여야 합니다")
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='spacing-batch') as pool:
+        yield from _ordered_results(pool, lambda chunk: pool.submit(batch_correct, chunk),
+                                    inputs, workers, chunk_size)
+
+
+def _ordered_results(
+    pool: Executor,
+    submit: Callable[[list], Any],
+    inputs: Iterable,
+    workers: int,
+    chunk_size: int,
+    collect: Callable[[Future], list] = Future.result
+) -> Iterator:
+    """동시에 처리 중인 청크를 workers * 2 개로 제한하며 제출 순서대로 결과 반환"""
+    pending = deque()
+    for chunk in _chunked(inputs, chunk_size):
+        pending.append(submit(chunk))
+        if len(pending) >= workers * 2:
+            yield from collect(pending.popleft())
+    while pending:
+        yield from collect(pending.popleft())
@@ -1,39 +1,120 @@
 """
 후처리 모듈
 """
-import re
-from typing import List, Dict
+from typing import Callable, Dict, List, Set, Tuple, Union
+from core.preprocessor import Preprocessor
 from rules.number_rules import NumberRules
 from rules.legal_rules import LegalRules
 from rules.compound_rules import CompoundRules
 from rules.pattern_rules import PatternRules
-from utils.dictionary_loader import DictionaryLoader
+from rules.rule_engine import RuleEngine, present_chars
+from utils.dictionary_loader import DictionaryLoader, DictionarySnapshot
+from utils.profiler import Profiler
+from utils.spacing_bitmap import merge_sources
 
 
 class Postprocessor:
     """텍스트 후처리"""
     
-    def __init__(self, dict_loader: DictionaryLoader = None):
+    def __init__(self, dict_loader: DictionaryLoader = None, profiler: Profiler = None):
         self.dict_loader = dict_loader or DictionaryLoader()
         self.compound_rules = CompoundRules(self.dict_loader)
+        self.rule_engine = RuleEngine()
+        self.rule_engine.profiler = profiler
+        self.profiler = profiler
     
-    def postprocess_string(self, text: str) -> str:
-        """문자열 후처리"""
-        text = NumberRules.apply_all(text)
-        text = LegalRules.apply_all(text)
-        text = self.compound_rules.fix_compound_nouns(text)
-        text = self.compound_rules.fix_split_words(text)
-        text = self.compound_rules.fix_financial_terms(text)
-        text = PatternRules.apply_all(text)
+    def postprocess_string(
+        self,
+        text: str,
+        snapshot: DictionarySnapshot = None,
+        present: Set[str] = None
+    ) -> str:
+        """문자열 후처리 (snapshot 을 주면 그 시점의 사전, 아니면 현재 스냅샷 하나를 잡아 사용)
+        
+        입력 문자 집합 (present) 은 한 번만 구해 모든 규칙 단계의 사전 필터에 쓴다.
+        """
+        if snapshot is None:
+            with self.dict_loader.acquire() as snapshot:
+                return self.postprocess_string(text, snapshot, present)
+        if present is None:
+            present = present_chars(text)
+        if self.profiler is not None:
+            return self.profiler.run_pipeline('stage', self._string_stages(snapshot, present), text)
+        text = self.rule_engine.apply('number', text, present)
+        text = self.rule_engine.apply('legal', text, present)
+        text = self.compound_rules.fix_compound_nouns(text, snapshot)
+        text = self.rule_engine.apply('split', text, present)
+        text = self.rule_engine.apply('financial', text, present)
+        text = self.rule_engine.apply('pattern', text, present)
         return text
     
-    def postprocess_tokens(self, tokens: List[str]) -> List[str]:
+    def finish_string(self, text: str, snapshot: DictionarySnapshot = None) -> str:
+        """문자열 후처리 + 최종 미세 조정 (입력 문자 집합을 한 번만 구해 함께 사용)"""
+        present = present_chars(text)
+        return self.fine_tune_spacing(self.postprocess_string(text, snapshot, present), present)
+    
+    def _string_stages(
+        self,
+        snapshot: DictionarySnapshot = None,
+        present: Set[str] = None
+    ) -> List[Tuple[str, Callable[[str], str]]]:
+        """postprocess_string 과 같은 순서의 (단계 이름, 함수) 목록"""
+        engine = self.rule_engine
+        return [
+            ('number', lambda text: engine.apply('number', text, present)),
+            ('legal', lambda text: engine.apply('legal', text, present)),
+            ('compound', lambda text: self.compound_rules.fix_compound_nouns(text, snapshot)),
+            ('split', lambda text: engine.apply('split', text, present)),
+            ('financial', lambda text: engine.apply('financial', text, present)),
+            ('pattern', lambda text: engine.apply('pattern', text, present)),
+        ]
+    
+    def postprocess_tokens(self, tokens: List[str], snapshot: DictionarySnapshot = None) -> List[str]:
         """토큰 리스트 후처리"""
-        tokens = NumberRules.apply_to_tokens(tokens)
-        tokens = LegalRules.apply_to_tokens(tokens)
-        tokens = self.compound_rules.apply_to_tokens(tokens)
-        tokens = PatternRules.apply_to_tokens(tokens)
-        return [t for t in tokens if t and not t.isspace()]
+        if snapshot is None:
+            with self.dict_loader.acquire() as snapshot:
+                return self.postprocess_tokens(tokens, snapshot)
+        if self.profiler is not None:
+            return self.profiler.timed('stage', 'tokens', self._postprocess_tokens, tokens, snapshot)
+        return self._postprocess_tokens(tokens, snapshot)
+    
+    def postprocess_tokens_with_sources(
+        self,
+        tokens: List[str],
+        sources: List[List[int]],
+        snapshot: DictionarySnapshot = None
+    ) -> Tuple[List[str], List[List[int]]]:
+        """토큰 리스트 후처리 + 토큰별 입력 출처 (sources[i] 는 tokens[i] 의 입력 토큰 번호 목록)
+        
+        토큰 규칙은 이웃 토큰을 이어 붙이기만 하므로 단계마다 병합된 토큰의 출처를 합친다.
+        """
+        if snapshot is None:
+            with self.dict_loader.acquire() as snapshot:
+                return self.postprocess_tokens_with_sources(tokens, sources, snapshot)
+        if self.profiler is not None:
+            return self.profiler.timed('stage', 'tokens', self._postprocess_tokens, tokens, snapshot, sources)
+        return self._postprocess_tokens(tokens, snapshot, sources)
+    
+    def _postprocess_tokens(
+        self,
+        tokens: List[str],
+        snapshot: DictionarySnapshot = None,
+        sources: List[List[int]] = None
+    ) -> Union[List[str], Tuple[List[str], List[List[int]]]]:
+        """토큰 규칙 순차 적용 (sources 를 주면 (토큰, 출처) 반환)"""
+        stages = [
+            NumberRules.apply_to_tokens,
+            LegalRules.apply_to_tokens,
+            lambda tokens: self.compound_rules.apply_to_tokens(tokens, snapshot),
+            PatternRules.apply_to_tokens,
+            lambda tokens: [t for t in tokens if t and not t.isspace()],
+        ]
+        for stage in stages:
+            output = stage(tokens)
+            if sources is not None:
+                sources = merge_sources(tokens, output, sources)
+            tokens = output
+        return tokens if sources is None else (tokens, sources)
     
     def convert_to_output_format(
         self, 
@@ -42,19 +123,22 @@ class Postprocessor:
         placeholders: Dict[str, str] = None
     ) -> str | List[str]:
         """출력 형식으로 변환"""
-        if placeholders:
-            for placeholder, original in placeholders.items():
-                text = text.replace(placeholder, original)
-        
         if original_type == 'string':
-            return text
+            return Preprocessor.restore_protected_patterns(text, placeholders)
+        return self.tokens_to_output(text.split(), placeholders)
+    
+    def tokens_to_output(self, tokens: List[str], placeholders: Dict[str, str] = None) -> List[str]:
+        """토큰 리스트 출력 변환 - 토큰별 플레이스홀더 복원, 닫는 문장부호는 앞 토큰에 붙임
         
-        tokens = text.split()
+        보호 패턴은 공백을 포함하지 않으므로 이어 붙여 복원한 뒤 다시 나눈 결과와 같다.
+        """
         result = []
         
         for token in tokens:
             if not token:
                 continue
+            if placeholders:
+                token = Preprocessor.restore_protected_patterns(token, placeholders)
             if token in ',.;:!?)]}' and result:
                 result[-1] += token
             else:
@@ -62,10 +146,10 @@ class Postprocessor:
         
         return result
     
-    def fine_tune_spacing(self, text: str) -> str:
-        """최종 띄어쓰기 미세 조정"""
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = re.sub(r'것으로\s+서(?=\s|$|[,.])', '것으로서', text)
-        text = re.sub(r'관\s+련', '관련', text)
-        text = re.sub(r'비\s+용', '비용', text)
-        return text
+    def fine_tune_spacing(self, text: str, present: Set[str] = None) -> str:
+        """최종 띄어쓰기 미세 조정 (present 는 후처리 전 입력의 문자 집합)"""
+        if self.profiler is not None:
+            return self.profiler.run_text(
+                'stage', 'fine_tune', lambda t: self.rule_engine.apply('fine_tune', t, present), text
+            )
+        return self.rule_engine.apply('fine_tune', text, present)
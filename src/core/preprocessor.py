@@ -11,13 +11,19 @@ class PreprocessResult:
     text: str
     placeholders: Dict[str, str]
     original_type: str
-    
-    
+
+
 class Preprocessor:
     """텍스트 전처리"""
     
-    def __init__(self):
-        self.placeholder_counter = 0
+    PROTECTED_PATTERNS = [
+        ('URL', r'https?://[^\s]+'),
+        ('EMAIL', r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
+        ('ABBREV', r'\b[A-Z]{2,}\b'),
+    ]
+    
+    PROTECTED_REGEX = re.compile('|'.join(f'(?P<{name}>{pattern})' for name, pattern in PROTECTED_PATTERNS))
+    PLACEHOLDER_REGEX = re.compile(r'__[A-Z]+_\d+__')
     
     def preprocess(self, input_data: str | List[str]) -> PreprocessResult:
         """입력 데이터 전처리"""
@@ -32,21 +38,27 @@ class Preprocessor:
         )
     
     def _extract_protected_patterns(self, text: str) -> Tuple[str, Dict[str, str]]:
-        """보호할 패턴 추출 (URL, 이메일 등)"""
+        """보호할 패턴 추출 (URL, 이메일 등) - 한 번의 스캔으로 구간을 기록해 치환"""
         placeholders = {}
+        parts = []
+        last = 0
         
-        patterns = [
-            ('URL', r'https?://[^\s]+'),
-            ('EMAIL', r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            ('ABBREV', r'\b[A-Z]{2,}\b'),
-        ]
+        for match in self.PROTECTED_REGEX.finditer(text):
+            placeholder = f'__{match.lastgroup}_{len(placeholders)}__'
+            placeholders[placeholder] = match.group()
+            parts.append(text[last:match.start()])
+            parts.append(placeholder)
+            last = match.end()
         
-        for name, pattern in patterns:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                placeholder = f'__{name}_{self.placeholder_counter}__'
-                self.placeholder_counter += 1
-                placeholders[placeholder] = match
-                text = text.replace(match, placeholder, 1)
+        if not placeholders:
+            return text, placeholders
         
-        return text, placeholders
+        parts.append(text[last:])
+        return ''.join(parts), placeholders
+    
+    @classmethod
+    def restore_protected_patterns(cls, text: str, placeholders: Dict[str, str]) -> str:
+        """플레이스홀더를 원문으로 복원 (한 번의 스캔)"""
+        if not placeholders:
+            return text
+        return cls.PLACEHOLDER_REGEX.sub(lambda m: placeholders.get(m.group(), m.group()), text)
@@ -1,12 +1,39 @@
 """
 한국어 띄어쓰기 교정 시스템 - 메인 모듈
 """
-from typing import List, Union
-from core.preprocessor import Preprocessor
+import hashlib
+import inspect
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+from core.preprocessor import Preprocessor, PreprocessResult
 from core.postprocessor import Postprocessor
-from core.validator import Validator
+from core.validator import Validator, revert_windows
+from core.incremental import IncrementalCorrector, IncrementalResult
+from core.filing import DEFAULT_BATCH_SIZE, FilingResult, correct_filing
+from core.parallel import DEFAULT_CHUNK_SIZE, parallel_correct, threaded_correct
+from core.streaming import DEFAULT_OVERLAP, DEFAULT_WINDOW_SIZE, correct_stream
 from models.ensemble import EnsembleModel
-from utils.dictionary_loader import DictionaryLoader
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH
+from utils.dictionary_loader import DictionaryLoader, DictionarySnapshot
+from utils.profiler import Profiler
+from utils.result_cache import ResultCache
+from utils.spacing_bitmap import SpaceEdit, SpacingBitmap, align_tokens, diff_spans, merge_sources
+
+
+@dataclass
+class CorrectionResult:
+    """교정 결과와 사용한 사전 스냅샷 버전"""
+    output: Union[str, List[str]]
+    dictionary_version: str
+
+
+@dataclass
+class TokenCorrectionResult:
+    """토큰 리스트 교정 결과 - sources[i] 는 tokens[i] 를 이루는 입력 토큰 번호 목록 (병합/분리 추적)"""
+    tokens: List[str]
+    sources: List[List[int]]
+    dictionary_version: str
 
 
 class SpacingCorrector:
@@ -17,17 +44,60 @@ class SpacingCorrector:
         use_pykospacing: bool = True,
         use_kospacing: bool = False,
         use_validator: bool = False,
-        dict_dir: str = None
+        dict_dir: str = None,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH,
+        cache: ResultCache = None,
+        profile: bool = False,
+        reload_interval: float = None,
+        use_kiwi: bool = False,
+        exported_model: str = None
     ):
+        self.config = {
+            'use_pykospacing': use_pykospacing,
+            'use_kospacing': use_kospacing,
+            'use_validator': use_validator,
+            'use_kiwi': use_kiwi,
+            'exported_model': exported_model,
+            'dict_dir': dict_dir,
+            'max_batch_size': max_batch_size,
+            'max_length': max_length,
+            'profile': profile,
+            'reload_interval': reload_interval,
+        }
+        self.profiler = Profiler() if profile else None
         self.preprocessor = Preprocessor()
         self.dict_loader = DictionaryLoader(dict_dir)
         self.dict_loader.load_all()
-        self.postprocessor = Postprocessor(self.dict_loader)
+        self.postprocessor = Postprocessor(self.dict_loader, profiler=self.profiler)
         self.validator = Validator(use_kiwi=use_validator) if use_validator else None
+        self._batch_validator = None
+        self._validator_lock = threading.Lock()
         self.model = EnsembleModel(
             use_pykospacing=use_pykospacing,
-            use_kospacing=use_kospacing
+            use_kospacing=use_kospacing,
+            use_kiwi=use_kiwi,
+            exported_model=exported_model,
+            max_batch_size=max_batch_size,
+            max_length=max_length
         )
+        self.cache = cache
+        self._cache_version: Tuple[str, tuple, str] = None
+        self.documents = IncrementalCorrector(self.batch_correct)
+        
+        if reload_interval:
+            self.dict_loader.start_auto_reload(reload_interval)
+    
+    def close(self) -> None:
+        """사전 자동 재로드 스레드와 모델 실행 스레드 풀 종료 (외부에서 받은 cache 는 닫지 않음)"""
+        self.dict_loader.stop_auto_reload()
+        self.model.close()
+    
+    def __enter__(self) -> 'SpacingCorrector':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def correct(
         self, 
@@ -35,26 +105,313 @@ class SpacingCorrector:
         verbose: bool = False
     ) -> Union[str, List[str]]:
         """띄어쓰기 교정"""
+        with self.dict_loader.acquire() as snapshot:
+            return self._correct(input_data, snapshot, verbose)
+    
+    def correct_detailed(
+        self,
+        input_data: Union[str, List[str]],
+        verbose: bool = False
+    ) -> CorrectionResult:
+        """띄어쓰기 교정 결과와 사용한 사전 스냅샷 버전"""
+        with self.dict_loader.acquire() as snapshot:
+            return CorrectionResult(self._correct(input_data, snapshot, verbose), snapshot.version)
+    
+    def correct_tokens(self, tokens: List[str]) -> TokenCorrectionResult:
+        """토큰 리스트 교정 + 출력 토큰별 입력 토큰 대응"""
+        return self.batch_correct_tokens([tokens])[0]
+    
+    def batch_correct_tokens(self, inputs: List[List[str]]) -> List[TokenCorrectionResult]:
+        """토큰 리스트 배치 교정 + 출력 토큰별 입력 토큰 대응 (배치 전체가 같은 스냅샷 사용)
+        
+        대응은 토큰 단계마다 병합을 추적하여 구하므로 결과 캐시를 거치지 않는다.
+        """
+        inputs = [list(tokens) for tokens in inputs]
+        with self.dict_loader.acquire() as snapshot:
+            preprocess_results = [self._timed('preprocess', self.preprocessor.preprocess, tokens) for tokens in inputs]
+            corrected = self._timed('model_batch', self.model.correct_batch, [result.text for result in preprocess_results])
+            return [
+                TokenCorrectionResult(*self._finish_tokens(tokens, preprocess_result, text, snapshot), snapshot.version)
+                for tokens, preprocess_result, text in zip(inputs, preprocess_results, corrected)
+            ]
+    
+    def reload_dictionaries(self) -> bool:
+        """사전 파일이 바뀌었으면 새 스냅샷으로 교체 (진행 중인 요청은 이전 스냅샷으로 완료)"""
+        return self.dict_loader.reload_if_changed()
+    
+    def _correct(
+        self,
+        input_data: Union[str, List[str]],
+        snapshot: DictionarySnapshot,
+        verbose: bool = False
+    ) -> Union[str, List[str]]:
         if verbose:
             print(f"[입력 타입] {type(input_data).__name__}")
         
-        preprocess_result = self.preprocessor.preprocess(input_data)
-        corrected = self.model.correct(preprocess_result.text)
+        key = self._cache_key(input_data, snapshot) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        preprocess_result = self._timed('preprocess', self.preprocessor.preprocess, input_data)
+        corrected = self._timed('model', self.model.correct, preprocess_result.text)
+        result = self._finish(preprocess_result, corrected, verbose, snapshot)
+        
+        if key is not None:
+            self.cache.put(key, result)
+        return result
+    
+    def batch_correct(
+        self, 
+        inputs: List[Union[str, List[str]]],
+        verbose: bool = False,
+        workers: int = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        pool: str = 'process'
+    ) -> List[Union[str, List[str]]]:
+        """배치 교정 (모델 추론은 배치 단위로 한 번에 실행)
+        
+        workers > 1 이면 pool 에 따라 프로세스 풀('process') 또는 이 인스턴스를 공유하는 스레드 풀('thread') 사용
+        """
+        if workers and workers > 1:
+            return list(self.iter_batch_correct(inputs, workers, chunk_size, verbose=verbose, pool=pool))
+        
+        checks = {} if self.validator and verbose else None
+        with self.dict_loader.acquire() as snapshot:
+            results = self._batch_correct(inputs, snapshot, verbose, checks)
+        
+        if checks:
+            for i, (is_valid, warnings_list) in zip(checks, self._validate_checks(checks)):
+                if not is_valid:
+                    print(f"[검증 경고] #{i} {warnings_list}")
+        
+        return results
+    
+    def batch_correct_detailed(self, inputs: List[Union[str, List[str]]]) -> List[CorrectionResult]:
+        """배치 교정 결과와 사용한 사전 스냅샷 버전 (배치 전체가 같은 스냅샷 사용)"""
+        with self.dict_loader.acquire() as snapshot:
+            results = self._batch_correct(inputs, snapshot, False)
+        return [CorrectionResult(result, snapshot.version) for result in results]
+    
+    def batch_correct_validated(
+        self,
+        inputs: List[Union[str, List[str]]],
+        revert: bool = True
+    ) -> List[Tuple[Union[str, List[str]], bool, List[str]]]:
+        """배치 교정 + 품질 검증 - (결과, 통과 여부, 경고 목록)
+        
+        형태소 분석은 교정으로 바뀐 구간 주변만 배치 전체를 모아 한 번에 실행한다.
+        revert 이면 Kiwi 가 거부한 (미등록어 비율이 높은) 구간은 모델 입력의 띄어쓰기로 되돌린다.
+        캐시에서 가져온 결과는 원문 대비 변경 구간을 알 수 없으므로 전체를 검증하고 되돌리지 않는다.
+        """
+        checks = {}
+        with self.dict_loader.acquire() as snapshot:
+            results = self._batch_correct(inputs, snapshot, False, checks)
+        
+        for i, result in enumerate(results):
+            if i not in checks:
+                text = ' '.join(result) if isinstance(result, list) else result
+                checks[i] = (text, None, None)
+        
+        indices = sorted(checks)
+        rejected = []
+        verdicts = self._validate_checks({i: checks[i] for i in indices}, rejected)
+        
+        validated = []
+        for i, windows, (is_valid, warnings_list) in zip(indices, rejected, verdicts):
+            text, source, preprocess_result = checks[i]
+            result = results[i]
+            if revert and windows and preprocess_result is not None:
+                reverted = revert_windows(text, source, windows)
+                if reverted != text:
+                    warnings_list.append(f"형태소 검증을 통과하지 못한 구간 {len(windows)}곳의 교정을 되돌렸습니다")
+                    result = self.postprocessor.convert_to_output_format(
+                        reverted, preprocess_result.original_type, preprocess_result.placeholders
+                    )
+            validated.append((result, is_valid, warnings_list))
+        return validated
+    
+    def _batch_correct(
+        self,
+        inputs: List[Union[str, List[str]]],
+        snapshot: DictionarySnapshot,
+        verbose: bool,
+        checks: Dict[int, Tuple[str, str, PreprocessResult]] = None
+    ) -> List[Union[str, List[str]]]:
+        if verbose:
+            for input_data in inputs:
+                print(f"[입력 타입] {type(input_data).__name__}")
+        
+        keys = [self._cache_key(input_data, snapshot) for input_data in inputs] if self.cache is not None else []
+        results = [self.cache.get(key) for key in keys] if keys else [None] * len(inputs)
+        missing = [i for i, result in enumerate(results) if result is None]
         
-        corrected = self.postprocessor.postprocess_string(corrected)
-        corrected = self.postprocessor.fine_tune_spacing(corrected)
+        preprocess_results = [self._timed('preprocess', self.preprocessor.preprocess, inputs[i]) for i in missing]
+        corrected = self._timed('model_batch', self.model.correct_batch, [result.text for result in preprocess_results])
         
+        for i, preprocess_result, text in zip(missing, preprocess_results, corrected):
+            check = [] if checks is not None else None
+            results[i] = self._finish(preprocess_result, text, verbose, snapshot, check)
+            if check:
+                checks[i] = check[0]
+            if keys:
+                self.cache.put(keys[i], results[i])
+        
+        return results
+    
+    def _validate_checks(
+        self,
+        checks: Dict[int, Tuple[str, str, PreprocessResult]],
+        rejected: List[List[Tuple[int, int]]] = None
+    ) -> List[Tuple[bool, List[str]]]:
+        """(교정 문장, 모델 입력, 전처리 결과) 목록을 한 번에 검증"""
+        validator = self._quality_validator()
+        texts = [check[0] for check in checks.values()]
+        sources = [check[1] for check in checks.values()]
+        return self._timed('validate', validator.validate_batch, texts, sources, rejected)
+    
+    def _quality_validator(self) -> Validator:
+        """배치 검증기 - use_validator 가 아니면 Kiwi 검증기를 처음 쓸 때 한 번만 생성하여 재사용"""
+        if self.validator is not None:
+            return self.validator
+        if self._batch_validator is None:
+            with self._validator_lock:
+                if self._batch_validator is None:
+                    self._batch_validator = Validator(use_kiwi=True)
+        return self._batch_validator
+    
+    def correct_spans(self, text: str) -> List[SpaceEdit]:
+        """교정 결과와 입력의 차이를 입력 기준 편집 구간 목록으로 반환 (차이 계산용 편의 API)
+        
+        교정은 correct 와 같은 문자열 파이프라인으로 한 뒤 결과를 입력과 비교하므로 correct 보다 빠르지 않다.
+        """
+        return diff_spans(text, SpacingBitmap.from_text(self.correct(text)))
+    
+    def batch_correct_spans(self, texts: List[str]) -> List[List[SpaceEdit]]:
+        """배치 교정 결과를 입력별 편집 구간 목록으로 반환 (batch_correct 결과와 입력의 차이)"""
+        return [
+            diff_spans(text, SpacingBitmap.from_text(result))
+            for text, result in zip(texts, self.batch_correct(texts))
+        ]
+    
+    def iter_batch_correct(
+        self,
+        inputs: Iterable[Union[str, List[str]]],
+        workers: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        verbose: bool = False,
+        pool: str = 'process'
+    ) -> Iterator[Union[str, List[str]]]:
+        """프로세스/스레드 풀 병렬 교정 - 결과를 입력 순서대로 스트리밍"""
+        if pool == 'thread':
+            return threaded_correct(
+                lambda chunk: self.batch_correct(chunk, verbose=verbose), inputs, workers, chunk_size=chunk_size
+            )
+        if pool != 'process':
+            raise ValueError(f"지원하지 않는 pool: {pool} ('process' 또는 'thread')")
+        return parallel_correct(
+            self.config, inputs, workers, chunk_size=chunk_size, verbose=verbose,
+            cache=self.cache, profiler=self.profiler
+        )
+    
+    def correct_stream(
+        self,
+        chunks: Iterable[str],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        overlap: int = DEFAULT_OVERLAP
+    ) -> Iterator[str]:
+        """긴 문서 스트리밍 교정 (윈도 단위로 교정하여 메모리 사용량 고정)"""
+        return correct_stream(self.correct, chunks, window_size=window_size, overlap=overlap)
+    
+    def correct_filing(
+        self,
+        source: str,
+        output: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        workers: int = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Callable[[int], None] = None
+    ) -> FilingResult:
+        """공시 문서 (DART XML / HTML) 파일의 텍스트 노드와 표 셀을 교정하여 원래 마크업 그대로 기록
+        
+        progress 를 주면 읽은 바이트 수마다 호출한다.
+        """
+        def correct_batch(units):
+            return self.batch_correct(units, workers=workers, chunk_size=chunk_size)
+        
+        return correct_filing(source, output, correct_batch, batch_size=batch_size, progress=progress)
+    
+    def correct_incremental(self, doc_id: str, text: str) -> IncrementalResult:
+        """문서 수정본 교정 - 이전 수정본과 달라진 문장과 그 이웃 문장만 다시 교정"""
+        with self.dict_loader.acquire() as snapshot:
+            result = self._timed(
+                'incremental', self.documents.update, doc_id, text, self.cache_version(snapshot),
+                lambda texts: self._batch_correct(texts, snapshot, False)
+            )
+        result.dictionary_version = snapshot.version
+        return result
+    
+    def forget_document(self, doc_id: str) -> None:
+        """correct_incremental 로 보관한 문서 상태 삭제"""
+        self.documents.forget(doc_id)
+    
+    def cache_version(self, snapshot: DictionarySnapshot = None) -> str:
+        """캐시 버전 (규칙 집합, 사전 내용, 사용 모델 기준)
+        
+        스냅샷 내용과 모델 구성이 같으면 처음 계산한 값을 재사용한다 (사전을 교체하면 다시 계산).
+        """
+        if snapshot is None:
+            with self.dict_loader.acquire() as snapshot:
+                return self.cache_version(snapshot)
+        models = tuple(self.model.models)
+        memo = self._cache_version
+        if memo is not None and memo[0] == snapshot.content_hash and memo[1] == models:
+            return memo[2]
+        
+        parts = [self.postprocessor.rule_engine.version, snapshot.content_hash]
+        parts.extend(self.model.get_model_signatures())
+        version = hashlib.sha256('\x00'.join(parts).encode('utf-8')).hexdigest()[:16]
+        self._cache_version = (snapshot.content_hash, models, version)
+        return version
+    
+    def _cache_key(self, input_data: Union[str, List[str]], snapshot: DictionarySnapshot = None) -> str:
+        """정규화된 입력 + 캐시 버전 키"""
+        if isinstance(input_data, list):
+            return f"{self.cache_version(snapshot)}:list:{' '.join(' '.join(input_data).split())}"
+        return f"{self.cache_version(snapshot)}:string:{' '.join(input_data.split())}"
+    
+    def _finish(
+        self,
+        preprocess_result: PreprocessResult,
+        corrected: str,
+        verbose: bool = False,
+        snapshot: DictionarySnapshot = None,
+        check: list = None
+    ) -> Union[str, List[str]]:
+        """모델 출력에 규칙 후처리 및 출력 형식 변환 적용 (check 를 주면 검증 대상만 담고 검증은 미룸)"""
+        corrected = self.postprocessor.finish_string(corrected, snapshot)
+        
+        tokens = None
         if preprocess_result.original_type == 'list':
-            tokens = corrected.split()
-            tokens = self.postprocessor.postprocess_tokens(tokens)
-            corrected = ' '.join(tokens)
+            # 리스트 입력은 토큰 규칙 결과를 다시 이어 붙였다 나누지 않고 토큰 그대로 출력 변환
+            tokens = self.postprocessor.postprocess_tokens(corrected.split(), snapshot)
+            if check is not None or (self.validator and verbose):
+                corrected = ' '.join(tokens)
         
-        if self.validator and verbose:
-            is_valid, warnings_list = self.validator.validate(corrected)
+        if check is not None:
+            check.append((corrected, preprocess_result.text, preprocess_result))
+        elif self.validator and verbose:
+            is_valid, warnings_list = self.validator.validate(corrected, source=preprocess_result.text)
             if not is_valid:
                 print(f"[검증 경고] {warnings_list}")
         
-        result = self.postprocessor.convert_to_output_format(
+        if tokens is not None:
+            return self._timed('output', self.postprocessor.tokens_to_output, tokens, preprocess_result.placeholders)
+        
+        result = self._timed(
+            'output',
+            self.postprocessor.convert_to_output_format,
             corrected,
             preprocess_result.original_type,
             preprocess_result.placeholders
@@ -62,29 +419,98 @@ class SpacingCorrector:
         
         return result
     
-    def batch_correct(
-        self, 
-        inputs: List[Union[str, List[str]]],
-        verbose: bool = False
-    ) -> List[Union[str, List[str]]]:
-        """배치 교정"""
-        return [self.correct(input_data, verbose=verbose) for input_data in inputs]
+    def _finish_tokens(
+        self,
+        tokens: List[str],
+        preprocess_result: PreprocessResult,
+        corrected: str,
+        snapshot: DictionarySnapshot
+    ) -> Tuple[List[str], List[List[int]]]:
+        """리스트 입력의 후처리 + 출력 토큰별 입력 토큰 번호 (_finish 의 리스트 경로와 같은 결과)"""
+        corrected = self.postprocessor.finish_string(corrected, snapshot)
+        placeholders = preprocess_result.placeholders
+        
+        # 문자열 단계는 문자 순서를 바꾸지 않으므로 문자 위치로 정확히 대응
+        output = corrected.split()
+        sources = align_tokens(tokens, [Preprocessor.restore_protected_patterns(t, placeholders) for t in output])
+        output, sources = self.postprocessor.postprocess_tokens_with_sources(output, sources, snapshot)
+        
+        restored = [Preprocessor.restore_protected_patterns(t, placeholders) for t in output]
+        output = self._timed('output', self.postprocessor.tokens_to_output, output, placeholders)
+        return output, merge_sources(restored, output, sources)
+    
+    def _timed(self, stage: str, func, *args):
+        """프로파일링이 켜져 있으면 단계 소요 시간 기록"""
+        if self.profiler is None:
+            return func(*args)
+        return self.profiler.timed('stage', stage, func, *args)
+    
+    def warmup(self) -> List[str]:
+        """모델과 지연 초기화 자원을 미리 준비하고 사용 가능한 모델 이름 반환"""
+        _ = self.dict_loader.term_index()
+        return self.model.warmup()
     
     def get_info(self) -> dict:
         """시스템 정보"""
+        with self.dict_loader.acquire() as snapshot:
+            dictionaries = {
+                'compound_nouns': len(snapshot.compound_nouns),
+                'financial_terms': len(snapshot.financial_terms),
+                'legal_terms': len(snapshot.legal_terms),
+                'proper_nouns': len(snapshot.proper_nouns),
+            }
         return {
             'models': self.model.get_available_models() if self.model else [],
-            'dictionaries': {
-                'compound_nouns': len(self.dict_loader.compound_nouns),
-                'financial_terms': len(self.dict_loader.financial_terms),
-                'legal_terms': len(self.dict_loader.legal_terms),
-                'proper_nouns': len(self.dict_loader.proper_nouns),
-            },
+            'dictionaries': dictionaries,
+            'dictionary_version': snapshot.version,
             'validator_enabled': self.validator is not None,
+            'cache': self.cache.stats() if self.cache is not None else None,
+            'rules': self.postprocessor.rule_engine.stats() if self.profiler is not None else None,
+            'profiling_enabled': self.profiler is not None,
         }
+    
+    def get_stats(self) -> dict:
+        """단계/규칙별 실행 통계 (profile=True 일 때만 수집)"""
+        return self.profiler.stats() if self.profiler is not None else {}
+    
+    def reset_stats(self) -> None:
+        """프로파일 통계와 규칙별 적용/건너뜀 횟수 초기화"""
+        self.postprocessor.rule_engine.reset_stats()
+        if self.profiler is not None:
+            self.profiler.reset()
+    
+    def export_metrics(self, prefix: str = 'spacing') -> str:
+        """실행 통계를 Prometheus 텍스트 형식으로 반환"""
+        return self.profiler.to_prometheus(prefix) if self.profiler is not None else ''
+
+
+_shared_correctors: Dict[Tuple, SpacingCorrector] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_corrector(**kwargs) -> SpacingCorrector:
+    """설정별 공유 SpacingCorrector (최초 요청 시 생성 후 재사용)"""
+    bound = inspect.signature(SpacingCorrector).bind(**kwargs)
+    bound.apply_defaults()
+    key = tuple(bound.arguments.items())
+    
+    with _shared_lock:
+        corrector = _shared_correctors.get(key)
+        if corrector is None:
+            corrector = _shared_correctors[key] = SpacingCorrector(**kwargs)
+    return corrector
+
+
+def clear_shared_correctors() -> None:
+    """공유 인스턴스 레지스트리 초기화 (등록된 인스턴스는 close)"""
+    with _shared_lock:
+        correctors = list(_shared_correctors.values())
+        _shared_correctors.clear()
+    for corrector in correctors:
+        corrector.close()
 
 
 def correct_spacing(input_data: Union[str, List[str]], **kwargs) -> Union[str, List[str]]:
     """띄어쓰기 교정 간편 함수"""
-    corrector = SpacingCorrector(**kwargs)
+    corrector = get_shared_corrector(**kwargs)
     return corrector.correct(input_data)
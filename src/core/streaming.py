@@ -0,0 +1,130 @@
+"""
+스트리밍 교정 모듈 - 긴 문서를 문장/윈도 단위로 나누어 교정하고 경계를 이어 붙임
+"""
+import re
+from typing import Callable, Iterable, Iterator
+
+
+DEFAULT_WINDOW_SIZE = 1000
+DEFAULT_OVERLAP = 64
+
+SENTENCE_END = re.compile(r'(?<=[^\d\s][.!?])\s')
+
+
+def _index_after_nonspace(text: str, count: int) -> int:
+    """count 번째 공백 아닌 문자 바로 뒤의 인덱스"""
+    if count == 0:
+        return 0
+    seen = 0
+    for i, ch in enumerate(text):
+        if not ch.isspace():
+            seen += 1
+            if seen == count:
+                return i + 1
+    return len(text)
+
+
+def _count_nonspace(text: str) -> int:
+    return len(text) - sum(1 for ch in text if ch.isspace())
+
+
+class WindowStitcher:
+    """한 줄의 텍스트를 겹치는 윈도 단위로 교정하여 이어 붙임
+    
+    각 윈도는 앞뒤로 overlap 문자만큼의 문맥과 함께 교정하고,
+    공백이 아닌 문자 수를 기준으로 윈도 본문에 해당하는 구간만 잘라낸다.
+    """
+    
+    def __init__(
+        self,
+        correct: Callable[[str], str],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        overlap: int = DEFAULT_OVERLAP
+    ):
+        if window_size <= 0 or overlap < 0:
+            raise ValueError("window_size 는 양수, overlap 은 0 이상이어야 합니다")
+        self._correct = correct
+        self.window_size = window_size
+        self.overlap = overlap
+        self._buffer = ''
+        self._left_context = ''
+        self._last_char = ''
+        self._started = False
+    
+    def feed(self, text: str) -> Iterator[str]:
+        """텍스트를 버퍼에 추가하고 문맥이 확보된 윈도를 교정하여 반환"""
+        self._buffer += text
+        while len(self._buffer) >= self.window_size + self.overlap:
+            yield from self._emit(self._choose_cut())
+    
+    def flush(self) -> Iterator[str]:
+        """줄 끝: 남은 버퍼를 모두 교정하고 상태 초기화"""
+        while self._buffer:
+            cut = self._choose_cut() if len(self._buffer) > self.window_size else len(self._buffer)
+            yield from self._emit(cut)
+        self._left_context = ''
+        self._last_char = ''
+        self._started = False
+    
+    def _choose_cut(self) -> int:
+        """윈도 뒤쪽 절반에서 문장 끝, 없으면 공백, 없으면 window_size 위치에서 자름"""
+        lower = max(self.window_size // 2, 1)
+        window = self._buffer[:self.window_size]
+        
+        sentence_ends = [m.start() for m in SENTENCE_END.finditer(window, lower)]
+        if sentence_ends:
+            return sentence_ends[-1]
+        
+        for i in range(len(window) - 1, lower - 1, -1):
+            if window[i].isspace():
+                return i
+        return self.window_size
+    
+    def _emit(self, cut: int) -> Iterator[str]:
+        body = self._buffer[:cut]
+        right = self._buffer[cut:cut + self.overlap]
+        left = self._left_context
+        
+        self._buffer = self._buffer[cut:]
+        self._left_context = (left + body)[-self.overlap:] if self.overlap else ''
+        raw_gap = self._last_char.isspace() or body[0].isspace()
+        self._last_char = body[-1]
+        
+        if not body.strip():
+            return
+        
+        n_left, n_body = _count_nonspace(left), _count_nonspace(body)
+        corrected = self._correct(left + body + right)
+        
+        if _count_nonspace(corrected) != n_left + n_body + _count_nonspace(right):
+            piece = self._correct(body)
+            gap = raw_gap
+        else:
+            start = _index_after_nonspace(corrected, n_left)
+            end = _index_after_nonspace(corrected, n_left + n_body)
+            piece = corrected[start:end]
+            gap = piece[:1].isspace() if n_left else raw_gap
+            piece = piece.lstrip()
+        
+        yield (' ' if gap and self._started else '') + piece
+        self._started = True
+
+
+def correct_stream(
+    correct: Callable[[str], str],
+    chunks: Iterable[str],
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    overlap: int = DEFAULT_OVERLAP
+) -> Iterator[str]:
+    """텍스트 조각 스트림을 교정하여 순서대로 반환 (줄바꿈은 보존)"""
+    stitcher = WindowStitcher(correct, window_size, overlap)
+    
+    for chunk in chunks:
+        lines = chunk.split('\n')
+        for line in lines[:-1]:
+            yield from stitcher.feed(line)
+            yield from stitcher.flush()
+            yield '\n'
+        yield from stitcher.feed(lines[-1])
+    
+    yield from stitcher.flush()
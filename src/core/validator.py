@@ -3,33 +3,101 @@
 """
 import re
 import warnings
-from typing import List, Tuple
+from typing import List, Optional, Sequence, Tuple
+from utils.spacing_bitmap import SpacingBitmap, diff_spans
+
+
+DEFAULT_WINDOW = 16
+UNKNOWN_RATIO = 0.3
+
+
+def changed_windows(source: Optional[str], text: str, window: int = DEFAULT_WINDOW) -> List[Tuple[int, int]]:
+    """text 에서 source 대비 띄어쓰기가 바뀐 위치 주변 구간 (어절 경계까지 확장, 겹치면 병합)
+    
+    source 가 없으면 전체를 한 구간으로 본다.
+    """
+    if source is None:
+        return [(0, len(text))] if text.strip() else []
+    
+    windows = []
+    for edit in diff_spans(text, SpacingBitmap.from_text(source)):
+        start = max(edit.start - window, 0)
+        end = min(edit.end + window, len(text))
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        while end < len(text) and not text[end].isspace():
+            end += 1
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], end))
+        else:
+            windows.append((start, end))
+    
+    return [(start, end) for start, end in windows if text[start:end].strip()]
+
+
+def revert_windows(text: str, source: Optional[str], windows: Sequence[Tuple[int, int]]) -> str:
+    """text 의 [start, end) 구간 안쪽 띄어쓰기를 source 의 띄어쓰기로 되돌림
+    
+    구간 경계의 공백은 그대로 두며, 공백 아닌 문자가 source 와 다르면 되돌리지 않는다.
+    """
+    if source is None or not windows:
+        return text
+    corrected = SpacingBitmap.from_text(text)
+    original = SpacingBitmap.from_text(source)
+    if corrected.chars != original.chars:
+        return text
+    
+    for start, end in windows:
+        first = len(''.join(text[:start].split()))
+        last = first + len(''.join(text[start:end].split())) - 1
+        corrected.spaces[first:last] = original.spaces[first:last]
+    return corrected.to_text()
 
 
 class Validator:
-    """띄어쓰기 결과 검증"""
+    """띄어쓰기 결과 검증
     
-    def __init__(self, use_kiwi: bool = False):
+    형태소 분석 검증은 교정으로 띄어쓰기가 바뀐 구간 주변 window 글자만 분석하며,
+    validate_batch 는 배치 전체의 구간을 Kiwi 의 다중 텍스트 분석 한 번으로 처리한다.
+    """
+    
+    def __init__(self, use_kiwi: bool = False, num_workers: int = None, window: int = DEFAULT_WINDOW):
         self.use_kiwi = use_kiwi
+        self.window = window
         self._kiwi = None
         
         if use_kiwi:
             try:
                 from kiwipiepy import Kiwi
-                self._kiwi = Kiwi()
+                self._kiwi = Kiwi(num_workers=num_workers) if num_workers is not None else Kiwi()
             except ImportError:
                 warnings.warn("Kiwi를 불러올 수 없습니다.")
                 self.use_kiwi = False
     
-    def validate(self, text: str) -> Tuple[bool, List[str]]:
-        """띄어쓰기 결과 검증"""
-        warnings_list = []
-        warnings_list.extend(self._basic_validation(text))
+    def validate(self, text: str, source: str = None) -> Tuple[bool, List[str]]:
+        """띄어쓰기 결과 검증 (source 를 주면 바뀐 구간 주변만 형태소 분석)"""
+        return self.validate_batch([text], [source])[0]
+    
+    def validate_batch(
+        self,
+        texts: Sequence[str],
+        sources: Sequence[Optional[str]] = None,
+        rejected: List[List[Tuple[int, int]]] = None
+    ) -> List[Tuple[bool, List[str]]]:
+        """배치 검증 - 모든 문장의 변경 구간을 모아 Kiwi 로 한 번에 분석
         
+        rejected 에 빈 목록을 주면 미등록어 비율을 넘은 변경 구간을 문장별로 채운다.
+        """
+        sources = sources if sources is not None else [None] * len(texts)
+        results = [self._basic_validation(text) for text in texts]
+        
+        if rejected is not None:
+            rejected[:] = [[] for _ in texts]
         if self.use_kiwi and self._kiwi:
-            warnings_list.extend(self._morphological_validation(text))
+            for i, warning in self._morphological_validation_batch(texts, sources, rejected):
+                results[i].append(warning)
         
-        return (len(warnings_list) == 0, warnings_list)
+        return [(not warnings_list, warnings_list) for warnings_list in results]
     
     def _basic_validation(self, text: str) -> List[str]:
         """기본 검증"""
@@ -50,22 +118,44 @@ class Validator:
         return warnings
     
     def _morphological_validation(self, text: str) -> List[str]:
-        """형태소 분석 기반 검증"""
-        warnings = []
+        """형태소 분석 기반 검증 (문장 전체)"""
+        return [warning for _, warning in self._morphological_validation_batch([text], [None])]
+    
+    def _morphological_validation_batch(
+        self,
+        texts: Sequence[str],
+        sources: Sequence[Optional[str]],
+        rejected: List[List[Tuple[int, int]]] = None
+    ) -> List[Tuple[int, str]]:
+        """변경 구간별 미등록어 비율 검사 - (문장 번호, 경고) 목록"""
+        owners = []
+        windows = []
+        for i, (text, source) in enumerate(zip(texts, sources)):
+            for window in changed_windows(source, text, self.window):
+                owners.append(i)
+                windows.append(window)
         
-        if not self._kiwi:
-            return warnings
+        if not windows:
+            return []
         
+        segments = [texts[owner][start:end] for owner, (start, end) in zip(owners, windows)]
+        unknown = [0] * len(texts)
+        total = [0] * len(texts)
         try:
-            result = self._kiwi.analyze(text)
-            if not result:
-                return warnings
-            
-            tokens = result[0][0]
-            unknown_count = sum(1 for token in tokens if token.tag == 'UN')
-            if unknown_count > len(tokens) * 0.3:
-                warnings.append(f"미등록어가 많습니다 ({unknown_count}/{len(tokens)})")
+            for owner, window, result in zip(owners, windows, self._kiwi.analyze(segments)):
+                if not result:
+                    continue
+                tokens = result[0][0]
+                window_unknown = sum(1 for token in tokens if token.tag == 'UN')
+                unknown[owner] += window_unknown
+                total[owner] += len(tokens)
+                if rejected is not None and window_unknown > len(tokens) * UNKNOWN_RATIO:
+                    rejected[owner].append(window)
         except Exception as e:
-            warnings.append(f"형태소 분석 중 오류: {str(e)}")
+            return [(i, f"형태소 분석 중 오류: {str(e)}") for i in sorted(set(owners))]
         
-        return warnings
+        return [
+            (i, f"미등록어가 많습니다 ({unknown[i]}/{total[i]})")
+            for i in range(len(texts))
+            if total[i] and unknown[i] > total[i] * UNKNOWN_RATIO
+        ]
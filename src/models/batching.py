@@ -0,0 +1,71 @@
+"""
+배치 추론 유틸리티
+"""
+import re
+from typing import Callable, Iterator, List, Sequence, Tuple
+
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_LENGTH = 198
+
+
+def split_by_length(text: str, max_length: int) -> List[str]:
+    """모델 입력 최대 길이 단위로 분할"""
+    if len(text) <= max_length:
+        return [text]
+    return [text[i:i + max_length] for i in range(0, len(text), max_length)]
+
+
+def length_buckets(lengths: Sequence[int], max_batch_size: int) -> Iterator[List[int]]:
+    """길이순으로 정렬한 인덱스를 max_batch_size 단위 버킷으로 분할 (패딩 최소화)"""
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    for start in range(0, len(order), max_batch_size):
+        yield order[start:start + max_batch_size]
+
+
+def flatten_chunks(texts: Sequence[str], max_length: int) -> Tuple[List[str], List[int]]:
+    """입력별 청크를 평탄화하고 각 청크의 원래 입력 인덱스를 기록"""
+    chunks, owners = [], []
+    for idx, text in enumerate(texts):
+        for chunk in split_by_length(text, max_length):
+            chunks.append(chunk)
+            owners.append(idx)
+    return chunks, owners
+
+
+def decode_spacing(sequence: str, boundaries) -> str:
+    """문자별 띄어쓰기 예측을 문장으로 복원"""
+    chars = []
+    for ch, space_after in zip(sequence, boundaries):
+        chars.append(ch)
+        if space_after:
+            chars.append(' ')
+    text = re.sub(r'\s+', ' ', ''.join(chars).replace('^', ' '))
+    return text.replace('«', '').replace('»', '')
+
+
+def predict_spacing(
+    texts: Sequence[str],
+    max_batch_size: int,
+    max_length: int,
+    predict: Callable[[List[str]], Sequence]
+) -> List[str]:
+    """PyKoSpacing 계열 문자 단위 모델의 배치 교정
+    
+    입력을 max_length 청크로 나눠 '«...»' 시퀀스(공백은 '^')로 만들고, 길이별 버킷마다
+    predict(시퀀스 목록) 이 돌려준 문자별 띄어쓰기 확률로 문장을 복원해 입력별로 이어 붙인다.
+    """
+    chunks, owners = flatten_chunks(texts, max_length)
+    sequences = ['«' + chunk.replace(' ', '^') + '»' for chunk in chunks]
+    spaced = [''] * len(chunks)
+    
+    for bucket in length_buckets([len(seq) for seq in sequences], max_batch_size):
+        probs = predict([sequences[i] for i in bucket])
+        for row, idx in enumerate(bucket):
+            boundaries = probs[row][:len(sequences[idx])] > 0.5
+            spaced[idx] = decode_spacing(sequences[idx], boundaries)
+    
+    results = [''] * len(texts)
+    for idx, chunk in zip(owners, spaced):
+        results[idx] += chunk
+    return [result.strip() for result in results]
@@ -2,39 +2,175 @@
 앙상블 모델
 """
 import re
-from typing import List
+import threading
+import warnings
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
 from models.pykospacing_model import PyKoSpacingModel
 from models.kospacing_model import KoSpacingModel
+from models.kiwi_model import KiwiSpacingModel
+from models.exported_model import ExportedSpacingModel
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH
+from utils.spacing_bitmap import SpacingBitmap
 
 
 class EnsembleModel:
     """띄어쓰기 교정 모델 앙상블"""
     
-    def __init__(self, use_pykospacing: bool = True, use_kospacing: bool = False):
+    DEFAULT_WEIGHTS = {'pykospacing': 1.0, 'pykospacing_exported': 1.0, 'kospacing': 1.0, 'kiwi': 1.0}
+    
+    def __init__(
+        self,
+        use_pykospacing: bool = True,
+        use_kospacing: bool = False,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH,
+        weights: Dict[str, float] = None,
+        use_kiwi: bool = False,
+        exported_model: str = None
+    ):
         self.models = []
+        self.max_batch_size = max_batch_size
+        self.max_length = max_length
+        self.weights = {**self.DEFAULT_WEIGHTS, **(weights or {})}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         
-        if use_pykospacing:
-            pyk = PyKoSpacingModel()
-            if pyk.is_available():
-                self.models.append(('pykospacing', pyk))
+        if use_pykospacing and exported_model:
+            # 내보낸 네트워크 경로가 있으면 TensorFlow 없이 같은 모델을 실행
+            exported = ExportedSpacingModel(exported_model)
+            if exported.is_installed():
+                self.models.append(('pykospacing_exported', exported))
+            else:
+                warnings.warn(
+                    f"내보낸 모델을 불러올 수 없어 PyKoSpacing 으로 대체합니다 "
+                    f"(모델/어휘 파일 또는 런타임 없음): {exported_model}"
+                )
+                self._add_pykospacing()
+        elif use_pykospacing:
+            self._add_pykospacing()
         
         if use_kospacing:
             kos = KoSpacingModel()
-            if kos.is_available():
+            if kos.is_installed():
                 self.models.append(('kospacing', kos))
+        
+        if use_kiwi:
+            kiwi = KiwiSpacingModel()
+            if kiwi.is_installed():
+                self.models.append(('kiwi', kiwi))
+    
+    def _add_pykospacing(self) -> None:
+        pyk = PyKoSpacingModel()
+        if pyk.is_installed():
+            self.models.append(('pykospacing', pyk))
     
     def correct(self, text: str, method: str = 'vote') -> str:
         """교정 실행"""
-        if not self.models:
+        models = self._active_models()
+        if not models:
             return re.sub(r'\s+', ' ', text).strip()
         
-        if len(self.models) == 1:
-            _, model = self.models[0]
+        if len(models) == 1:
+            _, model = models[0]
             result = model.correct(text)
             return result if result else text
         
-        results = [model.correct(text) for _, model in self.models if model.correct(text)]
-        return results[0] if results else text
+        outputs = self._run_models(models, lambda model: model.correct(text))
+        return self._combine(text, {name: output for name, output in outputs}, method)
+    
+    def correct_batch(self, texts: List[str], method: str = 'vote') -> List[str]:
+        """배치 교정 실행 (입력 순서 유지, 중복 입력은 한 번만 추론)"""
+        models = self._active_models()
+        if not models:
+            return [re.sub(r'\s+', ' ', text).strip() for text in texts]
+        
+        unique = list(dict.fromkeys(texts))
+        outputs = self._run_models(models, lambda model: model.correct_batch(
+            unique,
+            max_batch_size=self.max_batch_size,
+            max_length=self.max_length
+        ))
+        
+        if len(models) == 1:
+            _, results = outputs[0]
+            corrected = {text: result if result else text for text, result in zip(unique, results)}
+        else:
+            corrected = {
+                text: self._combine(text, {name: results[i] for name, results in outputs}, method)
+                for i, text in enumerate(unique)
+            }
+        
+        return [corrected[text] for text in texts]
     
     def get_available_models(self) -> List[str]:
         return [name for name, _ in self.models]
+    
+    def get_model_signatures(self) -> List[str]:
+        """캐시 버전용 모델 식별자 (내보낸 모델은 형식, 양자화 여부, 파일까지 포함)"""
+        return [
+            f"{name}:{model.signature()}" if hasattr(model, 'signature') else name
+            for name, model in self.models
+        ]
+    
+    def warmup(self) -> List[str]:
+        """모든 모델을 미리 로드하고 사용 가능한 모델 이름 반환"""
+        return [name for name, _ in self._active_models()]
+    
+    def close(self) -> None:
+        """모델 실행 스레드 풀 종료"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
+    def _active_models(self) -> List[Tuple[str, object]]:
+        """로드에 성공한 모델 (첫 호출 시 모델 로드)"""
+        return [(name, model) for name, model in self.models if model.is_available()]
+    
+    def _run_models(self, models: List[Tuple[str, object]], call: Callable) -> List[Tuple[str, object]]:
+        """모델을 스레드 풀에서 동시에 실행 (모델별 1회 호출)"""
+        if len(models) == 1:
+            name, model = models[0]
+            return [(name, call(model))]
+        
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.models),
+                    thread_name_prefix='spacing-model'
+                )
+            executor = self._executor
+        
+        futures = [(name, executor.submit(call, model)) for name, model in models]
+        return [(name, future.result()) for name, future in futures]
+    
+    def _combine(self, text: str, outputs: Dict[str, Optional[str]], method: str) -> str:
+        if method == 'first':
+            results = [output for output in outputs.values() if output]
+            return results[0] if results else text
+        return self._vote(text, outputs)
+    
+    def _vote(self, text: str, outputs: Dict[str, Optional[str]]) -> str:
+        """문자 사이 띄어쓰기 여부를 모델 가중치로 다수결 (동률이면 입력 유지)"""
+        bitmap = SpacingBitmap.from_text(text)
+        scores = np.zeros(len(bitmap.spaces))
+        voters = 0
+        
+        for name, output in outputs.items():
+            if not output:
+                continue
+            candidate = SpacingBitmap.from_text(output)
+            if candidate.chars != bitmap.chars:
+                continue
+            
+            weight = self.weights.get(name, 1.0)
+            scores += np.where(candidate.spaces, weight, -weight)
+            voters += 1
+        
+        if not voters:
+            return text
+        
+        bitmap.spaces = np.where(scores != 0, scores > 0, bitmap.spaces)
+        return bitmap.to_text()
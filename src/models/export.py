@@ -0,0 +1,124 @@
+"""
+PyKoSpacing 네트워크 내보내기 - Keras 모델을 TFLite / ONNX 정적 그래프로 변환 (선택적 int8 양자화)
+
+TensorFlow 와 pykospacing 은 내보낼 때만 필요하다. 결과 파일은 ExportedSpacingModel 이
+tflite_runtime / onnxruntime 으로 불러온다.
+
+실행: python src/models/export.py -o data/models/pykospacing.tflite [--quantize]
+"""
+import json
+from pathlib import Path
+from typing import Dict, List
+
+
+FORMATS = ('tflite', 'onnx')
+UNKNOWN_PROBE = '\uffff'  # 어휘에 없는 문자 - 미등록 문자 인덱스 확인용
+
+
+def export_pykospacing(output: str, quantize: bool = False) -> Path:
+    """번들된 PyKoSpacing 네트워크를 output 확장자(.tflite / .onnx) 형식으로 저장
+    
+    quantize 이면 가중치를 int8 로 동적 양자화한다. 어휘 파일(<output>.vocab.json)을 함께 기록한다.
+    """
+    from pykospacing import Spacing
+    from pykospacing.embedding_maker import encoding_and_padding
+    from models.exported_model import vocab_path
+    
+    output = Path(output)
+    fmt = output.suffix.lstrip('.')
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식입니다: {output.suffix} (.tflite 또는 .onnx)")
+    
+    spacing = Spacing()
+    model = spacing._model
+    output.parent.mkdir(parents=True, exist_ok=True)
+    
+    if fmt == 'tflite':
+        _export_tflite(model, output, quantize)
+    else:
+        _export_onnx(model, output, quantize)
+    
+    unknown = encoding_and_padding(
+        word2idx_dic=spacing._w2idx, sequences=[UNKNOWN_PROBE], maxlen=1, padding='post', truncating='post'
+    )
+    vocab = {
+        'format': fmt,
+        'quantized': quantize,
+        'maxlen': model.input_shape[1] if model.input_shape else None,
+        'unknown_index': int(unknown[0][0]),
+        'w2idx': {ch: int(idx) for ch, idx in spacing._w2idx.items()},
+    }
+    with open(vocab_path(output), 'w', encoding='utf-8') as f:
+        json.dump(vocab, f, ensure_ascii=False)
+    return output
+
+
+def _export_tflite(model, output: Path, quantize: bool) -> None:
+    import tensorflow as tf
+    
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    # tflite_runtime 에는 Flex(SELECT_TF_OPS) 델리게이트가 없으므로 기본 연산자로만 변환한다
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS]
+    if quantize:
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    output.write_bytes(converter.convert())
+
+
+def _export_onnx(model, output: Path, quantize: bool) -> None:
+    import tensorflow as tf
+    import tf2onnx
+    
+    spec = (tf.TensorSpec((None,) + tuple(model.input_shape[1:]), model.inputs[0].dtype, name='input'),)
+    if not quantize:
+        tf2onnx.convert.from_keras(model, input_signature=spec, opset=13, output_path=str(output))
+        return
+    
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    float_path = output.with_name(output.stem + '.float.onnx')
+    tf2onnx.convert.from_keras(model, input_signature=spec, opset=13, output_path=str(float_path))
+    quantize_dynamic(str(float_path), str(output), weight_type=QuantType.QInt8)
+    float_path.unlink()
+
+
+def check_parity(texts: List[str], reference, candidate) -> Dict[str, float]:
+    """두 모델 출력 비교 - 문장 일치율과 reference 기준 글자 경계 F1"""
+    from utils.metrics import calculate_metrics
+    
+    expected = reference.correct_batch(texts)
+    actual = candidate.correct_batch(texts)
+    pairs = [(a or '', e) for a, e in zip(actual, expected) if e is not None]
+    if not pairs:
+        raise RuntimeError("기준 모델 출력이 없습니다 (pykospacing 설치 확인)")
+    
+    metrics = calculate_metrics([a for a, _ in pairs], [e for _, e in pairs])
+    return {'sentences': len(pairs), 'agreement': metrics.accuracy, 'boundary_f1': metrics.char_f1}
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    
+    from models.exported_model import ExportedSpacingModel
+    from models.pykospacing_model import PyKoSpacingModel
+    
+    parser = argparse.ArgumentParser(description="PyKoSpacing 네트워크를 TFLite / ONNX 로 내보내기")
+    parser.add_argument('--output', '-o', required=True, help="출력 경로 (.tflite 또는 .onnx)")
+    parser.add_argument('--quantize', action='store_true', help="int8 동적 양자화")
+    parser.add_argument('--min-agreement', type=float, default=0.99, help="원본 모델과의 최소 문장 일치율")
+    args = parser.parse_args()
+    
+    path = export_pykospacing(args.output, quantize=args.quantize)
+    print(path)
+    
+    data_path = Path(__file__).parent.parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        examples = json.load(f)
+    texts = [' '.join(ex['input']) if isinstance(ex['input'], list) else ex['input'] for ex in examples]
+    
+    parity = check_parity(texts, PyKoSpacingModel(), ExportedSpacingModel(path))
+    print(f"일치율 {parity['agreement']:.1%}, 경계 F1 {parity['boundary_f1']:.1%} ({parity['sentences']}문장)")
+    if parity['agreement'] < args.min_agreement:
+        sys.exit(1)
@@ -0,0 +1,171 @@
+"""
+내보낸 PyKoSpacing 네트워크 래퍼 (TFLite / ONNX, TensorFlow 불필요)
+"""
+import importlib.util
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH, predict_spacing
+
+
+RUNTIMES = {
+    '.tflite': ('tflite_runtime', 'ai_edge_litert'),
+    '.onnx': ('onnxruntime',),
+}
+
+
+def vocab_path(model_path) -> Path:
+    """모델 파일과 함께 저장하는 어휘 파일 경로 (model.tflite -> model.tflite.vocab.json)"""
+    model_path = Path(model_path)
+    return model_path.with_name(model_path.name + '.vocab.json')
+
+
+def encode_sequences(sequences: List[str], w2idx: Dict[str, int], unknown_index: int, maxlen: int) -> np.ndarray:
+    """문자열을 어휘 인덱스 행렬로 변환 (뒤쪽 0 패딩/절단, pykospacing encoding_and_padding 과 동일)"""
+    matrix = np.zeros((len(sequences), maxlen), dtype=np.int32)
+    for row, sequence in enumerate(sequences):
+        indices = [w2idx.get(ch, unknown_index) for ch in sequence[:maxlen]]
+        matrix[row, :len(indices)] = indices
+    return matrix
+
+
+class ExportedSpacingModel:
+    """models/export.py 로 내보낸 PyKoSpacing 네트워크를 경량 런타임으로 실행
+    
+    .tflite 는 tflite_runtime (또는 ai_edge_litert), .onnx 는 onnxruntime 으로 불러오며
+    전처리와 복원은 PyKoSpacingModel 배치 경로와 같은 predict_spacing 을 쓴다.
+    """
+    
+    def __init__(self, model_path: str, lazy: bool = True, num_threads: int = None):
+        self.model_path = Path(model_path)
+        self.num_threads = num_threads
+        self.format = self.model_path.suffix.lstrip('.')
+        self._runner = None
+        self._w2idx: Dict[str, int] = {}
+        self._unknown_index = 0
+        self._fixed_length: Optional[int] = None
+        self._quantized = False
+        self._available = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self.warmup()
+    
+    @property
+    def package(self) -> Optional[str]:
+        """설치된 런타임 패키지 이름 (없으면 None)"""
+        for package in RUNTIMES.get(self.model_path.suffix, ()):
+            if importlib.util.find_spec(package) is not None:
+                return package
+        return None
+    
+    def _load_model(self):
+        try:
+            with open(vocab_path(self.model_path), 'r', encoding='utf-8') as f:
+                vocab = json.load(f)
+            self._w2idx = vocab['w2idx']
+            self._unknown_index = vocab['unknown_index']
+            self._fixed_length = vocab.get('maxlen')
+            self._quantized = bool(vocab.get('quantized'))
+            self._runner = self._load_runner()
+            self._available = True
+        except (ImportError, Exception):
+            pass
+    
+    def _load_runner(self):
+        """입력 행렬 -> 문자별 띄어쓰기 확률 (batch, length) 을 돌려주는 함수"""
+        if self.model_path.suffix == '.onnx':
+            import onnxruntime
+            options = onnxruntime.SessionOptions()
+            if self.num_threads:
+                options.intra_op_num_threads = self.num_threads
+            session = onnxruntime.InferenceSession(
+                str(self.model_path), options, providers=['CPUExecutionProvider']
+            )
+            model_input = session.get_inputs()[0]
+            input_dtype = np.int64 if 'int64' in model_input.type else np.float32
+            
+            def run(matrix):
+                return session.run(None, {model_input.name: matrix.astype(input_dtype)})[0]
+            
+            return run
+        
+        if self.package == 'ai_edge_litert':
+            from ai_edge_litert.interpreter import Interpreter
+        else:
+            from tflite_runtime.interpreter import Interpreter
+        interpreter = Interpreter(model_path=str(self.model_path), num_threads=self.num_threads)
+        input_detail = interpreter.get_input_details()[0]
+        output_index = interpreter.get_output_details()[0]['index']
+        lock = threading.Lock()
+        
+        def run(matrix):
+            # 인터프리터는 스레드 안전하지 않으므로 입력 크기 조정부터 결과 복사까지 잠근다
+            with lock:
+                if tuple(input_detail['shape']) != matrix.shape:
+                    interpreter.resize_tensor_input(input_detail['index'], matrix.shape)
+                    interpreter.allocate_tensors()
+                    input_detail['shape'] = np.array(matrix.shape)
+                interpreter.set_tensor(input_detail['index'], matrix.astype(input_detail['dtype']))
+                interpreter.invoke()
+                return interpreter.get_tensor(output_index).copy()
+        
+        interpreter.allocate_tensors()
+        return run
+    
+    def signature(self) -> str:
+        """캐시 버전용 식별자 - 형식, 양자화 여부, 모델 파일 경로와 수정 시각"""
+        self.warmup()
+        try:
+            mtime = self.model_path.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        precision = 'int8' if self._quantized else 'float'
+        return f"{self.format}:{precision}:{self.model_path.resolve()}:{mtime}"
+    
+    def is_installed(self) -> bool:
+        """모델 파일과 런타임 패키지가 있는지 (모델을 불러오지 않고 확인)"""
+        return self.model_path.exists() and vocab_path(self.model_path).exists() and self.package is not None
+    
+    def warmup(self) -> bool:
+        """모델 로드 (최초 사용 시 1회)"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_model()
+                    self._loaded = True
+        return self._available
+    
+    def is_available(self) -> bool:
+        return self.warmup()
+    
+    def supports_batch(self) -> bool:
+        return self.warmup()
+    
+    def correct(self, text: str) -> Optional[str]:
+        return self.correct_batch([text])[0]
+    
+    def correct_batch(
+        self,
+        texts: List[str],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH
+    ) -> List[Optional[str]]:
+        """길이별 버킷 단위로 패딩하여 한 번의 추론으로 교정"""
+        if not self.warmup():
+            return [None] * len(texts)
+        
+        try:
+            return self._predict_batch(texts, max_batch_size, max_length)
+        except Exception:
+            return [None] * len(texts)
+    
+    def _predict_batch(self, texts: List[str], max_batch_size: int, max_length: int) -> List[str]:
+        def predict(batch: List[str]):
+            maxlen = self._fixed_length or max(len(seq) for seq in batch)
+            matrix = encode_sequences(batch, self._w2idx, self._unknown_index, maxlen)
+            return np.asarray(self._runner(matrix)).reshape(len(batch), maxlen)
+        
+        return predict_spacing(texts, max_batch_size, max_length, predict)
@@ -0,0 +1,77 @@
+"""
+Kiwi 띄어쓰기 모델 래퍼
+"""
+import importlib.util
+import threading
+from typing import List, Optional
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH
+
+
+class KiwiSpacingModel:
+    """kiwipiepy 의 네이티브 띄어쓰기 (TensorFlow 불필요, CPU 전용 배포용)
+    
+    num_workers 를 주면 Kiwi 가 배치 입력을 여러 스레드에서 처리한다 (0 이면 모든 코어).
+    """
+    
+    PACKAGE = 'kiwipiepy'
+    
+    def __init__(self, lazy: bool = True, num_workers: int = None, reset_whitespace: bool = True):
+        self.num_workers = num_workers
+        self.reset_whitespace = reset_whitespace
+        self._kiwi = None
+        self._available = False
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self.warmup()
+    
+    def _load_model(self):
+        try:
+            from kiwipiepy import Kiwi
+            self._kiwi = Kiwi(num_workers=self.num_workers) if self.num_workers is not None else Kiwi()
+            self._available = True
+        except (ImportError, Exception):
+            pass
+    
+    def is_installed(self) -> bool:
+        """패키지 설치 여부 (모델을 불러오지 않고 확인)"""
+        return importlib.util.find_spec(self.PACKAGE) is not None
+    
+    def warmup(self) -> bool:
+        """모델 로드 (최초 사용 시 1회)"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_model()
+                    self._loaded = True
+        return self._available
+    
+    def is_available(self) -> bool:
+        return self.warmup()
+    
+    def supports_batch(self) -> bool:
+        return self.warmup()
+    
+    def correct(self, text: str) -> Optional[str]:
+        if not self.warmup() or not self._kiwi:
+            return None
+        
+        try:
+            return self._kiwi.space(text, reset_whitespace=self.reset_whitespace)
+        except Exception:
+            return None
+    
+    def correct_batch(
+        self,
+        texts: List[str],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH
+    ) -> List[Optional[str]]:
+        """Kiwi 다중 텍스트 처리로 한 번에 교정 (길이 제한 없음, max_* 는 인터페이스 호환용)"""
+        if not self.warmup() or not self._kiwi:
+            return [None] * len(texts)
+        
+        try:
+            return list(self._kiwi.space(texts, reset_whitespace=self.reset_whitespace))
+        except Exception:
+            return [self.correct(text) for text in texts]
@@ -1,15 +1,23 @@
 """
 KoSpacing 모델 래퍼
 """
-from typing import Optional
+import importlib.util
+import threading
+from typing import List, Optional
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH
 
 
 class KoSpacingModel:
     
-    def __init__(self):
+    PACKAGE = 'kospacing'
+    
+    def __init__(self, lazy: bool = True):
         self._spacing = None
         self._available = False
-        self._load_model()
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self.warmup()
     
     def _load_model(self):
         try:
@@ -19,14 +27,39 @@ class KoSpacingModel:
         except (ImportError, Exception):
             pass
     
-    def is_available(self) -> bool:
+    def is_installed(self) -> bool:
+        """패키지 설치 여부 (모델을 불러오지 않고 확인)"""
+        return importlib.util.find_spec(self.PACKAGE) is not None
+    
+    def warmup(self) -> bool:
+        """모델 로드 (최초 사용 시 1회)"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_model()
+                    self._loaded = True
         return self._available
     
+    def is_available(self) -> bool:
+        return self.warmup()
+    
+    def supports_batch(self) -> bool:
+        return False
+    
     def correct(self, text: str) -> Optional[str]:
-        if not self._available or not self._spacing:
+        if not self.warmup() or not self._spacing:
             return None
         
         try:
             return self._spacing(text)
         except Exception:
             return None
+    
+    def correct_batch(
+        self,
+        texts: List[str],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH
+    ) -> List[Optional[str]]:
+        """KoSpacing 은 배치 입력을 지원하지 않아 문장 단위로 처리"""
+        return [self.correct(text) for text in texts]
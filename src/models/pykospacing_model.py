@@ -1,32 +1,98 @@
 """
 PyKoSpacing 모델 래퍼
 """
-from typing import Optional
+import importlib.util
+import threading
+from typing import List, Optional
+from models.batching import DEFAULT_MAX_BATCH_SIZE, DEFAULT_MAX_LENGTH, predict_spacing
 
 
 class PyKoSpacingModel:
     
-    def __init__(self):
+    PACKAGE = 'pykospacing'
+    
+    def __init__(self, lazy: bool = True):
         self._spacing = None
+        self._encode = None
         self._available = False
-        self._load_model()
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        if not lazy:
+            self.warmup()
     
     def _load_model(self):
         try:
             from pykospacing import Spacing
             self._spacing = Spacing()
             self._available = True
+        except (ImportError, Exception):
+            return
+        
+        try:
+            from pykospacing.embedding_maker import encoding_and_padding
+            if hasattr(self._spacing, '_model') and hasattr(self._spacing, '_w2idx'):
+                self._encode = encoding_and_padding
         except (ImportError, Exception):
             pass
     
-    def is_available(self) -> bool:
+    def is_installed(self) -> bool:
+        """패키지 설치 여부 (모델을 불러오지 않고 확인)"""
+        return importlib.util.find_spec(self.PACKAGE) is not None
+    
+    def warmup(self) -> bool:
+        """모델 로드 (최초 사용 시 1회)"""
+        if not self._loaded:
+            with self._load_lock:
+                if not self._loaded:
+                    self._load_model()
+                    self._loaded = True
         return self._available
     
+    def is_available(self) -> bool:
+        return self.warmup()
+    
+    def supports_batch(self) -> bool:
+        return self.warmup() and self._encode is not None
+    
     def correct(self, text: str) -> Optional[str]:
-        if not self._available or not self._spacing:
+        if not self.warmup() or not self._spacing:
             return None
         
         try:
             return self._spacing(text)
         except Exception:
             return None
+    
+    def correct_batch(
+        self,
+        texts: List[str],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_length: int = DEFAULT_MAX_LENGTH
+    ) -> List[Optional[str]]:
+        """길이별 버킷 단위로 패딩하여 한 번의 forward pass 로 교정"""
+        if not self.warmup() or not self._spacing:
+            return [None] * len(texts)
+        
+        if not self.supports_batch():
+            return [self.correct(text) for text in texts]
+        
+        try:
+            return self._predict_batch(texts, max_batch_size, max_length)
+        except Exception:
+            return [self.correct(text) for text in texts]
+    
+    def _predict_batch(self, texts: List[str], max_batch_size: int, max_length: int) -> List[str]:
+        model = self._spacing._model
+        fixed_length = model.input_shape[1] if model.input_shape else None
+        
+        def predict(batch: List[str]):
+            matrix = self._encode(
+                word2idx_dic=self._spacing._w2idx,
+                sequences=batch,
+                maxlen=fixed_length or max(len(seq) for seq in batch),
+                padding='post',
+                truncating='post'
+            )
+            return model.predict(matrix, batch_size=len(batch), verbose=0)
+        
+        return predict_spacing(texts, max_batch_size, max_length, predict)
@@ -3,7 +3,7 @@
 """
 import re
 from typing import List, Set
-from utils.dictionary_loader import DictionaryLoader
+from utils.dictionary_loader import DictionaryLoader, DictionarySnapshot
 
 
 class CompoundRules:
@@ -15,6 +15,10 @@ class CompoundRules:
         ('법령', r'법\s+령'), ('규정', r'규\s+정'),
     ]
     
+    SUFFIXED_SPLITS = [
+        ('관련한', r'관\s+련한'), ('관련된', r'관\s+련된'),
+    ]
+    
     FINANCIAL_PATTERNS = [
         ('투자신탁', r'투자\s*신탁'), ('집합투자기구', r'집합\s*투자\s*기구'),
         ('수익증권', r'수익\s*증권'), ('환매청구', r'환매\s*청구'),
@@ -27,54 +31,42 @@ class CompoundRules:
     
     def __init__(self, dict_loader: DictionaryLoader = None):
         self.dict_loader = dict_loader or DictionaryLoader()
-        self._all_terms = None
     
     @property
     def all_terms(self) -> Set[str]:
-        if self._all_terms is None:
-            self._all_terms = self.dict_loader.get_all_terms()
-        return self._all_terms
+        """현재 사전 스냅샷의 전체 용어"""
+        return self.dict_loader.get_all_terms()
     
-    def fix_compound_nouns(self, text: str) -> str:
-        """사전 기반 합성명사 교정"""
-        words = text.split()
-        result = []
-        i = 0
-        
-        while i < len(words):
-            best_match = words[i]
-            best_len = 1
-            
-            for length in range(min(5, len(words) - i), 0, -1):
-                candidate = ''.join(words[i:i+length])
-                if candidate in self.all_terms and length > 1:
-                    best_match = candidate
-                    best_len = length
-                    break
-            
-            result.append(best_match)
-            i += best_len
-        
-        return ' '.join(result)
+    @property
+    def term_trie(self):
+        """현재 사전 스냅샷의 최장 일치 색인"""
+        return self.dict_loader.term_index()
+    
+    def fix_compound_nouns(self, text: str, snapshot: DictionarySnapshot = None) -> str:
+        """사전 기반 합성명사 교정 (snapshot 을 주면 그 시점의 사전 사용)"""
+        return ' '.join(self._merge_compounds(text.split(), snapshot))
     
-    def apply_to_tokens(self, tokens: List[str]) -> List[str]:
+    def apply_to_tokens(self, tokens: List[str], snapshot: DictionarySnapshot = None) -> List[str]:
         """토큰 리스트에 합성명사 규칙 적용"""
+        return self._merge_compounds(tokens, snapshot)
+    
+    def _merge_compounds(self, tokens: List[str], snapshot: DictionarySnapshot = None) -> List[str]:
+        """붙여 쓰면 사전 용어가 되는 최장 토큰 열을 병합"""
+        if snapshot is None:
+            with self.dict_loader.acquire() as snapshot:
+                return self._merge_compounds(tokens, snapshot)
+        trie = snapshot.term_index
         result = []
         i = 0
         
         while i < len(tokens):
-            best_match = tokens[i]
-            best_len = 1
-            
-            for length in range(min(5, len(tokens) - i), 0, -1):
-                candidate = ''.join(tokens[i:i+length])
-                if candidate in self.all_terms and length > 1:
-                    best_match = candidate
-                    best_len = length
-                    break
-            
-            result.append(best_match)
-            i += best_len
+            length = trie.longest_token_match(tokens, i)
+            if length:
+                result.append(''.join(tokens[i:i+length]))
+                i += length
+            else:
+                result.append(tokens[i])
+                i += 1
         
         return result
     
@@ -83,8 +75,8 @@ class CompoundRules:
         for replacement, pattern in self.COMMON_SPLITS:
             text = re.sub(pattern, replacement, text)
         
-        text = re.sub(r'관\s+련한', '관련한', text)
-        text = re.sub(r'관\s+련된', '관련된', text)
+        for replacement, pattern in self.SUFFIXED_SPLITS:
+            text = re.sub(pattern, replacement, text)
         
         return text
     
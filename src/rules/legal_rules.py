@@ -8,6 +8,8 @@ from typing import List
 class LegalRules:
     """법률 문서 패턴 교정 규칙"""
     
+    ORDINAL_SUFFIXES = ['조', '항', '호', '편', '장', '절']
+    
     LEGAL_PAIRS = [
         (r'법\s+령', '법령'), (r'규\s+정', '규정'), (r'조\s+항', '조항'),
         (r'조\s+문', '조문'), (r'단\s+서', '단서'), (r'사\s+항', '사항'),
@@ -24,12 +26,8 @@ class LegalRules:
     @staticmethod
     def apply_all(text: str) -> str:
         """모든 법률 규칙 적용"""
-        text = re.sub(r'제\s*(\d+)\s*조', r'제\1조', text)
-        text = re.sub(r'제\s*(\d+)\s*항', r'제\1항', text)
-        text = re.sub(r'제\s*(\d+)\s*호', r'제\1호', text)
-        text = re.sub(r'제\s*(\d+)\s*편', r'제\1편', text)
-        text = re.sub(r'제\s*(\d+)\s*장', r'제\1장', text)
-        text = re.sub(r'제\s*(\d+)\s*절', r'제\1절', text)
+        for suffix in LegalRules.ORDINAL_SUFFIXES:
+            text = re.sub(rf'제\s*(\d+)\s*{suffix}', rf'제\1{suffix}', text)
         
         for pattern, replacement in LegalRules.LEGAL_PAIRS:
             text = re.sub(pattern, replacement, text)
@@ -52,7 +50,7 @@ class LegalRules:
                 next_token = tokens[i + 1]
                 next_next = tokens[i + 2]
                 
-                if next_token.isdigit() and next_next in ['조', '항', '호', '편', '장', '절']:
+                if next_token.isdigit() and next_next in LegalRules.ORDINAL_SUFFIXES:
                     result.append(f'제{next_token}{next_next}')
                     i += 3
                     continue
@@ -8,6 +8,8 @@ from typing import List
 class NumberRules:
     """숫자 패턴 교정 규칙"""
     
+    UNITS = ['원', '좌', '주', '구', '건', '개', '명', '인', '일', '년', '월', '회', '차', '호']
+    
     @staticmethod
     def apply_all(text: str) -> str:
         """모든 숫자 규칙 적용"""
@@ -16,8 +18,7 @@ class NumberRules:
         text = re.sub(r'(\d)\s*\.\s*(\d)', r'\1.\2', text)
         text = re.sub(r'(\d)\s*%', r'\1%', text)
         
-        units = ['원', '좌', '주', '구', '건', '개', '명', '인', '일', '년', '월', '회', '차', '호']
-        for unit in units:
+        for unit in NumberRules.UNITS:
             text = re.sub(rf'(\d)\s+{unit}', rf'\1{unit}', text)
         
         text = re.sub(r'(\d)\s*~\s*(\d)', r'\1~\2', text)
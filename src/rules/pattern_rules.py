@@ -8,6 +8,13 @@ from typing import List
 class PatternRules:
     """패턴 기반 교정 규칙"""
     
+    NO_SPACE_AFTER = '([･"\''
+    NO_SPACE_BEFORE = ')],.･:;"\''
+    
+    FINE_TUNE_JOINS = [
+        ('것으로서', r'것으로\s+서(?=\s|$|[,.])'), ('관련', r'관\s+련'), ('비용', r'비\s+용'),
+    ]
+    
     @staticmethod
     def apply_all(text: str) -> str:
         """모든 패턴 규칙 적용"""
@@ -33,6 +40,14 @@ class PatternRules:
         
         return text
     
+    @staticmethod
+    def fine_tune(text: str) -> str:
+        """최종 띄어쓰기 미세 조정"""
+        text = re.sub(r'\s+', ' ', text).strip()
+        for replacement, pattern in PatternRules.FINE_TUNE_JOINS:
+            text = re.sub(pattern, replacement, text)
+        return text
+    
     @staticmethod
     def apply_to_tokens(tokens: List[str]) -> List[str]:
         """토큰 리스트에 패턴 규칙 적용"""
@@ -0,0 +1,291 @@
+"""
+사전 컴파일 규칙 엔진
+
+NumberRules / LegalRules / CompoundRules / PatternRules 의 규칙 테이블을
+생성 시점에 한 번 컴파일하고, 서로 간섭하지 않는 규칙들을 하나의 정규식으로 묶어
+문자열 스캔 횟수를 줄인다. 출력은 규칙을 하나씩 순서대로 적용한 결과와 동일하다.
+
+규칙마다 매치에 꼭 필요한 문자 (숫자, '제', 괄호 등) 를 선언하고, 후처리 입력의 문자 집합을
+한 번만 구해 (Postprocessor 가 모든 단계에 넘겨줌) 매치될 수 없는 규칙은 건너뛴다. 후처리 단계는
+문자를 지우거나 자리만 바꾸므로 처음 입력의 문자 집합은 이후 단계 입력의 상위 집합이고,
+빠진 문자가 있어도 실제로 없는 문자만 빠지므로 결과가 달라지지 않는다.
+"""
+import hashlib
+import inspect
+import re
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Pattern, Sequence, Set, Tuple, Union
+from rules.number_rules import NumberRules
+from rules.legal_rules import LegalRules
+from rules.compound_rules import CompoundRules
+from rules.pattern_rules import PatternRules
+
+
+# 문자 집합에 더하는 문자 종류 표시 (한 글자 문자열과 겹치지 않음, re 의 \d / \s 와 같은 판정)
+DIGIT = r'\d'
+SPACE = r'\s'
+REGEX_META = frozenset('.^$*+?{}[]\\|()')
+
+
+def present_chars(text: str) -> Set[str]:
+    """입력에 나타난 문자 집합과 숫자/공백 존재 표시"""
+    chars = set(text)
+    if any(c.isdecimal() for c in chars):
+        chars.add(DIGIT)
+    if any(c.isspace() for c in chars):
+        chars.add(SPACE)
+    return chars
+
+
+def _strip_spaces(match: 're.Match') -> str:
+    """매치 구간의 공백 제거"""
+    return ''.join(match.group().split())
+
+
+def _char_class(chars: Sequence[str]) -> str:
+    return '[' + ''.join(re.escape(c) for c in chars) + ']'
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """두 결합어의 매치 구간이 겹칠 수 있는지 (포함 또는 접미/접두 공유)"""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:k]) for k in range(1, len(b))) or \
+        any(b.endswith(a[:k]) for k in range(1, len(a)))
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """컴파일된 단일 치환 스캔
+    
+    융합 규칙은 원본 테이블 항목마다 바깥 캡처 그룹을 두고 sources 에 (그룹 번호, 항목 이름) 을 기록한다.
+    바깥 그룹이 가장 나중에 닫히므로 매치의 lastindex 가 매치된 항목의 그룹 번호다.
+    requires 의 각 문자 집합에서 적어도 한 문자가 입력에 있어야 매치될 수 있다 (비어 있으면 항상 적용).
+    """
+    name: str
+    pattern: Pattern
+    repl: Union[str, Callable[['re.Match'], str]]
+    strip: bool = False
+    sources: Tuple[Tuple[int, str], ...] = ()
+    requires: Tuple[FrozenSet[str], ...] = ()
+    
+    def can_match(self, present: Set[str]) -> bool:
+        return all(not present.isdisjoint(chars) for chars in self.requires)
+    
+    def apply(self, text: str) -> str:
+        text = self.pattern.sub(self.repl, text)
+        return text.strip() if self.strip else text
+    
+    def entries(self) -> List[str]:
+        """원본 규칙 항목 이름 (융합하지 않은 규칙은 자기 이름)"""
+        return [name for _, name in self.sources] or [self.name]
+    
+    def counting(self, record: Callable[[str, bool], None]) -> Callable[[str], str]:
+        """매치마다 record(항목 이름, 변경 여부) 를 호출하는 apply (프로파일링용)"""
+        sources = dict(self.sources)
+        
+        def repl(match: 're.Match') -> str:
+            replaced = self.repl(match) if callable(self.repl) else match.expand(self.repl)
+            record(sources.get(match.lastindex, self.name), replaced != match.group())
+            return replaced
+        
+        def apply(text: str) -> str:
+            text = self.pattern.sub(repl, text)
+            return text.strip() if self.strip else text
+        
+        return apply
+
+
+class RuleEngine:
+    """규칙 테이블을 융합 스캔으로 컴파일한 엔진"""
+    
+    STAGES = ('number', 'legal', 'split', 'financial', 'pattern', 'fine_tune')
+    
+    def __init__(self):
+        self.stages: Dict[str, List[CompiledRule]] = {
+            'number': self._compile_number_rules(),
+            'legal': self._compile_legal_rules(),
+            'split': self._fuse_joins('split', CompoundRules.COMMON_SPLITS + CompoundRules.SUFFIXED_SPLITS),
+            'financial': self._fuse_joins('financial', CompoundRules.FINANCIAL_PATTERNS),
+            'pattern': self._compile_pattern_rules(),
+            'fine_tune': self._compile_fine_tune_rules(),
+        }
+        self._version = None
+        self._profiler = None
+        self._profiled_steps: Dict[str, List[Tuple[str, Callable[[str], str]]]] = {}
+        # 적용/건너뜀 횟수는 프로파일링 중에만 센다 (꺼져 있을 때는 호출마다 잠금을 잡지 않음)
+        self._counts_lock = threading.Lock()
+        self._runs = {rule.name: 0 for rules in self.stages.values() for rule in rules}
+        self._skips = dict(self._runs)
+    
+    @property
+    def profiler(self):
+        return self._profiler
+    
+    @profiler.setter
+    def profiler(self, profiler) -> None:
+        """프로파일러 연결 - 규칙별 통계와 함께 원본 규칙 항목별 매치 수('entry') 를 기록"""
+        self._profiler = profiler
+        self._profiled_steps = {}
+        if profiler is None:
+            return
+        
+        profiler.declare('entry', self.entry_names())
+        
+        def record(entry: str, changed: bool) -> None:
+            profiler.record('entry', entry, 0.0, changed)
+        
+        self._profiled_steps = {
+            stage: [(rule.name, rule.counting(record)) for rule in rules]
+            for stage, rules in self.stages.items()
+        }
+    
+    def apply(self, stage: str, text: str, present: Set[str] = None) -> str:
+        """단계별 규칙 적용 (present 에 필요한 문자가 없는 규칙은 건너뜀, 없으면 text 에서 구함)
+        
+        present 는 text 에 나타난 문자를 모두 포함해야 한다 (앞 단계 입력의 present_chars 결과 등).
+        """
+        rules = self.stages[stage]
+        if present is None:
+            present = present_chars(text)
+        
+        if self._profiler is not None:
+            runnable = [rule.can_match(present) for rule in rules]
+            with self._counts_lock:
+                for rule, run in zip(rules, runnable):
+                    if run:
+                        self._runs[rule.name] += 1
+                    else:
+                        self._skips[rule.name] += 1
+            steps = [step for step, run in zip(self._profiled_steps[stage], runnable) if run]
+            return self._profiler.run_pipeline('rule', steps, text)
+        for rule in rules:
+            if rule.can_match(present):
+                text = rule.apply(text)
+        return text
+    
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """규칙별 적용 횟수 (runs) 와 사전 필터로 건너뛴 횟수 (skips) - 프로파일러가 연결된 동안만 집계"""
+        with self._counts_lock:
+            return {name: {'runs': self._runs[name], 'skips': self._skips[name]} for name in self._runs}
+    
+    def reset_stats(self) -> None:
+        with self._counts_lock:
+            for name in self._runs:
+                self._runs[name] = self._skips[name] = 0
+    
+    def entry_names(self) -> List[str]:
+        """모든 원본 규칙 항목 이름 (융합 규칙은 테이블 항목 단위)"""
+        return [entry for rules in self.stages.values() for rule in rules for entry in rule.entries()]
+    
+    @property
+    def version(self) -> str:
+        """규칙 집합 해시 (컴파일된 패턴과 규칙 모듈 소스 기준)"""
+        if self._version is None:
+            digest = hashlib.sha256()
+            for rules in self.stages.values():
+                for rule in rules:
+                    repl = rule.repl if isinstance(rule.repl, str) else rule.repl.__qualname__
+                    digest.update(f'{rule.name}\x00{rule.pattern.pattern}\x00{repl}\x00{rule.strip}\n'.encode('utf-8'))
+            for rule_class in (NumberRules, LegalRules, CompoundRules, PatternRules):
+                try:
+                    digest.update(inspect.getsource(rule_class).encode('utf-8'))
+                except (OSError, TypeError):
+                    pass
+            self._version = digest.hexdigest()
+        return self._version
+    
+    def rule_count(self) -> int:
+        return sum(len(rules) for rules in self.stages.values())
+    
+    @staticmethod
+    def _compile_number_rules() -> List[CompiledRule]:
+        units = _char_class(NumberRules.UNITS)
+        digit, space = frozenset({DIGIT}), frozenset({SPACE})
+        return [
+            CompiledRule('number.digit_join', re.compile(r'(\d)\s+(\d)'), r'\1\2', requires=(digit, space)),
+            CompiledRule('number.thousands', re.compile(r'(\d+)\s*,\s*(\d{3})'), r'\1,\2',
+                         requires=(digit, frozenset(','))),
+            CompiledRule('number.decimal', re.compile(r'(\d)\s*\.\s*(\d)'), r'\1.\2',
+                         requires=(digit, frozenset('.'))),
+            CompiledRule('number.unit', re.compile(rf'(\d)(?:\s*(%)|\s+({units}))'), r'\1\2\3',
+                         requires=(digit, frozenset(['%', *NumberRules.UNITS]))),
+            CompiledRule('number.range', re.compile(r'(\d)\s*~\s*(\d)'), r'\1~\2',
+                         requires=(digit, frozenset('~'))),
+            CompiledRule('number.hyphen', re.compile(r'(\d)\s*-\s*(\d)'), r'\1-\2',
+                         requires=(digit, frozenset('-'))),
+        ]
+    
+    @staticmethod
+    def _compile_legal_rules() -> List[CompiledRule]:
+        suffixes = _char_class(LegalRules.ORDINAL_SUFFIXES)
+        joins = [(replacement, pattern) for pattern, replacement in
+                 LegalRules.LEGAL_PAIRS + LegalRules.LEGAL_PARTICLES]
+        return [
+            CompiledRule('legal.ordinal', re.compile(rf'제\s*(\d+)\s*({suffixes})'), r'제\1\2',
+                         requires=(frozenset('제'), frozenset({DIGIT}), frozenset(LegalRules.ORDINAL_SUFFIXES))),
+        ] + RuleEngine._fuse_joins('legal', joins)
+    
+    @staticmethod
+    def _compile_pattern_rules() -> List[CompiledRule]:
+        after = _char_class(PatternRules.NO_SPACE_AFTER)
+        before = _char_class(PatternRules.NO_SPACE_BEFORE)
+        space = frozenset({SPACE})
+        return [
+            CompiledRule('pattern.punct_space', re.compile(rf'(?<={after})\s+|\s+(?={before})'), '',
+                         requires=(space, frozenset(PatternRules.NO_SPACE_AFTER + PatternRules.NO_SPACE_BEFORE))),
+            CompiledRule('pattern.paren_shift', re.compile(r'\(([가-힣]{3,})([가-힣]{2,})'), r'\1(\2',
+                         requires=(frozenset('('),)),
+            CompiledRule('pattern.normalize', re.compile(r'\s+'), ' ', strip=True, requires=(space,)),
+        ]
+    
+    @staticmethod
+    def _compile_fine_tune_rules() -> List[CompiledRule]:
+        return [
+            CompiledRule('fine_tune.normalize', re.compile(r'\s+'), ' ', strip=True, requires=(frozenset({SPACE}),)),
+        ] + RuleEngine._fuse_joins('fine_tune', PatternRules.FINE_TUNE_JOINS)
+    
+    @staticmethod
+    def _fuse_joins(prefix: str, joins: List[Tuple[str, str]]) -> List[CompiledRule]:
+        """공백 제거형 (결합어, 패턴) 테이블을 간섭 없는 계층별 정규식으로 융합
+        
+        앞선 규칙과 매치 구간이 겹칠 수 있는 규칙은 다음 계층으로 밀어
+        순차 적용과 같은 결과를 보장한다.
+        """
+        layers: List[List[Tuple[str, str]]] = []
+        placed: List[Tuple[str, int]] = []
+        
+        for replacement, pattern in joins:
+            depth = max((idx + 1 for other, idx in placed if _overlaps(other, replacement)), default=0)
+            if depth == len(layers):
+                layers.append([])
+            layers[depth].append((f'{prefix}.{replacement}', pattern))
+            placed.append((replacement, depth))
+        
+        return [
+            RuleEngine._fuse_layer(f'{prefix}.joins' if i == 0 else f'{prefix}.joins_{i}', entries)
+            for i, entries in enumerate(layers)
+        ]
+    
+    @staticmethod
+    def _fuse_layer(name: str, entries: List[Tuple[str, str]]) -> CompiledRule:
+        """(항목 이름, 패턴) 목록을 항목별 바깥 그룹을 둔 하나의 정규식으로 컴파일
+        
+        모든 패턴이 반드시 매치되는 글자로 시작하면 그 첫 글자 중 하나가 입력에 있어야 적용한다.
+        """
+        alternatives, sources = [], []
+        group = 1
+        for entry, pattern in entries:
+            alternatives.append(f'({pattern})')
+            sources.append((group, entry))
+            group += 1 + re.compile(pattern).groups
+        leads = frozenset(pattern[0] for _, pattern in entries)
+        literal = all(
+            pattern[:1] and pattern[0] not in REGEX_META and pattern[1:2] not in ('?', '*', '{')
+            for _, pattern in entries
+        )
+        requires = (leads,) if literal else ()
+        return CompiledRule(
+            name, re.compile('|'.join(alternatives)), _strip_spaces, sources=tuple(sources), requires=requires
+        )
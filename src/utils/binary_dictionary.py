@@ -0,0 +1,266 @@
+"""
+사전 바이너리 포맷 - 텍스트 사전을 정렬된 UTF-8 용어 테이블로 컴파일하고 mmap 으로 조회
+
+레이아웃 (리틀 엔디언):
+    헤더      MAGIC(8) | 테이블 수 u32 | 내용 해시(64, ascii) | 원본 해시(64, ascii) | 원본 상태 해시(64, ascii)
+    디렉터리  테이블마다 이름(32, utf-8) | 용어 수 u32 | 오프셋 위치 u64 | 본문 위치 u64 | 본문 길이 u64
+    테이블    오프셋 u32[용어 수 + 1] | 정렬된 용어 UTF-8 본문
+
+용어는 UTF-8 바이트 순서(= 코드 포인트 순서)로 정렬되어 있어 이분 탐색으로
+포함 여부와 접두 범위를 찾는다. 파일을 읽기 전용으로 mmap 하므로 여러 워커 프로세스가
+같은 페이지를 복사 없이 공유한다.
+
+원본 .txt 의 (수정 시각, 크기) 가 컴파일할 때와 같으면 원본을 다시 해시하지 않고 바이너리를 연다.
+
+빌드: python src/utils/binary_dictionary.py [사전 디렉터리]
+"""
+import hashlib
+import mmap
+import struct
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import numpy as np
+
+
+MAGIC = b'KSPDICT\x02'
+BINARY_FILENAME = 'dictionaries.bin'
+SOURCE_FILES = ('compound_nouns.txt', 'financial_terms.txt', 'legal_terms.txt', 'proper_nouns.txt')
+
+_HEADER = struct.Struct('<8sI64s64s64s')
+_ENTRY = struct.Struct('<32sIQQQ')
+_PREFIX_END = b'\xff'  # UTF-8 에 나타나지 않는 바이트 - 접두 범위의 상한
+
+
+def source_digest(dict_dir: Path) -> str:
+    """원본 텍스트 사전 파일 바이트 해시 (바이너리가 최신인지 확인용)"""
+    digest = hashlib.sha256()
+    for filename in SOURCE_FILES:
+        path = Path(dict_dir) / filename
+        digest.update(filename.encode('utf-8') + b'\x00')
+        if path.exists():
+            digest.update(path.read_bytes())
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def source_stat_digest(dict_dir: Path) -> str:
+    """원본 텍스트 사전 파일의 (이름, 수정 시각, 크기) 해시 - 내용을 읽지 않는 변경 확인용"""
+    digest = hashlib.sha256()
+    for filename in SOURCE_FILES:
+        try:
+            stat = (Path(dict_dir) / filename).stat()
+        except OSError:
+            digest.update(f'{filename}\x00-\x00'.encode('utf-8'))
+            continue
+        digest.update(f'{filename}\x00{stat.st_mtime_ns}\x00{stat.st_size}\x00'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class SortedTermTable(AbstractSet):
+    """mmap 위 정렬 용어 테이블 (읽기 전용 집합)"""
+    
+    def __init__(self, buffer, count: int, offsets_pos: int, blob_pos: int, blob_len: int):
+        self._buffer = buffer
+        self._count = count
+        self._offsets = np.frombuffer(buffer, dtype='<u4', count=count + 1, offset=offsets_pos)
+        self._blob_pos = blob_pos
+        self._blob_len = blob_len
+    
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> set:
+        return set(iterable)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self._term(i).decode('utf-8')
+    
+    def __contains__(self, term: object) -> bool:
+        if not isinstance(term, str) or not self._count:
+            return False
+        key = term.encode('utf-8')
+        i = self._lower_bound(key, 0, self._count)
+        return i < self._count and self._term(i) == key
+    
+    def has_prefix(self, prefix: str) -> bool:
+        key = prefix.encode('utf-8')
+        i = self._lower_bound(key, 0, self._count)
+        return i < self._count and self._term(i).startswith(key)
+    
+    def longest_token_match(self, tokens: List[str], start: int, min_tokens: int = 2) -> int:
+        """TermTrie.longest_token_match 와 같은 결과 - 접두 범위를 좁혀 가며 탐색"""
+        lo, hi = 0, self._count
+        key = b''
+        best = 0
+        
+        for j in range(start, len(tokens)):
+            key += tokens[j].encode('utf-8')
+            lo = self._lower_bound(key, lo, hi)
+            hi = self._lower_bound(key + _PREFIX_END, lo, hi)
+            if lo >= hi:
+                return best
+            if self._term(lo) == key and j - start + 1 >= min_tokens:
+                best = j - start + 1
+        
+        return best
+    
+    def _term(self, i: int) -> bytes:
+        start = self._blob_pos + int(self._offsets[i])
+        end = self._blob_pos + int(self._offsets[i + 1])
+        return self._buffer[start:end]
+    
+    def _lower_bound(self, key: bytes, lo: int, hi: int) -> int:
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+
+class BinaryDictionary:
+    """컴파일된 사전 파일 (mmap)"""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, n_tables, content_hash, source_hash, source_stat = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"사전 바이너리 형식이 아닙니다: {self.path}")
+        
+        self.content_hash = content_hash.decode('ascii')
+        self.source_hash = source_hash.decode('ascii')
+        self.source_stat = source_stat.rstrip(b'\x00').decode('ascii')
+        self.tables: Dict[str, SortedTermTable] = {}
+        
+        for i in range(n_tables):
+            name, count, offsets_pos, blob_pos, blob_len = _ENTRY.unpack_from(
+                self._mmap, _HEADER.size + i * _ENTRY.size
+            )
+            name = name.rstrip(b'\x00').decode('utf-8')
+            self.tables[name] = SortedTermTable(self._mmap, count, offsets_pos, blob_pos, blob_len)
+    
+    @classmethod
+    def open_if_current(cls, dict_dir: Path) -> Optional['BinaryDictionary']:
+        """사전 디렉터리의 바이너리가 있고 원본 .txt 와 일치하면 열기 (아니면 None)
+        
+        원본 파일의 수정 시각과 크기가 컴파일할 때와 같으면 내용 해시는 계산하지 않는다.
+        """
+        path = Path(dict_dir) / BINARY_FILENAME
+        if not path.exists():
+            return None
+        try:
+            binary = cls(path)
+        except (OSError, ValueError, struct.error):
+            return None
+        
+        has_sources = any((Path(dict_dir) / filename).exists() for filename in SOURCE_FILES)
+        if (
+            has_sources
+            and binary.source_stat != source_stat_digest(dict_dir)
+            and binary.source_hash != source_digest(dict_dir)
+        ):
+            binary.close()
+            return None
+        return binary
+    
+    def table(self, name: str) -> SortedTermTable:
+        return self.tables[name]
+    
+    @property
+    def closed(self) -> bool:
+        return self._mmap.closed
+    
+    def close(self) -> None:
+        """mmap 닫기 (테이블을 아직 참조하는 곳이 있으면 열린 채로 남는다)"""
+        self.tables.clear()
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def write_binary_dictionary(
+    path: Path,
+    tables: Sequence[Tuple[str, Iterable[str]]],
+    content_hash: str,
+    source_hash: str,
+    source_stat: str = ''
+) -> Path:
+    """(이름, 용어) 테이블 목록을 바이너리 파일로 기록 (임시 파일에 쓴 뒤 교체)"""
+    encoded = [(name, sorted({term.encode('utf-8') for term in terms})) for name, terms in tables]
+    
+    directory_size = _HEADER.size + _ENTRY.size * len(encoded)
+    entries = []
+    chunks = []
+    position = directory_size
+    
+    for name, terms in encoded:
+        offsets = np.zeros(len(terms) + 1, dtype='<u4')
+        if terms:
+            offsets[1:] = np.cumsum([len(term) for term in terms])
+        blob = b''.join(terms)
+        
+        offsets_pos = position
+        blob_pos = offsets_pos + offsets.nbytes
+        entries.append(_ENTRY.pack(name.encode('utf-8'), len(terms), offsets_pos, blob_pos, len(blob)))
+        chunks.extend([offsets.tobytes(), blob])
+        position = blob_pos + len(blob)
+        position += -position % 4
+        chunks.append(b'\x00' * (position - blob_pos - len(blob)))
+    
+    header = _HEADER.pack(
+        MAGIC, len(encoded), content_hash.encode('ascii'), source_hash.encode('ascii'), source_stat.encode('ascii')
+    )
+    
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(header)
+        f.write(b''.join(entries))
+        f.write(b''.join(chunks))
+    tmp_path.replace(path)
+    return path
+
+
+def compile_dictionaries(dict_dir: str = None, output: str = None) -> Path:
+    """텍스트 사전을 바이너리로 컴파일 (기본 출력: 사전 디렉터리의 dictionaries.bin)"""
+    from utils.dictionary_loader import DictionaryLoader
+    
+    loader = DictionaryLoader(dict_dir, use_binary=False)
+    # 읽기 전에 상태를 기록해 두어 컴파일 중에 바뀐 원본은 다음 열기에서 해시로 확인하게 한다
+    source_stat = source_stat_digest(loader.dict_dir)
+    loader.load_all()
+    tables = [
+        ('compound_nouns', loader.compound_nouns),
+        ('financial_terms', loader.financial_terms),
+        ('legal_terms', loader.legal_terms),
+        ('proper_nouns', loader.proper_nouns),
+        ('all', loader.get_all_terms()),
+    ]
+    
+    output = Path(output) if output else loader.dict_dir / BINARY_FILENAME
+    return write_binary_dictionary(
+        output, tables, loader.content_hash(), source_digest(loader.dict_dir), source_stat
+    )
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+    
+    parser = argparse.ArgumentParser(description="텍스트 사전을 mmap 바이너리로 컴파일")
+    parser.add_argument('dict_dir', nargs='?', default=None)
+    parser.add_argument('--output', '-o', default=None)
+    args = parser.parse_args()
+    
+    print(compile_dictionaries(args.dict_dir, args.output))
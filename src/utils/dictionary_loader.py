@@ -1,31 +1,201 @@
 """
 사전 로더
 """
-from typing import Set
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set, Tuple
 from pathlib import Path
+from utils.binary_dictionary import BINARY_FILENAME, SOURCE_FILES, BinaryDictionary
+from utils.term_trie import TermTrie
+
+
+class DictionarySnapshot:
+    """한 시점의 사전 내용 (생성 후 변경하지 않음)
+    
+    다시 로드하면 새 스냅샷을 만들어 교체하므로, 이전 스냅샷을 잡고 있는 요청은
+    끝날 때까지 같은 내용을 본다. 교체된 스냅샷을 명시적으로 닫지는 않으며, 바이너리 사전 mmap 은
+    스냅샷이나 그 테이블을 참조하는 곳이 모두 사라질 때 해제된다.
+    """
+    
+    def __init__(
+        self,
+        compound_nouns: Set[str],
+        financial_terms: Set[str],
+        legal_terms: Set[str],
+        proper_nouns: Set[str],
+        binary: BinaryDictionary = None,
+        content_hash: str = None
+    ):
+        self.compound_nouns = compound_nouns
+        self.financial_terms = financial_terms
+        self.legal_terms = legal_terms
+        self.proper_nouns = proper_nouns
+        self.binary = binary
+        self._content_hash = content_hash
+        self._all_terms = None
+        self._term_index = None
+        self._lock = threading.Lock()
+    
+    @property
+    def version(self) -> str:
+        """스냅샷 버전 (내용 해시 앞 12자리)"""
+        return self.content_hash[:12]
+    
+    @property
+    def content_hash(self) -> str:
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            for terms in (self.compound_nouns, self.financial_terms,
+                          self.legal_terms, self.proper_nouns):
+                digest.update('\n'.join(sorted(terms)).encode('utf-8'))
+                digest.update(b'\x00')
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+    
+    @property
+    def all_terms(self) -> Set[str]:
+        if self._all_terms is None:
+            with self._lock:
+                if self._all_terms is None:
+                    self._all_terms = self._build_all_terms()
+        return self._all_terms
+    
+    @property
+    def term_index(self):
+        """전체 용어 최장 일치 색인 (바이너리면 mmap 테이블, 아니면 TermTrie)"""
+        if self._term_index is None:
+            terms = self.all_terms
+            with self._lock:
+                if self._term_index is None:
+                    self._term_index = terms if hasattr(terms, 'longest_token_match') else TermTrie(terms)
+        return self._term_index
+    
+    def _build_all_terms(self) -> Set[str]:
+        if self.binary is not None:
+            return self.binary.table('all')
+        return frozenset(self.compound_nouns | self.financial_terms |
+                         self.legal_terms | self.proper_nouns)
 
 
 class DictionaryLoader:
-    """사전 파일 로더"""
+    """사전 파일 로더
     
-    def __init__(self, dict_dir: str = None):
+    사전 디렉터리에 원본과 일치하는 dictionaries.bin 이 있으면 mmap 으로 직접 조회하고,
+    없으면 .txt 파일을 읽어 집합으로 만든다. 로드 결과는 DictionarySnapshot 으로 보관하며
+    load_all / reload_if_changed 는 새 스냅샷을 완성한 뒤 참조만 교체한다.
+    """
+    
+    def __init__(self, dict_dir: str = None, use_binary: bool = True):
         if dict_dir is None:
             current_file = Path(__file__)
             project_root = current_file.parent.parent.parent
             dict_dir = project_root / "data" / "dictionaries"
         
         self.dict_dir = Path(dict_dir)
-        self._compound_nouns: Set[str] = set()
-        self._financial_terms: Set[str] = set()
-        self._legal_terms: Set[str] = set()
-        self._proper_nouns: Set[str] = set()
-        
+        self.use_binary = use_binary
+        self._snapshot: Optional[DictionarySnapshot] = None
+        self._signature: Tuple = None
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watching = threading.Event()
+    
     def load_all(self) -> None:
-        """모든 사전 로드"""
-        self._compound_nouns = self._load_dict_file("compound_nouns.txt")
-        self._financial_terms = self._load_dict_file("financial_terms.txt")
-        self._legal_terms = self._load_dict_file("legal_terms.txt")
-        self._proper_nouns = self._load_dict_file("proper_nouns.txt")
+        """모든 사전 로드 (새 스냅샷으로 교체)"""
+        with self._reload_lock:
+            self._load_locked()
+    
+    def reload_if_changed(self) -> bool:
+        """사전 파일이 바뀌었으면 새 스냅샷을 만들어 교체 (교체했으면 True)"""
+        with self._reload_lock:
+            signature = self._source_signature()
+            if self._snapshot is not None and signature == self._signature:
+                return False
+            self._load_locked(warm=True)
+            return True
+    
+    def start_auto_reload(self, interval: float = 5.0) -> None:
+        """interval 초마다 사전 파일 변경을 확인하는 백그라운드 스레드 시작"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._stop_watching.clear()
+        self._watcher = threading.Thread(
+            target=self._watch, args=(interval,), name='dictionary-reload', daemon=True
+        )
+        self._watcher.start()
+    
+    def stop_auto_reload(self) -> None:
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+    
+    @contextmanager
+    def acquire(self) -> Iterator[DictionarySnapshot]:
+        """요청 하나가 쓸 스냅샷 (블록 동안 교체되어도 같은 스냅샷을 계속 조회)"""
+        yield self.snapshot()
+    
+    def snapshot(self) -> DictionarySnapshot:
+        """현재 스냅샷 (처음 호출 시 로드)
+        
+        반환된 스냅샷은 참조하는 동안 교체되어도 그대로 쓸 수 있다. 여러 단계에 걸쳐
+        같은 사전을 봐야 하는 요청은 acquire 로 한 스냅샷을 잡아 단계마다 넘긴다.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._reload_lock:
+                if self._snapshot is None:
+                    self._load_locked()
+                snapshot = self._snapshot
+        return snapshot
+    
+    def _load_locked(self, warm: bool = False) -> None:
+        """새 스냅샷을 완성한 뒤 교체 (_reload_lock 을 잡은 상태에서 호출)"""
+        signature = self._source_signature()
+        snapshot = self._build_snapshot()
+        if warm:
+            _ = snapshot.content_hash, snapshot.term_index
+        self._snapshot = snapshot
+        self._signature = signature
+    
+    def _watch(self, interval: float) -> None:
+        while not self._stop_watching.wait(interval):
+            try:
+                self.reload_if_changed()
+            except OSError:
+                pass
+    
+    def _build_snapshot(self) -> DictionarySnapshot:
+        binary = BinaryDictionary.open_if_current(self.dict_dir) if self.use_binary else None
+        
+        if binary is not None:
+            return DictionarySnapshot(
+                binary.table('compound_nouns'),
+                binary.table('financial_terms'),
+                binary.table('legal_terms'),
+                binary.table('proper_nouns'),
+                binary=binary,
+                content_hash=binary.content_hash
+            )
+        
+        return DictionarySnapshot(
+            self._load_dict_file("compound_nouns.txt"),
+            self._load_dict_file("financial_terms.txt"),
+            self._load_dict_file("legal_terms.txt"),
+            self._load_dict_file("proper_nouns.txt")
+        )
+    
+    def _source_signature(self) -> Tuple:
+        """사전 파일들의 (이름, 수정 시각, 크기) - 변경 감지용"""
+        signature = []
+        for filename in SOURCE_FILES + (BINARY_FILENAME,):
+            path = self.dict_dir / filename
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            signature.append((filename, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
     
     def _load_dict_file(self, filename: str) -> Set[str]:
         """사전 파일 로드"""
@@ -43,30 +213,37 @@ class DictionaryLoader:
         
         return terms
     
+    @property
+    def binary(self) -> Optional[BinaryDictionary]:
+        return self.snapshot().binary
+    
+    @property
+    def version(self) -> str:
+        return self.snapshot().version
+    
     @property
     def compound_nouns(self) -> Set[str]:
-        if not self._compound_nouns:
-            self.load_all()
-        return self._compound_nouns
+        return self.snapshot().compound_nouns
     
     @property
     def financial_terms(self) -> Set[str]:
-        if not self._financial_terms:
-            self.load_all()
-        return self._financial_terms
+        return self.snapshot().financial_terms
     
     @property
     def legal_terms(self) -> Set[str]:
-        if not self._legal_terms:
-            self.load_all()
-        return self._legal_terms
+        return self.snapshot().legal_terms
     
     @property
     def proper_nouns(self) -> Set[str]:
-        if not self._proper_nouns:
-            self.load_all()
-        return self._proper_nouns
+        return self.snapshot().proper_nouns
     
     def get_all_terms(self) -> Set[str]:
-        return (self.compound_nouns | self.financial_terms | 
-                self.legal_terms | self.proper_nouns)
+        return self.snapshot().all_terms
+    
+    def term_index(self):
+        """전체 용어 최장 일치 색인 (바이너리면 mmap 테이블, 아니면 TermTrie)"""
+        return self.snapshot().term_index
+    
+    def content_hash(self) -> str:
+        """사전 내용 해시 (다시 로드하면 재계산)"""
+        return self.snapshot().content_hash
@@ -1,8 +1,20 @@
 """
 평가 지표 계산
 """
-from typing import List, Tuple
+import json
+import re
+from collections import defaultdict
+from itertools import accumulate, islice
+from typing import Callable, Dict, Iterable, List, Set, TextIO, Tuple, Union
 from dataclasses import dataclass
+import numpy as np
+from utils.term_trie import TermTrie
+
+
+DEFAULT_BATCH_SIZE = 1024
+
+NUMBER_PATTERN = re.compile(r'\d')
+LEGAL_PATTERN = re.compile(r'제\s*\d+\s*(?:조|항|호|편|장|절)|동법|같은\s*법|시행령|시행규칙')
 
 
 @dataclass
@@ -25,52 +37,200 @@ def calculate_metrics(predictions: List[str], references: List[str]) -> SpacingM
     if len(predictions) != len(references) or not predictions:
         return SpacingMetrics(0.0, 0.0, 0.0, 0.0, 0.0)
     
-    exact_matches = sum(1 for p, r in zip(predictions, references) if p == r)
-    accuracy = exact_matches / len(predictions)
+    accumulator = MetricsAccumulator()
+    accumulator.update(zip(predictions, references))
+    return accumulator.result()
+
+
+def make_categorizer(compound_terms: Set[str] = None) -> Callable[[str], List[str]]:
+    """정답 문장의 범주 판별 함수 (숫자, 법령 인용, 합성명사)
+    
+    합성명사는 어절이 용어로 시작하면 (용어 + 조사 등) 해당 범주로 본다.
+    """
+    compound_terms = TermTrie(compound_terms or ())
+    
+    def categorize(ref: str) -> List[str]:
+        categories = []
+        if NUMBER_PATTERN.search(ref):
+            categories.append('number')
+        if LEGAL_PATTERN.search(ref):
+            categories.append('legal')
+        if compound_terms and any(compound_terms.starts_with_term(word) for word in ref.split()):
+            categories.append('compound')
+        return categories
+    
+    return categorize
+
+
+class _Counts:
+    __slots__ = ('sentences', 'exact', 'char', 'word')
+    
+    def __init__(self):
+        self.sentences = 0
+        self.exact = 0
+        self.char = np.zeros(3, dtype=np.int64)
+        self.word = np.zeros(3, dtype=np.int64)
+    
+    def add(self, exact: bool, char: Tuple[int, int, int], word: Tuple[int, int, int]) -> None:
+        self.sentences += 1
+        self.exact += exact
+        self.char += char
+        self.word += word
+    
+    def to_metrics(self) -> SpacingMetrics:
+        if not self.sentences:
+            return SpacingMetrics(0.0, 0.0, 0.0, 0.0, 0.0)
+        precision, recall, char_f1 = _prf(*self.char)
+        _, _, word_f1 = _prf(*self.word)
+        return SpacingMetrics(
+            accuracy=self.exact / self.sentences,
+            char_f1=char_f1,
+            word_f1=word_f1,
+            precision=precision,
+            recall=recall
+        )
+
+
+class MetricsAccumulator:
+    """문장 쌍을 하나씩 누적하는 평가기 (전체 예측을 메모리에 올리지 않음)
+    
+    categorize 를 주면 정답 문장이 속한 범주별로도 따로 집계한다.
+    """
+    
+    def __init__(self, categorize: Callable[[str], Iterable[str]] = None):
+        self.categorize = categorize
+        self._total = _Counts()
+        self._categories: Dict[str, _Counts] = defaultdict(_Counts)
+    
+    def add(self, pred: str, ref: str, categories: Iterable[str] = None) -> None:
+        """예측/정답 한 쌍 누적 (categories 를 주면 자동 판별 대신 사용)"""
+        self.add_batch([(pred, ref)], [categories])
     
-    char_metrics = [_calculate_char_metrics(p, r) for p, r in zip(predictions, references)]
-    total_tp = sum(m[0] for m in char_metrics)
-    total_fp = sum(m[1] for m in char_metrics)
-    total_fn = sum(m[2] for m in char_metrics)
+    def add_batch(self, pairs: List[Tuple[str, str]], categories: List[Iterable[str]] = None) -> None:
+        """예측/정답 쌍 묶음 누적 - 문자 경계 비교는 묶음 전체를 한 번에 계산"""
+        chars = _batch_char_metrics(pairs)
+        for i, (pred, ref) in enumerate(pairs):
+            exact = pred == ref
+            char = chars[i]
+            word = _calculate_word_metrics(pred, ref)
+            
+            self._total.add(exact, char, word)
+            
+            names = categories[i] if categories is not None else None
+            if names is None and self.categorize is not None:
+                names = self.categorize(ref)
+            for category in names or ():
+                self._categories[category].add(exact, char, word)
     
-    char_precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 0.0
-    char_recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 0.0
-    char_f1 = 2 * char_precision * char_recall / (char_precision + char_recall) if (char_precision + char_recall) > 0 else 0.0
+    def update(self, pairs: Iterable[Tuple[str, str]], batch_size: int = DEFAULT_BATCH_SIZE) -> 'MetricsAccumulator':
+        """문장 쌍 스트림을 batch_size 개씩 누적"""
+        pairs = iter(pairs)
+        for batch in iter(lambda: list(islice(pairs, batch_size)), []):
+            self.add_batch(batch)
+        return self
     
-    word_metrics = [_calculate_word_metrics(p, r) for p, r in zip(predictions, references)]
-    total_tp_word = sum(m[0] for m in word_metrics)
-    total_fp_word = sum(m[1] for m in word_metrics)
-    total_fn_word = sum(m[2] for m in word_metrics)
+    @property
+    def count(self) -> int:
+        return self._total.sentences
     
-    word_precision = total_tp_word / (total_tp_word + total_fp_word) if (total_tp_word + total_fp_word) > 0 else 0.0
-    word_recall = total_tp_word / (total_tp_word + total_fn_word) if (total_tp_word + total_fn_word) > 0 else 0.0
-    word_f1 = 2 * word_precision * word_recall / (word_precision + word_recall) if (word_precision + word_recall) > 0 else 0.0
+    def result(self, category: str = None) -> SpacingMetrics:
+        """전체 (또는 범주별) 평가 지표"""
+        if category is None:
+            return self._total.to_metrics()
+        return self._categories[category].to_metrics() if category in self._categories else _Counts().to_metrics()
+    
+    def by_category(self) -> Dict[str, SpacingMetrics]:
+        return {name: counts.to_metrics() for name, counts in sorted(self._categories.items())}
+    
+    def category_counts(self) -> Dict[str, int]:
+        return {name: counts.sentences for name, counts in sorted(self._categories.items())}
+
+
+def evaluate_jsonl(
+    source: Union[str, TextIO],
+    categorize: Callable[[str], Iterable[str]] = None,
+    pred_key: str = 'prediction',
+    ref_key: str = 'reference',
+    category_key: str = 'category'
+) -> MetricsAccumulator:
+    """JSONL 스트림 평가 (한 줄에 예측/정답 한 쌍, category 필드가 있으면 그 범주로 집계)"""
+    accumulator = MetricsAccumulator(categorize)
     
-    return SpacingMetrics(
-        accuracy=accuracy,
-        char_f1=char_f1,
-        word_f1=word_f1,
-        precision=char_precision,
-        recall=char_recall
-    )
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            return _consume_jsonl(accumulator, f, pred_key, ref_key, category_key)
+    return _consume_jsonl(accumulator, source, pred_key, ref_key, category_key)
+
+
+def _consume_jsonl(
+    accumulator: MetricsAccumulator,
+    lines: Iterable[str],
+    pred_key: str,
+    ref_key: str,
+    category_key: str
+) -> MetricsAccumulator:
+    pairs, categories = [], []
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        names = record.get(category_key)
+        pairs.append((record[pred_key], record[ref_key]))
+        categories.append([names] if isinstance(names, str) else names)
+        if len(pairs) >= DEFAULT_BATCH_SIZE:
+            accumulator.add_batch(pairs, categories)
+            pairs, categories = [], []
+    if pairs:
+        accumulator.add_batch(pairs, categories)
+    return accumulator
+
+
+def _prf(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
+    return precision, recall, f1
 
 
 def _calculate_char_metrics(pred: str, ref: str) -> Tuple[int, int, int]:
-    """문자 단위 TP, FP, FN 계산"""
-    pred_chars = [c for c in pred if c != ' ']
-    ref_chars = [c for c in ref if c != ' ']
+    """문자 단위 TP, FP, FN 계산 (문자 사이 띄어쓰기 경계 벡터 비교)"""
+    return tuple(_batch_char_metrics([(pred, ref)])[0].tolist())
+
+
+def _batch_char_metrics(pairs: List[Tuple[str, str]]) -> np.ndarray:
+    """문장 쌍별 문자 단위 (TP, FP, FN) 행렬
     
-    if pred_chars != ref_chars:
-        return 0, len([c for c in pred if c == ' ']), len([c for c in ref if c == ' '])
+    공백 아닌 문자가 같은 쌍의 경계 비트맵을 배치 전체로 이어 붙여 한 번에 비교하고
+    문장별로 합산한다. 문자가 다른 쌍은 예측 공백을 FP, 정답 공백을 FN 으로 센다.
+    """
+    counts = np.zeros((len(pairs), 3), dtype=np.int64)
+    pred_cuts, ref_cuts, owners, sizes = [], [], [], []
+    offset = 0
     
-    pred_spaces = {i for i, c in enumerate(pred_chars[:-1]) if pred[pred.index(pred_chars[i]) + 1] == ' '}
-    ref_spaces = {i for i, c in enumerate(ref_chars[:-1]) if ref[ref.index(ref_chars[i]) + 1] == ' '}
+    for i, (pred, ref) in enumerate(pairs):
+        pred_words, ref_words = pred.split(), ref.split()
+        chars = ''.join(ref_words)
+        if ''.join(pred_words) != chars:
+            counts[i] = (0, pred.count(' '), ref.count(' '))
+            continue
+        # 어절 마지막 문자 뒤 경계 위치 (배치 전체 기준)
+        pred_cuts.extend(offset + end - 1 for end in accumulate(len(word) for word in pred_words[:-1]))
+        ref_cuts.extend(offset + end - 1 for end in accumulate(len(word) for word in ref_words[:-1]))
+        size = max(len(chars) - 1, 0)
+        owners.append(i)
+        sizes.append(size)
+        offset += size
     
-    tp = len(pred_spaces & ref_spaces)
-    fp = len(pred_spaces - ref_spaces)
-    fn = len(ref_spaces - pred_spaces)
+    pred_spaces = np.zeros(offset, dtype=bool)
+    ref_spaces = np.zeros(offset, dtype=bool)
+    pred_spaces[pred_cuts] = True
+    ref_spaces[ref_cuts] = True
+    owner = np.repeat(np.array(owners, dtype=np.int64), sizes)
     
-    return tp, fp, fn
+    counts[:, 0] += np.bincount(owner[pred_spaces & ref_spaces], minlength=len(pairs))
+    counts[:, 1] += np.bincount(owner[pred_spaces & ~ref_spaces], minlength=len(pairs))
+    counts[:, 2] += np.bincount(owner[ref_spaces & ~pred_spaces], minlength=len(pairs))
+    return counts
 
 
 def _calculate_word_metrics(pred: str, ref: str) -> Tuple[int, int, int]:
@@ -0,0 +1,104 @@
+"""
+단계/규칙별 프로파일러 (소요 시간, 호출 횟수, 텍스트 변경 횟수)
+"""
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+class Profiler:
+    """파이프라인 단계와 개별 규칙의 실행 통계 수집기
+    
+    SpacingCorrector(profile=True) 일 때만 생성되며, 꺼져 있을 때는 호출 경로에 끼어들지 않는다.
+    """
+    
+    KINDS = ('stage', 'rule', 'entry')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, List]] = {kind: {} for kind in self.KINDS}
+        self._declared: Dict[str, List[str]] = {kind: [] for kind in self.KINDS}
+    
+    def declare(self, kind: str, names: List[str]) -> None:
+        """기록이 없어도 0 으로 보고할 이름 (한 번도 매치되지 않은 규칙 항목을 찾기 위함, reset 후에도 유지)"""
+        with self._lock:
+            self._declared[kind] = list(dict.fromkeys(self._declared[kind] + list(names)))
+    
+    def record(self, kind: str, name: str, seconds: float, changed: bool = False) -> None:
+        with self._lock:
+            entry = self._records[kind].get(name)
+            if entry is None:
+                entry = self._records[kind][name] = [0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += changed
+    
+    def timed(self, kind: str, name: str, func: Callable, *args):
+        """func(*args) 실행 시간 기록 (텍스트 변경 여부는 기록하지 않음)"""
+        start = time.perf_counter()
+        result = func(*args)
+        self.record(kind, name, time.perf_counter() - start)
+        return result
+    
+    def run_text(self, kind: str, name: str, func: Callable[[str], str], text: str) -> str:
+        """문자열 변환 함수 실행 시간과 변경 여부 기록"""
+        start = time.perf_counter()
+        result = func(text)
+        self.record(kind, name, time.perf_counter() - start, result != text)
+        return result
+    
+    def run_pipeline(self, kind: str, steps: List[Tuple[str, Callable[[str], str]]], text: str) -> str:
+        for name, func in steps:
+            text = self.run_text(kind, name, func, text)
+        return text
+    
+    def merge(self, stats: Dict[str, Dict[str, Dict[str, float]]]) -> None:
+        """다른 프로파일러의 stats() 결과를 합산 (프로세스 풀 워커 통계 수집용)"""
+        with self._lock:
+            for kind, records in stats.items():
+                for name, entry in records.items():
+                    current = self._records[kind].setdefault(name, [0, 0.0, 0])
+                    current[0] += entry['calls']
+                    current[1] += entry['seconds']
+                    current[2] += entry['changed']
+    
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """{'stage': {이름: {calls, seconds, changed}}, 'rule': {...}, 'entry': {...}}
+        
+        'entry' 는 원본 규칙 테이블 항목별 매치 수 (calls) 와 실제로 텍스트를 바꾼 매치 수 (changed).
+        """
+        with self._lock:
+            stats = {}
+            for kind, records in self._records.items():
+                names = list(dict.fromkeys(self._declared[kind] + list(records)))
+                stats[kind] = {}
+                for name in names:
+                    calls, seconds, changed = records.get(name, (0, 0.0, 0))
+                    stats[kind][name] = {'calls': calls, 'seconds': seconds, 'changed': changed}
+            return stats
+    
+    def reset(self) -> None:
+        with self._lock:
+            for records in self._records.values():
+                records.clear()
+    
+    def to_prometheus(self, prefix: str = 'spacing') -> str:
+        """Prometheus 텍스트 형식 (counter)"""
+        lines = []
+        stats = self.stats()
+        metrics = [
+            ('calls_total', 'calls', '호출 횟수'),
+            ('seconds_total', 'seconds', '누적 소요 시간 (초)'),
+            ('changed_total', 'changed', '텍스트를 변경한 호출 횟수'),
+        ]
+        
+        for kind in self.KINDS:
+            for suffix, field, description in metrics:
+                metric = f'{prefix}_{kind}_{suffix}'
+                lines.append(f'# HELP {metric} {kind} {description}')
+                lines.append(f'# TYPE {metric} counter')
+                for name, entry in sorted(stats[kind].items()):
+                    label = name.replace('\\', '\\\\').replace('"', '\\"')
+                    lines.append(f'{metric}{{{kind}="{label}"}} {entry[field]}')
+        
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,128 @@
+"""
+교정 결과 캐시 (메모리 LRU + 선택적 SQLite 영구 저장소)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ResultCache:
+    """문장 단위 교정 결과 캐시
+    
+    메모리 계층은 max_entries 개까지 보관하는 LRU 이며, db_path 를 주면
+    SQLite 파일을 두 번째 계층으로 사용해 실행 간에 결과를 공유한다.
+    """
+    
+    COMMIT_INTERVAL = 256
+    
+    def __init__(self, max_entries: int = 10000, db_path: str = None):
+        if max_entries <= 0:
+            raise ValueError("max_entries 는 양수여야 합니다")
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path else None
+        self._memory: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._uncommitted = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        
+        if self.db_path:
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            self._conn.commit()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._copy(self._memory[key])
+            
+            if self._conn is not None:
+                row = self._conn.execute(
+                    'SELECT value FROM results WHERE key = ?', (self._disk_key(key),)
+                ).fetchone()
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.disk_hits += 1
+                    return self._copy(value)
+            
+            self.misses += 1
+            return None
+    
+    def put(self, key: str, value: Any) -> None:
+        """캐시 저장"""
+        with self._lock:
+            self._remember(key, self._copy(value))
+            
+            if self._conn is not None:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)',
+                    (self._disk_key(key), json.dumps(value, ensure_ascii=False))
+                )
+                self._uncommitted += 1
+                if self._uncommitted >= self.COMMIT_INTERVAL:
+                    self._commit()
+    
+    def clear(self) -> None:
+        """모든 계층 비우기"""
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM results')
+                self._commit()
+    
+    def flush(self) -> None:
+        """영구 저장소에 미반영 결과 기록"""
+        with self._lock:
+            if self._conn is not None:
+                self._commit()
+    
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._memory),
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+    
+    def __len__(self) -> int:
+        return len(self._memory)
+    
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+    
+    def _commit(self) -> None:
+        self._conn.commit()
+        self._uncommitted = 0
+    
+    @staticmethod
+    def _disk_key(key: str) -> str:
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        return list(value) if isinstance(value, list) else value
@@ -0,0 +1,186 @@
+"""
+띄어쓰기 경계 비트맵 - 공백을 제외한 문자열과 문자 사이 띄어쓰기 여부(bool 배열)로 문장을 표현
+"""
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List
+import numpy as np
+
+
+WORD_PATTERN = re.compile(r'\S+')
+
+
+@dataclass(frozen=True)
+class SpaceEdit:
+    """입력 기준 띄어쓰기 편집 구간 (text[start:end] 를 replacement 로 교체)"""
+    start: int
+    end: int
+    replacement: str
+    
+    @property
+    def kind(self) -> str:
+        if self.start == self.end:
+            return 'insert'
+        return 'delete' if not self.replacement else 'replace'
+    
+    def to_dict(self) -> dict:
+        return {'start': self.start, 'end': self.end, 'replacement': self.replacement}
+
+
+class SpacingBitmap:
+    """문자열을 공백 아닌 문자와 경계 비트맵으로 분해
+    
+    spaces[i] 는 i 번째 문자 뒤에 공백이 있는지를 나타내며 길이는 len(chars) - 1 이다.
+    문자열은 한 번만 보관하고, 띄어쓰기 변경은 비트맵만 수정한다.
+    """
+    
+    __slots__ = ('chars', 'spaces')
+    
+    def __init__(self, chars: str, spaces: np.ndarray = None):
+        self.chars = chars
+        self.spaces = spaces if spaces is not None else np.zeros(max(len(chars) - 1, 0), dtype=bool)
+    
+    @classmethod
+    def from_text(cls, text: str) -> 'SpacingBitmap':
+        words = text.split()
+        chars = ''.join(words)
+        bitmap = cls(chars)
+        if len(words) > 1:
+            ends = np.cumsum([len(word) for word in words[:-1]]) - 1
+            bitmap.spaces[ends] = True
+        return bitmap
+    
+    def to_text(self) -> str:
+        if not self.chars:
+            return ''
+        cuts = np.flatnonzero(self.spaces) + 1
+        if not len(cuts):
+            return self.chars
+        bounds = [0, *cuts.tolist(), len(self.chars)]
+        return ' '.join(self.chars[a:b] for a, b in zip(bounds, bounds[1:]))
+    
+    def copy(self) -> 'SpacingBitmap':
+        return SpacingBitmap(self.chars, self.spaces.copy())
+    
+    def __len__(self) -> int:
+        return len(self.chars)
+    
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, SpacingBitmap)
+            and self.chars == other.chars
+            and np.array_equal(self.spaces, other.spaces)
+        )
+
+
+def diff_spans(text: str, corrected: SpacingBitmap) -> List[SpaceEdit]:
+    """입력 문자열을 교정 결과로 바꾸는 편집 구간 목록 (입력 오프셋 기준, 오름차순)
+    
+    공백 아닌 문자가 입력과 다르면 (전각 문자 정규화 등) 문자 단위 비교로 바뀐 구간만 교체한다.
+    """
+    matches = list(WORD_PATTERN.finditer(text))
+    chars = ''.join(m.group() for m in matches)
+    
+    if chars != corrected.chars:
+        return _diff_text(text, corrected.to_text())
+    if not matches:
+        return [SpaceEdit(0, len(text), '')] if text else []
+    
+    starts = np.array([m.start() for m in matches])
+    ends = np.array([m.end() for m in matches])
+    lengths = ends - starts
+    
+    # 문자 인덱스 -> 입력 오프셋
+    char_starts = np.cumsum(lengths) - lengths
+    offsets = np.arange(len(chars)) + np.repeat(starts - char_starts, lengths)
+    
+    # 단어 사이 경계: 입력 공백 구간이 정확히 ' ' 한 칸인지
+    gap_index = char_starts[1:] - 1
+    single = np.array([text[a:b] == ' ' for a, b in zip(ends[:-1], starts[1:])], dtype=bool)
+    original = np.zeros(len(corrected.spaces), dtype=bool)
+    original[gap_index] = True
+    exact = ~original
+    exact[gap_index] = single
+    
+    changed = np.flatnonzero((original != corrected.spaces) | (corrected.spaces & ~exact))
+    
+    edits = []
+    if starts[0] > 0:
+        edits.append(SpaceEdit(0, int(starts[0]), ''))
+    for i in changed.tolist():
+        start = int(offsets[i]) + 1
+        end = int(offsets[i + 1])
+        edits.append(SpaceEdit(start, end, ' ' if corrected.spaces[i] else ''))
+    if ends[-1] < len(text):
+        edits.append(SpaceEdit(int(ends[-1]), len(text), ''))
+    return edits
+
+
+def _diff_text(text: str, target: str) -> List[SpaceEdit]:
+    """문자 단위 비교로 구한 편집 구간 (공백 아닌 문자가 바뀐 경우용)"""
+    matcher = SequenceMatcher(None, text, target, autojunk=False)
+    return [
+        SpaceEdit(i1, i2, target[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != 'equal'
+    ]
+
+
+def apply_spans(text: str, edits: List[SpaceEdit]) -> str:
+    """편집 구간을 입력 문자열에 적용"""
+    parts = []
+    last = 0
+    for edit in edits:
+        parts.append(text[last:edit.start])
+        parts.append(edit.replacement)
+        last = edit.end
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+def align_tokens(source: List[str], output: List[str]) -> List[List[int]]:
+    """출력 토큰마다 그 토큰을 이루는 입력 토큰 번호 목록 (공백 아닌 문자 위치 기준, 오름차순)
+    
+    교정 파이프라인은 띄어쓰기만 바꾸므로 출력의 n 번째 문자는 입력의 n 번째 문자에서 온다.
+    문자 수가 다르면 입력보다 많은 문자는 마지막 입력 문자에 대응시킨다.
+    """
+    source_lengths = np.array([len(''.join(token.split())) for token in source], dtype=np.int64)
+    output_lengths = [len(''.join(token.split())) for token in output]
+    
+    # 입력 문자 -> 입력 토큰 번호
+    owners = np.repeat(np.arange(len(source)), source_lengths)
+    if not len(owners):
+        return [[] for _ in output]
+    
+    alignment = []
+    start = 0
+    for length in output_lengths:
+        positions = np.minimum(np.arange(start, start + length), len(owners) - 1)
+        alignment.append(np.unique(owners[positions]).tolist())
+        start += length
+    return alignment
+
+
+def merge_sources(before: List[str], after: List[str], sources: List[List[int]]) -> List[List[int]]:
+    """이웃 토큰을 이어 붙이는 토큰 단계의 출력 토큰별 출처 (before[i] 의 출처가 sources[i])
+    
+    after 의 각 토큰은 before 의 연속 토큰을 이어 붙인 것이어야 하며 빈 토큰과 공백 토큰은 버려질 수 있다.
+    """
+    merged = []
+    i = 0
+    for token in after:
+        built, owners = '', set()
+        while built != token:
+            if i >= len(before):
+                raise ValueError(f"토큰 단계 출력이 입력 토큰을 이어 붙인 것이 아닙니다: {token!r}")
+            if not token.startswith(built + before[i]):
+                if before[i].strip():
+                    raise ValueError(f"토큰 단계 출력이 입력 토큰을 이어 붙인 것이 아닙니다: {token!r}")
+                i += 1
+                continue
+            built += before[i]
+            owners.update(sources[i])
+            i += 1
+        merged.append(sorted(owners))
+    return merged
@@ -0,0 +1,64 @@
+"""
+용어 사전 트라이
+"""
+from typing import Dict, Iterable, List
+
+
+class TermTrie:
+    """문자 단위 트라이 - 토큰 열에서 후보 문자열을 만들지 않고 최장 일치 탐색"""
+    
+    _END = ''
+    
+    def __init__(self, terms: Iterable[str] = ()):
+        self._root: Dict[str, dict] = {}
+        self._size = 0
+        for term in terms:
+            self.add(term)
+    
+    def add(self, term: str) -> None:
+        """용어 추가"""
+        if not term:
+            return
+        node = self._root
+        for ch in term:
+            node = node.setdefault(ch, {})
+        if self._END not in node:
+            node[self._END] = True
+            self._size += 1
+    
+    def __contains__(self, term: str) -> bool:
+        node = self._root
+        for ch in term:
+            node = node.get(ch)
+            if node is None:
+                return False
+        return self._END in node
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def starts_with_term(self, text: str) -> bool:
+        """text 가 사전 용어로 시작하는지 (용어 뒤에 조사 등이 붙은 어절 판별용)"""
+        node = self._root
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+    
+    def longest_token_match(self, tokens: List[str], start: int, min_tokens: int = 2) -> int:
+        """tokens[start:] 를 붙여 쓴 문자열 중 사전에 있는 가장 긴 토큰 접두 길이 (없으면 0)"""
+        node = self._root
+        best = 0
+        
+        for j in range(start, len(tokens)):
+            for ch in tokens[j]:
+                node = node.get(ch)
+                if node is None:
+                    return best
+            if self._END in node and j - start + 1 >= min_tokens:
+                best = j - start + 1
+        
+        return best
@@ -0,0 +1,68 @@
+"""
+비동기 마이크로 배칭 교정기 테스트
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.async_corrector import AsyncSpacingCorrector
+from core.spacing_corrector import SpacingCorrector
+
+
+def load_inputs():
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return [ex['input'] for ex in json.load(f)]
+
+
+def test_concurrent_requests_are_batched():
+    """동시 요청이 배치로 묶이고 결과는 요청별로 정확히 전달"""
+    corrector = SpacingCorrector(use_pykospacing=True, use_kospacing=False, use_validator=False)
+    inputs = load_inputs() * 4
+    
+    async def run():
+        service = AsyncSpacingCorrector(corrector, max_batch_size=8, max_wait_ms=20)
+        results = await asyncio.gather(*(service.correct(x) for x in inputs))
+        stats = (service.batch_count, service.request_count, service.queue_depth)
+        detailed = await service.correct_detailed(inputs[0])
+        await service.close()
+        return results, stats, detailed
+    
+    results, (batches, requests, depth), detailed = asyncio.run(run())
+    assert results == [corrector.correct(x) for x in inputs]
+    assert detailed.output == results[0]
+    assert detailed.dictionary_version == corrector.get_info()['dictionary_version']
+    assert requests == len(inputs)
+    assert batches < len(inputs)
+    assert depth == 0
+
+
+def test_close_cancels_running_batch():
+    """배치 실행 중 close() 하면 그 배치의 요청도 취소되어 대기가 끝남"""
+    import threading
+    
+    started, release = threading.Event(), threading.Event()
+    
+    class BlockingCorrector:
+        def batch_correct_detailed(self, inputs):
+            started.set()
+            release.wait(5)
+            return inputs
+    
+    async def run():
+        service = AsyncSpacingCorrector(BlockingCorrector(), max_batch_size=2, max_wait_ms=0)
+        requests = [asyncio.ensure_future(service.correct(x)) for x in ['가', '나']]
+        await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+        
+        closing = asyncio.ensure_future(service.close())
+        done, _ = await asyncio.wait(requests, timeout=2)
+        release.set()
+        await closing
+        return [request.cancelled() for request in requests], len(done)
+    
+    cancelled, done = asyncio.run(run())
+    assert cancelled == [True, True]
+    assert done == 2
@@ -0,0 +1,32 @@
+"""
+배치 추론 유틸리티 테스트
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.batching import flatten_chunks, length_buckets, split_by_length
+
+
+def test_split_by_length():
+    assert split_by_length('가나다', 5) == ['가나다']
+    assert split_by_length('가나다라마바', 4) == ['가나다라', '마바']
+
+
+def test_length_buckets_sorted_and_bounded():
+    lengths = [5, 1, 9, 3, 7]
+    buckets = list(length_buckets(lengths, 2))
+    assert buckets == [[1, 3], [0, 4], [2]]
+    assert sorted(i for bucket in buckets for i in bucket) == list(range(len(lengths)))
+
+
+def test_flatten_chunks_scatter_back():
+    texts = ['가나다라마', '바', '사아자차카타']
+    chunks, owners = flatten_chunks(texts, 3)
+    assert owners == [0, 0, 1, 2, 2]
+    
+    restored = [''] * len(texts)
+    for owner, chunk in zip(owners, chunks):
+        restored[owner] += chunk
+    assert restored == texts
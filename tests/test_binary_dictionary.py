@@ -0,0 +1,109 @@
+"""
+사전 바이너리 포맷 테스트
+"""
+import random
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.binary_dictionary import BINARY_FILENAME, SortedTermTable, compile_dictionaries
+from utils.dictionary_loader import DictionaryLoader
+from utils.term_trie import TermTrie
+
+DICT_DIR = Path(__file__).parent.parent / "data" / "dictionaries"
+
+
+def copy_dictionaries(tmp_path):
+    for path in DICT_DIR.glob('*.txt'):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
+
+
+def test_binary_matches_text_sources(tmp_path):
+    dict_dir = copy_dictionaries(tmp_path)
+    compile_dictionaries(dict_dir)
+    
+    text = DictionaryLoader(dict_dir, use_binary=False)
+    text.load_all()
+    binary = DictionaryLoader(dict_dir)
+    binary.load_all()
+    
+    assert binary.binary is not None
+    assert isinstance(binary.compound_nouns, SortedTermTable)
+    for name in ('compound_nouns', 'financial_terms', 'legal_terms', 'proper_nouns'):
+        assert set(getattr(binary, name)) == getattr(text, name)
+    assert set(binary.get_all_terms()) == text.get_all_terms()
+    assert binary.content_hash() == text.content_hash()
+    assert '투자신탁' in binary.get_all_terms() and '없는용어' not in binary.get_all_terms()
+
+
+def test_longest_token_match_matches_trie(tmp_path):
+    dict_dir = copy_dictionaries(tmp_path)
+    compile_dictionaries(dict_dir)
+    loader = DictionaryLoader(dict_dir)
+    loader.load_all()
+    
+    terms = sorted(loader.get_all_terms())
+    table = loader.term_index()
+    trie = TermTrie(terms)
+    rng = random.Random(3)
+    
+    for _ in range(500):
+        term = rng.choice(terms)
+        cuts = sorted(rng.sample(range(1, len(term)), min(2, len(term) - 1))) if len(term) > 1 else []
+        tokens = [term[a:b] for a, b in zip([0] + cuts, cuts + [len(term)])]
+        tokens += rng.choice([[], ['의'], [rng.choice(terms)]])
+        for start in range(len(tokens)):
+            assert table.longest_token_match(tokens, start) == trie.longest_token_match(tokens, start)
+
+
+def test_stale_binary_falls_back_to_text(tmp_path):
+    dict_dir = copy_dictionaries(tmp_path)
+    compile_dictionaries(dict_dir)
+    with open(dict_dir / 'compound_nouns.txt', 'a', encoding='utf-8') as f:
+        f.write('\n새로운합성명사\n')
+    
+    loader = DictionaryLoader(dict_dir)
+    loader.load_all()
+    
+    assert loader.binary is None
+    assert '새로운합성명사' in loader.compound_nouns
+
+
+def test_binary_without_text_sources(tmp_path):
+    deploy_dir = tmp_path / 'deploy'
+    deploy_dir.mkdir()
+    compile_dictionaries(DICT_DIR, deploy_dir / BINARY_FILENAME)
+    
+    loader = DictionaryLoader(deploy_dir)
+    loader.load_all()
+    
+    assert loader.binary is not None
+    assert '투자신탁' in loader.get_all_terms()
+
+
+def test_unchanged_sources_are_not_rehashed(tmp_path, monkeypatch):
+    import os
+    from utils import binary_dictionary
+    
+    dict_dir = copy_dictionaries(tmp_path)
+    compile_dictionaries(dict_dir)
+    calls = []
+    digest = binary_dictionary.source_digest
+    monkeypatch.setattr(binary_dictionary, 'source_digest', lambda path: calls.append(path) or digest(path))
+    
+    assert binary_dictionary.BinaryDictionary.open_if_current(dict_dir) is not None
+    assert calls == []
+    
+    # 수정 시각만 바뀌면 내용을 해시해 확인하고 그대로 사용
+    path = dict_dir / 'legal_terms.txt'
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert binary_dictionary.BinaryDictionary.open_if_current(dict_dir) is not None
+    assert len(calls) == 1
+    
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('\n새로운법령용어\n')
+    assert binary_dictionary.BinaryDictionary.open_if_current(dict_dir) is None
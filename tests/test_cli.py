@@ -0,0 +1,137 @@
+"""
+파일 교정 CLI 테스트
+"""
+import csv
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from click.testing import CliRunner
+from core.cli import main
+from core.spacing_corrector import SpacingCorrector
+
+
+LINES = ['제 1 조 에 따라', '법 령 및 규정이 변경되는 경우', '', '투자 신탁 은 위험하다'] * 5
+
+
+@pytest.fixture(scope="module")
+def corrector():
+    return SpacingCorrector(use_pykospacing=False)
+
+
+def run(*args):
+    result = CliRunner().invoke(main, [*map(str, args), '--no-pykospacing', '--quiet'])
+    assert result.exit_code == 0, result.output
+    return result
+
+
+def test_txt(tmp_path, corrector):
+    source, output = tmp_path / 'in.txt', tmp_path / 'out.txt'
+    source.write_text('\n'.join(LINES) + '\n', encoding='utf-8')
+    
+    run(source, output, '--chunk-size', 3)
+    
+    assert output.read_text(encoding='utf-8').split('\n')[:-1] == corrector.batch_correct(LINES)
+    assert not (tmp_path / 'out.txt.checkpoint').exists()
+
+
+def test_jsonl_output_field_with_workers(tmp_path, corrector):
+    source, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    records = [{'id': i, 'text': line} for i, line in enumerate(LINES)]
+    records.append({'id': 'tokens', 'text': ['투자', '신탁', '은']})
+    source.write_text(''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records), encoding='utf-8')
+    
+    run(source, output, '--output-field', 'corrected', '--workers', 2, '--chunk-size', 4)
+    
+    rows = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert [row['id'] for row in rows] == [r['id'] for r in records]
+    assert [row['text'] for row in rows] == [r['text'] for r in records]
+    assert [row['corrected'] for row in rows] == corrector.batch_correct([r['text'] for r in records])
+
+
+def test_jsonl_null_and_missing_fields_pass_through(tmp_path):
+    source, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    records = [{'id': 0, 'text': None}, {'id': 1, 'text': '법 령 및 규정'}, {'id': 2}, {'id': 3, 'text': None}]
+    source.write_text(''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records), encoding='utf-8')
+    
+    run(source, output, '--output-field', 'corrected', '--chunk-size', 1)
+    
+    rows = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert [row['id'] for row in rows] == [0, 1, 2, 3]
+    assert [row['corrected'] for row in rows] == [None, '법령 및 규정', None, None]
+    assert rows[2] == {'id': 2, 'corrected': None}
+
+
+def test_jsonl_non_object_line_is_rejected(tmp_path):
+    source, output = tmp_path / 'in.jsonl', tmp_path / 'out.jsonl'
+    source.write_text('{"text": "법 령"}\n\n["법 령"]\n', encoding='utf-8')
+    
+    result = CliRunner().invoke(main, [str(source), str(output), '--no-pykospacing', '--quiet'])
+    
+    assert result.exit_code != 0
+    assert '3번째 줄이 객체가 아닙니다' in result.output
+
+
+def test_csv_keeps_columns_and_multiline_fields(tmp_path, corrector):
+    source, output = tmp_path / 'in.csv', tmp_path / 'out.csv'
+    rows = [['id', 'text']] + [[str(i), line] for i, line in enumerate(LINES)] + [['x', '법 령\n및 규정']]
+    with open(source, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(rows)
+    
+    run(source, output)
+    
+    with open(output, encoding='utf-8', newline='') as f:
+        written = list(csv.reader(f))
+    assert written[0] == ['id', 'text']
+    assert [row[0] for row in written[1:]] == [row[0] for row in rows[1:]]
+    assert [row[1] for row in written[1:]] == corrector.batch_correct([row[1] for row in rows[1:]])
+
+
+def test_resume_from_checkpoint(tmp_path):
+    source, output, expected = tmp_path / 'in.txt', tmp_path / 'out.txt', tmp_path / 'expected.txt'
+    source.write_text('\n'.join(LINES) + '\n', encoding='utf-8')
+    run(source, expected)
+    
+    # 7번째 레코드까지 기록하고 체크포인트를 남긴 뒤 일부만 더 쓰다가 중단된 상태
+    done = 7
+    expected_bytes = expected.read_bytes()
+    output_offset = len(b''.join(expected_bytes.splitlines(keepends=True)[:done]))
+    input_offset = len(b''.join(source.read_bytes().splitlines(keepends=True)[:done]))
+    output.write_bytes(expected_bytes[:output_offset] + '부분 기록'.encode('utf-8'))
+    (tmp_path / 'out.txt.checkpoint').write_text(json.dumps({
+        'input': str(source.resolve()),
+        'input_size': source.stat().st_size,
+        'input_offset': input_offset,
+        'output_offset': output_offset,
+        'records': done,
+    }))
+    
+    run(source, output, '--checkpoint-every', 2)
+    
+    assert output.read_bytes() == expected_bytes
+    assert not (tmp_path / 'out.txt.checkpoint').exists()
+
+
+def test_checkpoint_for_other_input_is_rejected(tmp_path):
+    source, output = tmp_path / 'in.txt', tmp_path / 'out.txt'
+    source.write_text('법 령\n', encoding='utf-8')
+    output.write_text('', encoding='utf-8')
+    (tmp_path / 'out.txt.checkpoint').write_text(json.dumps({'input': 'other.txt', 'input_size': 1}))
+    
+    result = CliRunner().invoke(main, [str(source), str(output), '--no-pykospacing', '--quiet'])
+    assert result.exit_code != 0
+    assert '체크포인트' in result.output
+
+
+def test_markup_filing(tmp_path):
+    source, output = tmp_path / 'filing.xml', tmp_path / 'corrected.xml'
+    source.write_text('<DOCUMENT><P>법 령 및 규정</P><TABLE><TR><TD>투자 신탁 은</TD></TR></TABLE></DOCUMENT>', encoding='utf-8')
+    
+    run(source, output, '--chunk-size', 1)
+    
+    assert output.read_text(encoding='utf-8') == (
+        '<DOCUMENT><P>법령 및 규정</P><TABLE><TR><TD>투자신탁 은</TD></TR></TABLE></DOCUMENT>'
+    )
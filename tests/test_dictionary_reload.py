@@ -0,0 +1,121 @@
+"""
+사전 스냅샷 교체 테스트
+"""
+import gc
+import shutil
+import sys
+import time
+import weakref
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector, clear_shared_correctors, get_shared_corrector
+from utils.binary_dictionary import compile_dictionaries
+from utils.result_cache import ResultCache
+
+DICT_DIR = Path(__file__).parent.parent / "data" / "dictionaries"
+TOKENS = ["신규", "합성", "용어", "입니다"]
+
+
+def make_dict_dir(tmp_path):
+    for path in DICT_DIR.glob('*.txt'):
+        shutil.copy(path, tmp_path / path.name)
+    return tmp_path
+
+
+def add_term(dict_dir, term):
+    with open(dict_dir / 'compound_nouns.txt', 'a', encoding='utf-8') as f:
+        f.write(f'\n{term}\n')
+
+
+def test_reload_swaps_snapshot(tmp_path):
+    dict_dir = make_dict_dir(tmp_path)
+    corrector = SpacingCorrector(dict_dir=str(dict_dir), cache=ResultCache())
+    
+    before = corrector.correct_detailed(TOKENS)
+    assert before.output == TOKENS
+    assert corrector.reload_dictionaries() is False
+    
+    in_flight = corrector.dict_loader.snapshot()
+    add_term(dict_dir, '신규합성용어')
+    
+    assert corrector.reload_dictionaries() is True
+    after = corrector.correct_detailed(TOKENS)
+    assert after.output == ["신규합성용어", "입니다"]
+    assert after.dictionary_version != before.dictionary_version
+    assert corrector.get_info()['dictionary_version'] == after.dictionary_version
+    
+    # 교체 전에 잡은 스냅샷으로 진행 중인 요청은 이전 사전으로 끝남
+    assert corrector._correct(TOKENS, in_flight) == TOKENS
+    assert in_flight.version == before.dictionary_version
+
+
+def test_auto_reload(tmp_path):
+    dict_dir = make_dict_dir(tmp_path)
+    with SpacingCorrector(dict_dir=str(dict_dir), reload_interval=0.05) as corrector:
+        version = corrector.get_info()['dictionary_version']
+        watcher = corrector.dict_loader._watcher
+        add_term(dict_dir, '신규합성용어')
+        deadline = time.time() + 5
+        while corrector.get_info()['dictionary_version'] == version and time.time() < deadline:
+            time.sleep(0.02)
+        
+        assert corrector.correct(TOKENS) == ["신규합성용어", "입니다"]
+    
+    assert not watcher.is_alive()
+
+
+def test_shared_corrector_eviction_stops_reload_thread(tmp_path):
+    dict_dir = make_dict_dir(tmp_path)
+    clear_shared_correctors()
+    corrector = get_shared_corrector(dict_dir=str(dict_dir), reload_interval=0.05)
+    watcher = corrector.dict_loader._watcher
+    assert watcher.is_alive()
+    
+    clear_shared_correctors()
+    
+    assert not watcher.is_alive()
+
+
+def test_entry_points_report_snapshot_version(tmp_path):
+    dict_dir = make_dict_dir(tmp_path)
+    corrector = SpacingCorrector(dict_dir=str(dict_dir))
+    version = corrector.get_info()['dictionary_version']
+    
+    assert [result.dictionary_version for result in corrector.batch_correct_detailed([TOKENS, '법 령'])] == [version] * 2
+    assert corrector.correct_incremental('doc', '법 령 을 따른다.').dictionary_version == version
+    
+    add_term(dict_dir, '신규합성용어')
+    corrector.reload_dictionaries()
+    results = corrector.batch_correct_detailed([TOKENS])
+    assert results[0].output == ["신규합성용어", "입니다"]
+    assert results[0].dictionary_version != version
+    assert corrector.correct_incremental('doc', '법 령 을 따른다.').dictionary_version == results[0].dictionary_version
+
+
+def test_replaced_binary_stays_usable_while_referenced(tmp_path):
+    dict_dir = make_dict_dir(tmp_path)
+    compile_dictionaries(dict_dir)
+    corrector = SpacingCorrector(dict_dir=str(dict_dir))
+    # acquire 없이 잡은 참조도 교체 후 그대로 조회할 수 있어야 함
+    held = corrector.dict_loader.snapshot()
+    binary = weakref.ref(held.binary)
+    
+    with corrector.dict_loader.acquire() as in_flight:
+        assert in_flight is held and held.binary is not None
+        add_term(dict_dir, '신규합성용어')
+        compile_dictionaries(dict_dir)
+        assert corrector.reload_dictionaries() is True
+        assert corrector._correct(TOKENS, in_flight) == TOKENS
+    
+    assert not held.binary.closed
+    assert '신규합성용어' not in held.all_terms
+    assert corrector.postprocessor.postprocess_tokens(TOKENS, held) == TOKENS
+    assert corrector.postprocessor.postprocess_tokens(TOKENS) == ["신규합성용어", "입니다"]
+    assert corrector.correct(TOKENS) == ["신규합성용어", "입니다"]
+    
+    # 마지막 참조가 사라지면 이전 바이너리 사전 (mmap) 도 해제됨
+    del held, in_flight
+    gc.collect()
+    assert binary() is None
@@ -0,0 +1,75 @@
+"""
+앙상블 투표 테스트
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.ensemble import EnsembleModel
+
+
+class FixedModel:
+    """미리 정한 결과를 돌려주는 테스트용 백엔드"""
+    
+    def __init__(self, outputs, delay=0.0):
+        self.outputs = outputs
+        self.delay = delay
+        self.calls = 0
+    
+    def is_available(self):
+        return True
+    
+    def correct(self, text):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.outputs.get(text)
+    
+    def correct_batch(self, texts, max_batch_size=64, max_length=198):
+        self.calls += 1
+        time.sleep(self.delay)
+        return [self.outputs.get(text) for text in texts]
+
+
+def make_ensemble(**backends):
+    ensemble = EnsembleModel(use_pykospacing=False, use_kospacing=False,
+                             weights={name: w for name, (_, w) in backends.items()})
+    ensemble.models = [(name, model) for name, (model, _) in backends.items()]
+    return ensemble
+
+
+def test_weighted_character_vote():
+    text = '투 자신탁 으로'
+    ensemble = make_ensemble(
+        a=(FixedModel({text: '투자신탁으로'}), 1.0),
+        b=(FixedModel({text: '투자 신탁으로'}), 1.0),
+        c=(FixedModel({text: '투자신탁 으로'}), 1.0),
+    )
+    assert ensemble.correct(text) == '투자신탁으로'
+
+
+def test_tie_keeps_input_and_bad_output_ignored():
+    text = '투자 신탁'
+    ensemble = make_ensemble(
+        a=(FixedModel({text: '투자신탁'}), 1.0),
+        b=(FixedModel({text: '투자 신탁'}), 1.0),
+        c=(FixedModel({text: '투자신탁이'}), 5.0),
+    )
+    assert ensemble.correct(text) == '투자 신탁'
+    assert ensemble.correct(text, method='first') == '투자신탁'
+
+
+def test_models_run_concurrently_once_each():
+    text = '법 령'
+    a, b = FixedModel({text: '법령'}, delay=0.2), FixedModel({text: '법령'}, delay=0.2)
+    ensemble = make_ensemble(a=(a, 1.0), b=(b, 1.0))
+    
+    start = time.perf_counter()
+    assert ensemble.correct(text) == '법령'
+    assert time.perf_counter() - start < 0.35
+    assert a.calls == b.calls == 1
+    
+    assert ensemble.correct_batch([text, '사 전', text]) == ['법령', '사 전', '법령']
+    assert a.calls == b.calls == 2
+    ensemble.close()
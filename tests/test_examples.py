@@ -230,6 +230,12 @@ def test_all_examples_accuracy(corrector, examples):
     assert accuracy >= 0.6, f"전체 정확도가 60% 미만입니다: {accuracy:.1%}"
 
 
+def test_batch_correct_matches_correct(corrector, examples):
+    """배치 교정 결과가 개별 교정 결과와 동일 (입력 순서 유지)"""
+    inputs = [ex['input'] for ex in examples]
+    assert corrector.batch_correct(inputs) == [corrector.correct(x) for x in inputs]
+
+
 if __name__ == "__main__":
     # 직접 실행 시
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,103 @@
+"""
+내보낸 PyKoSpacing 백엔드 테스트
+"""
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models.ensemble import EnsembleModel
+from models.exported_model import ExportedSpacingModel, encode_sequences, vocab_path
+from models.pykospacing_model import PyKoSpacingModel
+
+
+W2IDX = {'«': 1, '»': 2, '^': 3, '다': 4, '한': 5, '국': 6}
+
+
+class SpaceAfterRunner:
+    """'다' 뒤에 띄어쓰기를 예측하는 런타임 대역"""
+    
+    def __init__(self):
+        self.shapes = []
+    
+    def __call__(self, matrix):
+        self.shapes.append(matrix.shape)
+        return (matrix == W2IDX['다']).astype(np.float32)[..., None]
+
+
+def loaded_model(tmp_path, runner, maxlen=None):
+    path = tmp_path / 'pykospacing.tflite'
+    model = ExportedSpacingModel(path)
+    model._w2idx, model._unknown_index, model._fixed_length = W2IDX, 7, maxlen
+    model._runner = runner
+    model._available = model._loaded = True
+    return model
+
+
+def test_encode_sequences_pads_and_maps_unknown():
+    matrix = encode_sequences(['«한국»', '«다가나다라»'], W2IDX, 7, maxlen=5)
+    
+    assert matrix.dtype == np.int32
+    assert matrix.tolist() == [[1, 5, 6, 2, 0], [1, 4, 7, 7, 4]]
+
+
+def test_batch_decodes_like_pykospacing(tmp_path):
+    runner = SpaceAfterRunner()
+    model = loaded_model(tmp_path, runner)
+    
+    results = model.correct_batch(['한국다한국다', '다 한국', '한국'], max_batch_size=2)
+    
+    assert results == ['한국다 한국다', '다 한국', '한국']
+    assert len(runner.shapes) == 2
+    assert model.correct('다다') == '다 다'
+
+
+def test_fixed_length_and_chunking(tmp_path):
+    runner = SpaceAfterRunner()
+    model = loaded_model(tmp_path, runner, maxlen=6)
+    
+    assert model.correct_batch(['한국다한국다한'], max_length=4) == ['한국다 한국다 한']
+    assert {shape[1] for shape in runner.shapes} == {6}
+
+
+def test_missing_model_is_not_installed(tmp_path):
+    path = tmp_path / 'pykospacing.onnx'
+    model = ExportedSpacingModel(path)
+    
+    assert not model.is_installed()
+    assert not model.is_available()
+    assert model.correct_batch(['한국']) == [None]
+    
+    with pytest.warns(UserWarning, match='PyKoSpacing'):
+        ensemble = EnsembleModel(exported_model=str(path))
+    expected = ['pykospacing'] if PyKoSpacingModel().is_installed() else []
+    assert [name for name, _ in ensemble.models] == expected
+
+
+def test_installed_with_model_files_and_runtime(tmp_path):
+    pytest.importorskip('onnxruntime')
+    path = tmp_path / 'pykospacing.onnx'
+    path.write_bytes(b'')
+    vocab_path(path).write_text(json.dumps({'w2idx': W2IDX, 'unknown_index': 7, 'maxlen': None}))
+    
+    assert ExportedSpacingModel(path).is_installed()
+
+
+def test_cache_version_distinguishes_exported_models(tmp_path):
+    from core.spacing_corrector import SpacingCorrector
+    
+    versions = set()
+    for name, quantized in [('float.onnx', False), ('int8.onnx', True)]:
+        path = tmp_path / name
+        path.write_bytes(b'')
+        vocab_path(path).write_text(json.dumps({'w2idx': W2IDX, 'unknown_index': 7, 'quantized': quantized}))
+        corrector = SpacingCorrector(use_pykospacing=False)
+        corrector.model.models.append(('pykospacing_exported', ExportedSpacingModel(path)))
+        versions.add(corrector.cache_version())
+    
+    versions.add(SpacingCorrector(use_pykospacing=False).cache_version())
+    assert len(versions) == 3
@@ -0,0 +1,129 @@
+"""
+공시 문서 (DART XML / HTML) 교정 테스트
+"""
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from core.filing import FilingResult, correct_markup, detect_encoding, iter_markup_tokens
+from core.spacing_corrector import SpacingCorrector
+
+
+FILING = '''<?xml version="1.0" encoding="utf-8"?>
+<DOCUMENT><BODY><SECTION-1 ACLASS="MANDATORY"><TITLE ATOC="Y">제 1 조 ( 목적 )</TITLE>
+<P>&nbsp;&nbsp;법 령 및 규정이 변경되는 경우 &amp; 투자 신탁 은 위험하다</P>
+<!-- 법 령 주석 --><script>var a = "법 령";</script>
+<TABLE BORDER="1"><TBODY><TR><TH>구분</TH><TE ALIGN="RIGHT">2 , 000</TE><TU>투자 신탁 은</TU></TR></TBODY></TABLE>
+<P>변경 <SPAN USERMARK="B">법 령</SPAN> 없음<PGBRK/></P></SECTION-1></BODY></DOCUMENT>
+'''
+TAG = re.compile(r'<[^>]*>')
+
+
+class RecordingCorrector:
+    """교정 요청을 기록하는 대역 (공백 제거만 수행)"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, units):
+        self.calls.append(list(units))
+        return [[''.join(unit)] if isinstance(unit, list) else ''.join(unit.split()) for unit in units]
+
+
+@pytest.fixture(scope="module")
+def corrector():
+    return SpacingCorrector(use_pykospacing=False)
+
+
+def test_tokens_round_trip_across_chunk_boundaries():
+    for size in (1, 3, 17, len(FILING)):
+        chunks = [FILING[i:i + size] for i in range(0, len(FILING), size)]
+        tokens = list(iter_markup_tokens(chunks))
+        assert ''.join(raw for _, raw in tokens) == FILING
+        assert ('markup', '<TE ALIGN="RIGHT">') in tokens
+        assert ('markup', '<!-- 법 령 주석 -->') in tokens
+
+
+def test_markup_is_preserved_and_cells_use_list_path():
+    recorder = RecordingCorrector()
+    result = FilingResult()
+    
+    output = ''.join(correct_markup([FILING], recorder, result=result))
+    
+    assert TAG.findall(output) == TAG.findall(FILING)
+    units = [unit for call in recorder.calls for unit in call]
+    assert ['투자', '신탁', '은'] in units
+    assert '제 1 조 ( 목적 )' in units
+    assert '법 령 및 규정이 변경되는 경우 & 투자 신탁 은 위험하다' in units
+    assert '<TU>투자신탁은</TU>' in output
+    assert '<P>&nbsp;&nbsp;법령및규정이변경되는경우&amp;투자신탁은위험하다</P>' in output
+    assert '<!-- 법 령 주석 --><script>var a = "법 령";</script>' in output
+    assert '<TE ALIGN="RIGHT">2 , 000</TE>' in output
+    assert result.units == 7 and result.cells == 2
+
+
+def test_batches_are_streamed():
+    recorder = RecordingCorrector()
+    paragraphs = (f'<P>제 {i} 조 에 따라</P>\n' for i in range(100))
+    
+    output = correct_markup(paragraphs, recorder, batch_size=8)
+    
+    # 대기 중인 교정 단위가 없으면 마크업은 교정을 기다리지 않음
+    assert next(output) == '<P>' and recorder.calls == []
+    assert next(output) == '제0조에따라'
+    assert len(recorder.calls) == 1 and len(recorder.calls[0]) == 8
+    assert len(list(output)) > 0
+    assert all(len(call) <= 8 for call in recorder.calls)
+    assert sum(len(call) for call in recorder.calls) == 100
+
+
+def test_correct_filing_keeps_encoding(tmp_path, corrector):
+    source, output = tmp_path / 'filing.xml', tmp_path / 'corrected.xml'
+    text = FILING.replace('encoding="utf-8"', 'encoding="euc-kr"')
+    source.write_bytes(text.encode('cp949'))
+    
+    result = corrector.correct_filing(source, output, batch_size=3)
+    
+    corrected = output.read_bytes().decode('cp949')
+    assert detect_encoding(source.read_bytes()) == 'cp949'
+    assert TAG.findall(corrected) == TAG.findall(text)
+    assert '<TITLE ATOC="Y">제1조 (목적)</TITLE>' in corrected
+    assert '<TU>투자신탁 은</TU>' in corrected
+    assert '<SPAN USERMARK="B">법령</SPAN>' in corrected
+    assert result.changed == 4
+
+
+def test_pending_markup_is_bounded():
+    recorder = RecordingCorrector()
+    consumed = []
+    
+    def rows():
+        yield '<P>법 령</P>'
+        for i in range(10000):
+            consumed.append(i)
+            yield f'<TR><TD>{i:,}</TD><TD>{i * 7:,}</TD></TR>\n'
+    
+    output = correct_markup(rows(), recorder, max_pending=4096)
+    
+    assert next(output) == '<P>' and recorder.calls == []
+    assert next(output) == '법령'
+    assert recorder.calls == [['법 령']]
+    assert len(consumed) < 200
+    assert ''.join(output).count('<TR>') == 10000
+
+
+def test_unchanged_gaps_keep_original_separators():
+    recorder = RecordingCorrector()
+    document = '<TD>투자&nbsp;신탁\n은  위험</TD><P>법 령\n및  규정</P>'
+    
+    def correct_batch(units):
+        recorder.calls.append(list(units))
+        return [['투자신탁', '은', '위', '험'] if isinstance(unit, list) else '법령 및  규정' for unit in units]
+    
+    output = ''.join(correct_markup([document], correct_batch))
+    
+    assert recorder.calls == [[['투자', '신탁', '은', '위험'], '법 령\n및  규정']]
+    assert output == '<TD>투자신탁\n은  위 험</TD><P>법령\n및  규정</P>'
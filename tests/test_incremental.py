@@ -0,0 +1,99 @@
+"""
+증분 교정 테스트
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from core.incremental import IncrementalCorrector, split_segments
+from core.spacing_corrector import SpacingCorrector
+
+
+SENTENCES = [f'제 {i} 조 에 따라 법 령 을 적용한다.' for i in range(1, 11)]
+
+
+class RecordingCorrector:
+    """교정 요청 문장을 기록하는 대역 (공백 제거만 수행)"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, texts):
+        self.calls.append(list(texts))
+        return [''.join(text.split()) for text in texts]
+
+
+def test_split_segments_round_trip():
+    text = '\n첫 문장. 둘째 문장!  셋째\n\n 넷째 3.5 % 문장 '
+    pieces = split_segments(text)
+    
+    assert ''.join(source + separator for source, separator in pieces) == text
+    assert [source for source, _ in pieces] == ['', '첫 문장.', '둘째 문장!', '셋째', '넷째 3.5 % 문장 ']
+
+
+def test_only_changed_segment_and_neighbours_rerun():
+    recorder = RecordingCorrector()
+    documents = IncrementalCorrector(recorder)
+    documents.update('doc', ' '.join(SENTENCES))
+    
+    edited = list(SENTENCES)
+    edited[4] = '제 5 조 는 삭제 한다.'
+    result = documents.update('doc', ' '.join(edited))
+    
+    assert recorder.calls[-1] == [SENTENCES[3], edited[4], SENTENCES[5]]
+    assert result.corrected_segments == 3
+    assert result.total_segments == 10
+    assert result.output == IncrementalCorrector(RecordingCorrector()).update('new', ' '.join(edited)).output
+    
+    start, end = result.affected[0]
+    assert len(result.affected) == 1
+    assert result.output[start:end] == '제4조에따라법령을적용한다. 제5조는삭제한다. 제6조에따라법령을적용한다.'
+
+
+def test_deletion_and_unchanged_revision():
+    recorder = RecordingCorrector()
+    documents = IncrementalCorrector(recorder)
+    documents.update('doc', ' '.join(SENTENCES))
+    
+    result = documents.update('doc', ' '.join(SENTENCES[:3] + SENTENCES[4:]))
+    assert recorder.calls[-1] == [SENTENCES[2], SENTENCES[4]]
+    assert result.output.count('적용한다.') == 9
+    
+    calls = len(recorder.calls)
+    result = documents.update('doc', ' '.join(SENTENCES[:3] + SENTENCES[4:]))
+    assert len(recorder.calls) == calls
+    assert result.affected == [] and result.corrected_segments == 0
+
+
+def test_version_change_and_eviction():
+    recorder = RecordingCorrector()
+    documents = IncrementalCorrector(recorder, max_documents=2)
+    text = '\n'.join(SENTENCES[:3])
+    
+    documents.update('a', text, version='v1')
+    assert documents.update('a', text, version='v2').corrected_segments == 3
+    assert documents.update('a', text, version='v2').output == '\n'.join(''.join(s.split()) for s in SENTENCES[:3])
+    
+    documents.update('b', text)
+    documents.update('c', text)
+    assert 'a' not in documents and len(documents) == 2
+    
+    with pytest.raises(ValueError):
+        IncrementalCorrector(recorder, max_documents=0)
+
+
+def test_spacing_corrector_incremental():
+    corrector = SpacingCorrector(use_pykospacing=False)
+    text = '제 1 조 에 따라 시행한다.\n법 령 및 규정이 변경되는 경우'
+    
+    first = corrector.correct_incremental('doc', text)
+    assert first.output == '\n'.join(corrector.correct(line) for line in text.split('\n'))
+    
+    second = corrector.correct_incremental('doc', text + ' 투자 신탁 은 위험하다.')
+    assert second.output.startswith(first.output)
+    assert second.corrected_segments == 2
+    
+    corrector.forget_document('doc')
+    assert 'doc' not in corrector.documents
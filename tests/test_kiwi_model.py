@@ -0,0 +1,38 @@
+"""
+Kiwi 띄어쓰기 백엔드 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip('kiwipiepy')
+
+from core.spacing_corrector import SpacingCorrector
+from models.ensemble import EnsembleModel
+from models.kiwi_model import KiwiSpacingModel
+
+
+def test_batch_matches_single():
+    model = KiwiSpacingModel(num_workers=2)
+    texts = ['법령및규정이변경되는경우', '투자 신탁은 고위험자산에 투자합니다', '']
+    
+    assert model.is_available()
+    results = model.correct_batch(texts)
+    
+    assert results == [model.correct(text) for text in texts]
+    assert ''.join(results[0].split()) == '법령및규정이변경되는경우'
+    assert results[0].count(' ') > 0
+
+
+def test_selectable_as_ensemble_backend():
+    ensemble = EnsembleModel(use_pykospacing=False, use_kiwi=True)
+    assert ensemble.warmup() == ['kiwi']
+    
+    corrector = SpacingCorrector(use_pykospacing=False, use_kiwi=True)
+    result = corrector.correct('법령및규정이변경되는경우')
+    
+    assert corrector.get_info()['models'] == ['kiwi']
+    assert ''.join(result.split()) == '법령및규정이변경되는경우'
@@ -0,0 +1,77 @@
+"""
+평가 지표 테스트
+"""
+import io
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from utils.metrics import (
+    MetricsAccumulator,
+    _batch_char_metrics,
+    _calculate_char_metrics,
+    calculate_metrics,
+    evaluate_jsonl,
+    make_categorizer,
+)
+
+
+def test_char_metrics_with_repeated_characters():
+    """반복 문자가 있어도 각 경계 위치를 정확히 비교"""
+    assert _calculate_char_metrics('가가 가가', '가가 가가') == (1, 0, 0)
+    assert _calculate_char_metrics('가 가가가', '가가 가가') == (0, 1, 1)
+    assert _calculate_char_metrics('가 가 가 가', '가가 가가') == (1, 2, 0)
+    assert _calculate_char_metrics('가나', '다라 마') == (0, 0, 1)
+
+
+def test_streaming_matches_batch():
+    pairs = [
+        ('제 1조 에 따라', '제1조에 따라'),
+        ('투자신탁 은 2,000 원', '투자신탁은 2,000원'),
+        ('변경 없음', '변경 없음'),
+    ]
+    stream = io.StringIO('\n'.join(
+        json.dumps({'prediction': p, 'reference': r}, ensure_ascii=False) for p, r in pairs
+    ))
+    
+    accumulator = evaluate_jsonl(stream)
+    
+    assert accumulator.count == 3
+    assert accumulator.result() == calculate_metrics([p for p, _ in pairs], [r for _, r in pairs])
+
+
+def test_category_breakdown():
+    accumulator = MetricsAccumulator(make_categorizer({'투자신탁'}))
+    accumulator.add('제 1조 에 따라', '제1조에 따라')
+    accumulator.add('투자신탁은 2,000원', '투자신탁은 2,000원')
+    accumulator.add('변경 없음', '변경 없음')
+    accumulator.add('a b', 'ab', categories=['manual'])
+    
+    assert accumulator.category_counts() == {'compound': 1, 'legal': 1, 'manual': 1, 'number': 2}
+    assert accumulator.result('legal').accuracy == 0.0
+    assert accumulator.result('compound').accuracy == 1.0
+    assert accumulator.result('number').accuracy == 0.5
+    assert accumulator.result('missing').accuracy == 0.0
+
+
+def test_categorizer_matches_term_with_particle():
+    categorize = make_categorizer({'투자신탁', '집합투자기구'})
+    
+    assert categorize('투자신탁은 위험하다') == ['compound']
+    assert categorize('이 집합투자기구의 수익') == ['compound']
+    assert categorize('투자 신탁은') == []
+    assert categorize('신탁투자') == []
+
+
+def test_batch_char_metrics_match_single_pairs():
+    pairs = [('가가 가가', '가가 가가'), ('', ''), ('가 가 가 가', '가가 가가'), ('가나', '다라 마'), ('가', '가')]
+    
+    assert [tuple(row) for row in _batch_char_metrics(pairs).tolist()] == [
+        _calculate_char_metrics(pred, ref) for pred, ref in pairs
+    ]
+
+
+def test_categorizer_recognizes_part_references():
+    assert make_categorizer()('제 2 편 총칙') == ['number', 'legal']
@@ -0,0 +1,40 @@
+"""
+프로세스 풀 병렬 교정 테스트
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector
+
+
+def test_parallel_batch_matches_serial():
+    """워커 수, 청크 크기와 무관하게 입력 순서대로 동일한 결과"""
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        inputs = [ex['input'] for ex in json.load(f)] * 5
+    
+    corrector = SpacingCorrector(use_pykospacing=True, use_kospacing=False, use_validator=False)
+    expected = corrector.batch_correct(inputs)
+    
+    assert corrector.batch_correct(inputs, workers=2, chunk_size=4) == expected
+    assert list(corrector.iter_batch_correct(iter(inputs), workers=3, chunk_size=7)) == expected
+
+
+def test_process_pool_uses_cache_and_profiler(tmp_path):
+    """워커도 같은 SQLite 캐시를 쓰고 프로파일 통계는 부모에 합산"""
+    from utils.result_cache import ResultCache
+    
+    inputs = ['법 령 및 규정이 변경되는 경우', '제 1 조 에 따라', '투자 신탁 은 위험하다'] * 4
+    db_path = tmp_path / 'cache.db'
+    corrector = SpacingCorrector(use_pykospacing=False, cache=ResultCache(db_path=str(db_path)), profile=True)
+    
+    results = corrector.batch_correct(inputs, workers=2, chunk_size=3)
+    
+    assert results == SpacingCorrector(use_pykospacing=False).batch_correct(inputs)
+    assert corrector.get_stats()['stage']['model_batch']['calls'] == 4
+    
+    fresh = ResultCache(db_path=str(db_path))
+    assert fresh.get(corrector._cache_key(inputs[0])) == results[0]
@@ -0,0 +1,44 @@
+"""
+보호 패턴 추출/복원 테스트
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.preprocessor import Preprocessor
+
+
+def test_round_trip_with_many_patterns():
+    """보호 패턴이 많아도 원문 그대로 복원"""
+    preprocessor = Preprocessor()
+    text = ' '.join(
+        f'https://dart.fss.or.kr/{i} 문의 ir{i}@lucy.co.kr 및 KRX 공시'
+        for i in range(200)
+    )
+    
+    result = preprocessor.preprocess(text)
+    
+    assert 'https://' not in result.text and '@' not in result.text and 'KRX' not in result.text
+    assert len(result.placeholders) == 600
+    assert Preprocessor.restore_protected_patterns(result.text, result.placeholders) == text
+
+
+def test_placeholders_do_not_corrupt_each_other():
+    """앞서 만든 플레이스홀더 안의 문자열이 다시 치환되지 않음"""
+    preprocessor = Preprocessor()
+    text = 'ABBREV 와 URL 그리고 http://example.com/ABBREV'
+    
+    result = preprocessor.preprocess(text)
+    
+    assert Preprocessor.restore_protected_patterns(result.text, result.placeholders) == text
+
+
+def test_placeholder_ids_are_scoped_per_call():
+    """플레이스홀더 번호는 호출마다 0 부터 시작"""
+    preprocessor = Preprocessor()
+    
+    first = preprocessor.preprocess('IFRS 기준')
+    second = preprocessor.preprocess('IFRS 기준')
+    
+    assert first.placeholders == second.placeholders == {'__ABBREV_0__': 'IFRS'}
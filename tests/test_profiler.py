@@ -0,0 +1,67 @@
+"""
+단계/규칙 프로파일링 테스트
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector
+
+
+def test_profiling_disabled_by_default():
+    corrector = SpacingCorrector()
+    corrector.correct("제 1 조")
+    
+    assert corrector.get_stats() == {}
+    assert corrector.export_metrics() == ''
+    assert corrector.get_info()['profiling_enabled'] is False
+
+
+def test_profiling_records_stages_and_rules():
+    plain = SpacingCorrector()
+    corrector = SpacingCorrector(profile=True)
+    inputs = ["제 1 조 에 따라 2 , 000 원", ["투자", "신탁", "은"]]
+    
+    for input_data in inputs:
+        assert corrector.correct(input_data) == plain.correct(input_data)
+    
+    stats = corrector.get_stats()
+    assert stats['stage']['preprocess']['calls'] == 2
+    assert stats['stage']['tokens']['calls'] == 1
+    assert stats['stage']['number']['changed'] == 1
+    assert stats['rule']['number.thousands']['changed'] == 1
+    assert stats['rule']['legal.ordinal']['changed'] == 1
+    assert stats['rule']['number.digit_join']['changed'] == 0
+    # '~' 가 없는 입력에서는 범위 규칙을 실행하지 않음
+    assert 'number.range' not in stats['rule']
+    assert corrector.get_info()['rules']['number.range'] == {'runs': 0, 'skips': 2}
+    assert all(entry['seconds'] >= 0 for entry in stats['rule'].values())
+    
+    corrector.reset_stats()
+    stats = corrector.get_stats()
+    assert stats['stage'] == {} and stats['rule'] == {}
+    assert corrector.get_info()['rules']['number.range'] == {'runs': 0, 'skips': 0}
+    assert stats['entry'] and all(entry['calls'] == 0 for entry in stats['entry'].values())
+
+
+def test_fused_rules_count_source_entries():
+    corrector = SpacingCorrector(profile=True)
+    corrector.correct("법 령 및 규정이 변경되는 경우 투자 신탁 은")
+    
+    entries = corrector.get_stats()['entry']
+    assert entries['legal.법령']['calls'] == 1
+    assert entries['legal.법령']['changed'] == 1
+    assert entries['legal.단서']['calls'] == 0
+    assert 'legal.joins' not in entries
+
+
+def test_prometheus_export():
+    corrector = SpacingCorrector(profile=True)
+    corrector.correct("제 1 조")
+    
+    text = corrector.export_metrics()
+    
+    assert '# TYPE spacing_rule_changed_total counter' in text
+    assert 'spacing_stage_calls_total{stage="model"} 1' in text
+    assert 'spacing_rule_changed_total{rule="legal.ordinal"} 1' in text
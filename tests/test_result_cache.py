@@ -0,0 +1,95 @@
+"""
+교정 결과 캐시 테스트
+"""
+import json
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector
+from utils.result_cache import ResultCache
+
+
+DICT_DIR = Path(__file__).parent.parent / "data" / "dictionaries"
+
+
+def load_inputs():
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        return [ex['input'] for ex in json.load(f)]
+
+
+def test_lru_eviction_and_counters():
+    cache = ResultCache(max_entries=2)
+    cache.put('a', '1')
+    cache.put('b', ['2'])
+    assert cache.get('a') == '1'
+    cache.put('c', '3')
+    
+    assert cache.get('b') is None
+    assert cache.get('c') == '3'
+    assert cache.stats() == {'entries': 2, 'hits': 2, 'disk_hits': 0, 'misses': 1, 'evictions': 1}
+
+
+def test_persistent_tier_shared_between_instances(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    first = ResultCache(db_path=str(db_path))
+    first.put('key', ['투자신탁', '은'])
+    first.close()
+    
+    second = ResultCache(db_path=str(db_path))
+    assert second.get('key') == ['투자신탁', '은']
+    assert second.get('key') == ['투자신탁', '은']
+    assert (second.disk_hits, second.hits) == (1, 1)
+    second.close()
+
+
+def test_corrector_results_are_cached():
+    cache = ResultCache()
+    corrector = SpacingCorrector(use_pykospacing=True, use_kospacing=False, cache=cache)
+    uncached = SpacingCorrector(use_pykospacing=True, use_kospacing=False)
+    inputs = load_inputs()
+    
+    expected = [uncached.correct(x) for x in inputs]
+    assert [corrector.correct(x) for x in inputs] == expected
+    assert corrector.batch_correct(inputs) == expected
+    assert cache.hits == len(inputs)
+    assert corrector.get_info()['cache']['misses'] == len(inputs)
+
+
+def test_dictionary_change_invalidates(tmp_path):
+    dict_dir = tmp_path / "dictionaries"
+    shutil.copytree(DICT_DIR, dict_dir)
+    corrector = SpacingCorrector(use_pykospacing=True, use_kospacing=False,
+                                 dict_dir=str(dict_dir), cache=ResultCache())
+    
+    corrector.correct("투자 신탁")
+    version = corrector.cache_version()
+    with open(dict_dir / "financial_terms.txt", 'a', encoding='utf-8') as f:
+        f.write("\n신규용어\n")
+    corrector.dict_loader.load_all()
+    
+    assert corrector.cache_version() != version
+    corrector.correct("투자 신탁")
+    assert corrector.cache.misses == 2
+
+
+def test_cache_version_is_computed_once_per_snapshot():
+    corrector = SpacingCorrector(use_pykospacing=False, cache=ResultCache())
+    calls = []
+    signatures = corrector.model.get_model_signatures
+    corrector.model.get_model_signatures = lambda: calls.append(1) or signatures()
+    
+    corrector.batch_correct(["투자 신탁", "법 령"])
+    corrector.correct("제 1 조")
+    assert len(calls) == 1
+    
+    corrector.dict_loader.load_all()
+    corrector.correct("제 1 조")
+    assert len(calls) == 1
+    
+    corrector.model.models.append(('stub', object()))
+    corrector.cache_version()
+    assert len(calls) == 2
@@ -0,0 +1,98 @@
+"""
+규칙 엔진 동등성 테스트
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from rules.number_rules import NumberRules
+from rules.legal_rules import LegalRules
+from rules.compound_rules import CompoundRules
+from rules.pattern_rules import PatternRules
+from rules.rule_engine import RuleEngine, present_chars
+from utils.profiler import Profiler
+
+
+ALPHABET = list('0123456789제조항호편장절원좌주%,.~-()[]･:;"\'가나다라마 ') + [
+    '  ', '\t', '것으로', '서', '관', '련한', '비', '용', '법', '령', '투자', '신탁', '계약',
+    '집합', '기구', '순', '자산', '의하', '여', '따', '라', '(연평잔액보수',
+]
+
+
+def random_texts(n: int, seed: int = 0):
+    rng = random.Random(seed)
+    return [''.join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30))) for _ in range(n)]
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return RuleEngine()
+
+
+@pytest.mark.parametrize("stage, reference", [
+    ('number', NumberRules.apply_all),
+    ('legal', LegalRules.apply_all),
+    ('split', CompoundRules().fix_split_words),
+    ('financial', CompoundRules().fix_financial_terms),
+    ('pattern', PatternRules.apply_all),
+    ('fine_tune', PatternRules.fine_tune),
+])
+def test_stage_matches_sequential_rules(engine, stage, reference):
+    """융합 스캔 결과가 순차 적용 결과와 동일"""
+    for text in random_texts(3000):
+        assert engine.apply(stage, text) == reference(text), repr(text)
+
+
+def test_fewer_scans_than_rules(engine):
+    """융합 스캔 수가 원래 규칙 수보다 적음"""
+    original = (7 + len(NumberRules.UNITS) + len(LegalRules.ORDINAL_SUFFIXES)
+                + len(LegalRules.LEGAL_PAIRS) + len(LegalRules.LEGAL_PARTICLES)
+                + len(CompoundRules.COMMON_SPLITS) + len(CompoundRules.SUFFIXED_SPLITS)
+                + len(CompoundRules.FINANCIAL_PATTERNS) + 16 + 1 + len(PatternRules.FINE_TUNE_JOINS))
+    assert engine.rule_count() < original / 4
+
+
+def test_rules_without_trigger_characters_are_skipped():
+    engine = RuleEngine()
+    engine.profiler = Profiler()
+    prose = '이사회 의 결을 거쳐 변경 한다'
+    
+    for stage in RuleEngine.STAGES:
+        engine.apply(stage, prose)
+    stats = engine.stats()
+    
+    assert set(stats) == {rule.name for rules in engine.stages.values() for rule in rules}
+    assert all(stats[rule.name] == {'runs': 0, 'skips': 1} for rule in engine.stages['number'])
+    assert stats['legal.ordinal'] == {'runs': 0, 'skips': 1}
+    assert stats['pattern.paren_shift'] == {'runs': 0, 'skips': 1}
+    assert stats['pattern.normalize'] == {'runs': 1, 'skips': 0}
+    
+    assert engine.apply('number', '2 , 000') == '2,000'
+    assert engine.stats()['number.thousands'] == {'runs': 1, 'skips': 1}
+    assert engine.stats()['number.range'] == {'runs': 0, 'skips': 2}
+    
+    engine.reset_stats()
+    assert all(counts == {'runs': 0, 'skips': 0} for counts in engine.stats().values())
+
+
+def test_present_chars_passed_down_matches_per_stage_scan(engine):
+    """처음 입력의 문자 집합을 모든 단계에 넘겨도 단계마다 구한 결과와 같음"""
+    text = '제 1 조 ( 목적 ) 투 자 신탁 의 수익 증권 2 , 000 원 ~ 3 . 5 %'
+    present = present_chars(text)
+    shared, scanned = text, text
+    for stage in RuleEngine.STAGES:
+        shared = engine.apply(stage, shared, present)
+        scanned = engine.apply(stage, scanned)
+    assert shared == scanned
+    assert all(counts == {'runs': 0, 'skips': 0} for counts in engine.stats().values())
+
+
+def test_prefilter_handles_unicode_digits_and_spaces(engine):
+    """re 의 \\d / \\s 와 같은 문자 판정 (전각 숫자, 전각 공백)"""
+    for text in ['１ ２', '제 １ 조', '가\u3000,나', '２\u00a0%']:
+        for stage, reference in [('number', NumberRules.apply_all), ('legal', LegalRules.apply_all),
+                                 ('pattern', PatternRules.apply_all)]:
+            assert engine.apply(stage, text) == reference(text), repr(text)
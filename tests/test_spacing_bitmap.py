@@ -0,0 +1,107 @@
+"""
+경계 비트맵 및 편집 구간 테스트
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from core.spacing_corrector import SpacingCorrector
+from utils.spacing_bitmap import SpaceEdit, SpacingBitmap, align_tokens, apply_spans, diff_spans, merge_sources
+
+
+def test_bitmap_round_trip():
+    """from_text -> to_text 는 공백 정규화와 같음"""
+    for text in ['', '   ', '가', '제 1 조', '  금융  위원회\t의결 ', 'a b c d']:
+        bitmap = SpacingBitmap.from_text(text)
+        assert bitmap.to_text() == ' '.join(text.split())
+        assert len(bitmap.spaces) == max(len(bitmap.chars) - 1, 0)
+
+
+def test_diff_spans_reproduces_target():
+    """편집 구간을 입력에 적용하면 교정 결과와 같음 (무작위 공백 배치)"""
+    rng = random.Random(7)
+    for _ in range(300):
+        chars = ''.join(rng.choice('가나다라1,.') for _ in range(rng.randint(0, 12)))
+        source = ''.join(ch + rng.choice(['', '', ' ', '  ', '\t']) for ch in chars)
+        source = rng.choice(['', ' ']) + source
+        
+        target = SpacingBitmap(chars)
+        target.spaces[:] = [rng.random() < 0.3 for _ in range(len(target.spaces))]
+        
+        edits = diff_spans(source, target)
+        assert apply_spans(source, edits) == target.to_text()
+        assert all(a.end <= b.start for a, b in zip(edits, edits[1:]))
+
+
+def test_diff_spans_reports_only_changes():
+    edits = diff_spans('금융 위원회의 결정', SpacingBitmap.from_text('금융위원회의 결정'))
+    assert edits == [SpaceEdit(2, 3, '')]
+    assert edits[0].kind == 'delete'
+    
+    edits = diff_spans('제1조', SpacingBitmap.from_text('제 1조'))
+    assert [edit.to_dict() for edit in edits] == [{'start': 1, 'end': 1, 'replacement': ' '}]
+
+
+def test_diff_spans_localizes_character_changes():
+    """공백 아닌 문자가 바뀌어도 전체 교체가 아닌 바뀐 구간만 반환"""
+    text = '금융 위원회 의결  제１조'
+    target = SpacingBitmap.from_text('금융위원회 의결 제1조')
+    
+    edits = diff_spans(text, target)
+    assert apply_spans(text, edits) == target.to_text()
+    assert all(edit.end - edit.start <= 2 for edit in edits)
+    assert all(len(edit.replacement) <= 1 for edit in edits)
+
+
+def test_correct_spans_matches_correct():
+    corrector = SpacingCorrector()
+    texts = ['이사회 의   결을  거쳐', '  제 1 조 ( 목적 )', '변경 없음']
+    
+    for text, edits in zip(texts, corrector.batch_correct_spans(texts)):
+        assert apply_spans(text, edits) == corrector.correct(text)
+        assert apply_spans(text, corrector.correct_spans(text)) == corrector.correct(text)
+
+
+def test_align_tokens_tracks_merges_and_splits():
+    assert align_tokens(['투자', '신탁', '은'], ['투자신탁', '은']) == [[0, 1], [2]]
+    assert align_tokens(['제1조에', '따라'], ['제1조', '에', '따라']) == [[0], [0], [1]]
+    assert align_tokens(['투', '', '자신', '탁'], ['투자', '신탁']) == [[0, 2], [2, 3]]
+    assert align_tokens([], []) == []
+
+
+def test_align_tokens_clips_extra_characters():
+    """출력 문자가 더 많으면 마지막 입력 토큰에 대응"""
+    assert align_tokens(['가나', '다'], ['가나다라']) == [[0, 1]]
+    assert align_tokens(['가'], ['가', '나']) == [[0], [0]]
+
+
+def test_merge_sources_follows_concatenation():
+    assert merge_sources(['2', ',', '000', '원'], ['2,000원'], [[0], [1], [2], [3]]) == [[0, 1, 2, 3]]
+    assert merge_sources(['투자', ' ', '신탁', ''], ['투자', '신탁'], [[0], [], [1, 2], []]) == [[0], [1, 2]]
+    with pytest.raises(ValueError):
+        merge_sources(['투자', '신탁'], ['투자신탁은'], [[0], [1]])
+    with pytest.raises(ValueError):
+        merge_sources(['투자', '신탁'], ['신탁'], [[0], [1]])
+
+
+def test_correct_tokens_matches_correct():
+    corrector = SpacingCorrector(use_pykospacing=False)
+    inputs = [
+        ['투자', '신탁', '은'],
+        ['제', '1', '조', '(', '목적', ')'],
+        ['https://example.com', '참고'],
+        ['2', ',', '000', '원을', '지급한다', '.'],
+    ]
+    
+    results = corrector.batch_correct_tokens(inputs)
+    
+    for tokens, result in zip(inputs, results):
+        assert result.tokens == corrector.correct(tokens)
+        assert len(result.sources) == len(result.tokens)
+        assert sorted({i for sources in result.sources for i in sources}) == list(range(len(tokens)))
+    assert results[0].sources[0] == [0, 1]
+    assert corrector.correct_tokens(inputs[0]).tokens == results[0].tokens
@@ -0,0 +1,36 @@
+"""
+지연 모델 로드 및 공유 인스턴스 테스트
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import (
+    SpacingCorrector, clear_shared_correctors, correct_spacing, get_shared_corrector
+)
+from models.pykospacing_model import PyKoSpacingModel
+
+
+def test_model_is_not_loaded_until_used():
+    model = PyKoSpacingModel()
+    assert not model._loaded
+    model.correct("법 령")
+    assert model._loaded
+
+
+def test_shared_corrector_is_reused():
+    clear_shared_correctors()
+    first = get_shared_corrector()
+    assert get_shared_corrector(use_pykospacing=True) is first
+    assert get_shared_corrector(use_kospacing=True) is not first
+    
+    assert correct_spacing("법 령 및 규정") == "법령 및 규정"
+    assert get_shared_corrector() is first
+    clear_shared_correctors()
+
+
+def test_warmup_reports_loaded_models():
+    corrector = SpacingCorrector()
+    loaded = corrector.warmup()
+    assert set(loaded) <= set(corrector.get_info()['models'])
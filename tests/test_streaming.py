@@ -0,0 +1,61 @@
+"""
+스트리밍 교정 테스트
+"""
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+from core.spacing_corrector import SpacingCorrector
+
+
+@pytest.fixture(scope="module")
+def corrector():
+    return SpacingCorrector(use_pykospacing=True, use_kospacing=False, use_validator=False)
+
+
+@pytest.fixture(scope="module")
+def sentences():
+    data_path = Path(__file__).parent.parent / "data" / "examples" / "provided_examples.json"
+    with open(data_path, 'r', encoding='utf-8') as f:
+        examples = json.load(f)
+    return [' '.join(ex['input']) if isinstance(ex['input'], list) else ex['input'] for ex in examples]
+
+
+def random_chunks(text, seed):
+    rng = random.Random(seed)
+    chunks, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 200)
+        chunks.append(text[i:i + size])
+        i += size
+    return chunks
+
+
+@pytest.mark.parametrize("window_size, overlap", [(60, 20), (300, 64), (1000, 64)])
+def test_stream_matches_whole_document(corrector, sentences, window_size, overlap):
+    """윈도 경계와 무관하게 전체 교정 결과와 동일"""
+    document = ' '.join(sentences * 20)
+    chunks = random_chunks(document, window_size)
+    result = ''.join(corrector.correct_stream(chunks, window_size=window_size, overlap=overlap))
+    assert result == corrector.correct(document)
+
+
+def test_stream_preserves_lines(corrector, sentences):
+    """줄바꿈은 그대로 유지하고 줄 단위로 교정"""
+    document = '\n'.join(sentences) + '\n\n'
+    result = ''.join(corrector.correct_stream(random_chunks(document, 0)))
+    assert result == '\n'.join(corrector.correct(line) for line in document.split('\n'))
+
+
+def test_stream_is_lazy(corrector):
+    """입력 전체를 읽기 전에 결과를 내보냄"""
+    def endless():
+        while True:
+            yield '이 투자신탁은 추가 자금납입이 가능한 투 자신탁으로 '
+    
+    stream = corrector.correct_stream(endless(), window_size=200, overlap=32)
+    assert '투자신탁으로' in next(stream)
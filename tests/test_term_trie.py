@@ -0,0 +1,67 @@
+"""
+합성명사 트라이 매칭 테스트
+"""
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from rules.compound_rules import CompoundRules
+from utils.term_trie import TermTrie
+
+
+def ngram_merge(tokens, terms, max_len=None):
+    """기존 n-gram 결합 방식 (비교 기준, 길이 제한 없음)"""
+    max_len = max_len or len(tokens)
+    result = []
+    i = 0
+    while i < len(tokens):
+        best_match, best_len = tokens[i], 1
+        for length in range(min(max_len, len(tokens) - i), 1, -1):
+            candidate = ''.join(tokens[i:i+length])
+            if candidate in terms:
+                best_match, best_len = candidate, length
+                break
+        result.append(best_match)
+        i += best_len
+    return result
+
+
+def test_trie_membership():
+    trie = TermTrie(['투자신탁', '투자', '투자신탁'])
+    assert len(trie) == 2
+    assert '투자신탁' in trie and '투자' in trie
+    assert '투자신' not in trie and '' not in trie
+
+
+def test_matches_ngram_join():
+    """사전 전체에 대해 기존 n-gram 결합과 동일한 최장 일치"""
+    rules = CompoundRules()
+    terms = sorted(rules.all_terms)
+    rng = random.Random(0)
+    
+    for _ in range(2000):
+        tokens = []
+        for term in rng.sample(terms, rng.randint(1, 6)) + ['의', '및', '관리']:
+            cuts = sorted(rng.sample(range(1, len(term)), min(len(term) - 1, rng.randint(0, 3))))
+            tokens += [term[a:b] for a, b in zip([0] + cuts, cuts + [len(term)])]
+        if rng.random() < 0.3:
+            rng.shuffle(tokens)
+        assert rules.apply_to_tokens(tokens) == ngram_merge(tokens, rules.all_terms)
+
+
+def test_no_token_limit():
+    """5개 토큰보다 긴 합성명사도 병합"""
+    trie = TermTrie(['상장지수집합투자기구'])
+    tokens = ['상', '장', '지수', '집합', '투자', '기', '구', '의']
+    assert trie.longest_token_match(tokens, 0) == 7
+    assert trie.longest_token_match(tokens, 1) == 0
+
+
+def test_starts_with_term():
+    trie = TermTrie(['투자신탁', '수익증권'])
+    assert trie.starts_with_term('투자신탁')
+    assert trie.starts_with_term('투자신탁은')
+    assert not trie.starts_with_term('투자')
+    assert not trie.starts_with_term('신투자신탁')
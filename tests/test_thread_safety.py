@@ -0,0 +1,66 @@
+"""
+스레드 동시 실행 스트레스 테스트
+"""
+import random
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector
+from utils.result_cache import ResultCache
+
+SENTENCES = [
+    "법 령 및 규정이 변경되는 경우",
+    "제 1 조 에 따라 2 , 000 원을 지급 한다",
+    "고위험 자산에 8 0% 이상 투자 하는 집합 투자 기구",
+    "자세한 사항은 https://dart.fss.or.kr 또는 ir@lucy.co.kr 로 문의 (KRX 공시)",
+    "수익자가 당해 환매 청구 접수의 취소를 하지 아니하였을 경우",
+]
+
+
+def make_inputs(count, seed=0):
+    rng = random.Random(seed)
+    inputs = []
+    for _ in range(count):
+        words = ' '.join(rng.sample(SENTENCES, 2)).split()
+        inputs.append(words if rng.random() < 0.5 else ' '.join(words))
+    return inputs
+
+
+def test_concurrent_correct_matches_serial():
+    inputs = make_inputs(400)
+    expected = [SpacingCorrector().correct(input_data) for input_data in inputs]
+    
+    shared = SpacingCorrector(cache=ResultCache(max_entries=50), profile=True)
+    results = [None] * len(inputs)
+    errors = []
+    barrier = threading.Barrier(8)
+    
+    def worker(offset):
+        barrier.wait()
+        try:
+            for i in range(offset, len(inputs), 8):
+                results[i] = shared.correct(inputs[i])
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors
+    assert results == expected
+    assert shared.get_stats()['stage']['preprocess']['calls'] + shared.cache.hits == len(inputs)
+
+
+def test_thread_pool_batch_correct_matches_serial():
+    inputs = make_inputs(300, seed=1)
+    corrector = SpacingCorrector()
+    
+    expected = corrector.batch_correct(inputs)
+    
+    assert corrector.batch_correct(inputs, workers=4, chunk_size=16, pool='thread') == expected
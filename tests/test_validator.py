@@ -0,0 +1,109 @@
+"""
+배치 검증 테스트
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.spacing_corrector import SpacingCorrector
+from core.validator import Validator, changed_windows
+
+
+class Token:
+    def __init__(self, tag):
+        self.tag = tag
+
+
+class RecordingKiwi:
+    """analyze 호출을 기록하고 'ㅋ' 가 들어간 구간은 미등록어로 분석하는 테스트용 분석기"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def analyze(self, texts):
+        self.calls.append(list(texts))
+        for text in texts:
+            yield [([Token('UN' if 'ㅋ' in word else 'NNG') for word in text.split()], 0.0)]
+
+
+def make_validator(window=4):
+    validator = Validator(window=window)
+    validator.use_kiwi = True
+    validator._kiwi = RecordingKiwi()
+    return validator
+
+
+def test_changed_windows():
+    source = '가나다라마바사아자차카타파하 가나다라마바사아자차카타파하 거너더러'
+    text = '가나다라마바사아자차카타파하 가나다라마바사아자차카타파하 거너 더러'
+    
+    assert changed_windows(source, text, window=2) == [(30, len(text))]
+    assert changed_windows(source, source, window=2) == []
+    assert changed_windows(None, text) == [(0, len(text))]
+
+
+def test_batch_analyzes_only_changed_windows_in_one_call():
+    validator = make_validator(window=2)
+    sources = ['투자 신탁 의 규모 및 유동성', '변경 없음', '보수 ㅋㅋ 비용 총액 및 기타비용']
+    texts = ['투자신탁의 규모 및 유동성', '변경 없음', '보수 ㅋㅋ 비용 총액 및기타비용']
+    
+    results = validator.validate_batch(texts, sources)
+    
+    assert len(validator._kiwi.calls) == 1
+    assert validator._kiwi.calls[0] == ['투자신탁의 규모', '총액 및기타비용']
+    assert [is_valid for is_valid, _ in results] == [True, True, True]
+    
+    results = validator.validate_batch(['보수 ㅋㅋ 비용'], [None])
+    assert results[0][0] is False and '미등록어' in results[0][1][0]
+
+
+def test_batch_correct_validated():
+    corrector = SpacingCorrector()
+    inputs = ['법 령 및 규정이 변경되는 경우', ['투자', '신탁', '은']]
+    
+    results = corrector.batch_correct_validated(inputs)
+    
+    assert [result for result, _, _ in results] == corrector.batch_correct(inputs)
+    assert all(is_valid and not warnings_list for _, is_valid, warnings_list in results)
+
+
+def test_kiwi_validation():
+    pytest.importorskip('kiwipiepy')
+    validator = Validator(use_kiwi=True, num_workers=2)
+    
+    results = validator.validate_batch(
+        ['법령 및 규정이 변경되는 경우', '법령 및 규정이 변경되는 경우'],
+        ['법 령 및 규정이 변경되는 경우', None]
+    )
+    
+    assert results == [(True, []), (True, [])]
+
+
+def test_rejected_window_is_reverted():
+    corrector = SpacingCorrector()
+    corrector.validator = make_validator()
+    inputs = ['법 령ㅋ 및 규정이 변경되는 경우', ['법', '령ㅋ', '및'], '법 령 및 규정이 변경되는 경우']
+    
+    results = corrector.batch_correct_validated(inputs)
+    
+    assert [result for result, _, _ in results] == [
+        '법 령ㅋ 및 규정이 변경되는 경우', ['법', '령ㅋ', '및'], '법령 및 규정이 변경되는 경우'
+    ]
+    assert results[0][1] is False and '되돌렸습니다' in results[0][2][-1]
+    assert results[2][1] is True
+    assert corrector.batch_correct_validated(inputs[:1], revert=False)[0][0] == '법령ㅋ 및 규정이 변경되는 경우'
+
+
+def test_batch_validator_is_built_once():
+    pytest.importorskip('kiwipiepy')
+    corrector = SpacingCorrector()
+    
+    corrector.batch_correct_validated(['법 령 및 규정'])
+    validator = corrector._quality_validator()
+    corrector.batch_correct_validated(['투자 신탁 은'])
+    
+    assert validator.use_kiwi and validator._kiwi is not None
+    assert corrector._quality_validator() is validator